@@ -10,26 +10,46 @@ Framework-dependent (.NET 8.0 Runtime 필요)
 설치 경로: C:\\Program Files\\NationalClock
 """
 
-import os
 import sys
-import subprocess
+import argparse
+import importlib
 import shutil
 from pathlib import Path
 from datetime import datetime
 import time
 
+from buildlib.artifacts import ARTIFACT_REGISTRY_NAME, ArtifactRegistry
+from buildlib.cache import hash_file, hash_sources
+from buildlib.checkpoint import CHECKPOINT_FILE_NAME, CheckpointStore
+from buildlib.compression import COMPRESSION_PROFILES, describe_profile
+from buildlib.console import setup_console
+from buildlib.context import BuildContext, resolve_workspace
+from buildlib.history import (HISTORY_FILE_NAME, SIZE_THRESHOLD, TIME_THRESHOLD, find_regressions, format_regressions,
+                              recent_builds, record_build)
+from buildlib.manifest import diff_manifests, format_manifest_diff, load_manifest
+from buildlib.pipeline import (STEP_WORKERS, PipelineRun, PipelineStep, StopPipeline, critical_path, run_pipeline,
+                               select_steps)
+from buildlib.store import KEEP_BUILDS, MAX_STORE_BYTES, ArtifactStore
+from buildlib.variants import (PUBLISH_VARIANTS, describe_variant, describe_variants, get_system_requirements,
+                               parse_variants, variant_context)
+from buildlib.toolchain import resolve_toolchain
+from buildlib.trace import TRACE_FILE_NAME, BuildTracer
+from buildlib.version import get_version_properties, load_version
+
 # 출력 인코딩 설정
-if sys.stdout.encoding != 'utf-8':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
+setup_console()
+
+# 빌드 단계 모듈 (같은 프로세스에서 직접 호출)
+update_stage = importlib.import_module("11_UpdateFromProject")
+installer_stage = importlib.import_module("12_BuildInstaller")
 
 # ==========================================
 # 설정 (필요시 수정)
 # ==========================================
 PRODUCT_NAME = "NationalClock"
-PRODUCT_VERSION = "1.0.001"
-BUILD_DATE = "20250912_1702"
+VERSION_INFO = load_version()  # 버전 / 빌드 일시는 version.json 에서 관리
+PRODUCT_VERSION = VERSION_INFO.product_version
+BUILD_DATE = VERSION_INFO.build_date
 PROJECT_FILE = "NationalClock.csproj"
 NSIS_SCRIPT = "NationalClock_Installer.nsi"
 
@@ -41,8 +61,9 @@ NSIS_PATHS = [
     r"D:\Program Files\NSIS\makensis.exe"
 ]
 
-def print_header():
+def print_header(ctx, variants):
     """헤더 출력"""
+    targets = ", ".join(" ".join(describe_variant(variant)) for variant in variants)
     print("=" * 80)
     print(">> NationalClock 전체 빌드 프로세스 <<")
     print("프로젝트 업데이트 → NSIS 설치파일 생성")
@@ -51,39 +72,45 @@ def print_header():
     print(f"제품명: {PRODUCT_NAME}")
     print(f"버전: {PRODUCT_VERSION}")
     print(f"빌드 일시: {BUILD_DATE}")
-    print(f"현재 디렉터리: {os.getcwd()}")
-    print(f"타겟: x64 Framework-dependent")
-    print(f"압축: LZMA 고압축")
+    print(f"작업 공간: {ctx.workspace}")
+    print(f"타겟: {targets}")
+    print(f"압축: {describe_profile(ctx.compression)}")
     print(f"설치 경로: C:\\Program Files\\{PRODUCT_NAME}")
     print()
 
-def check_prerequisites():
-    """사전 요구사항 확인"""
+def check_prerequisites(ctx):
+    """사전 요구사항 확인 (확인된 도구 정보는 ctx에 저장)"""
     print("🔍 사전 요구사항 확인 중...")
     print("=" * 40)
     
     errors = []
     
+    # 도구/파일 확인을 동시에 수행 (캐시가 유효하면 dotnet 실행 생략)
+    project_path = ctx.project_file
+    scripts = [ctx.script_dir / "11_UpdateFromProject.py", ctx.script_dir / "12_BuildInstaller.py"]
+    toolchain = resolve_toolchain(
+        nsis_paths=NSIS_PATHS,
+        required_files=[project_path, *scripts],
+        use_cache=ctx.use_cache
+    )
+    missing_files = set(toolchain.missing_files)
+    
     # 1. .NET SDK 확인
     print("1. .NET 8.0 SDK 확인 중...")
-    try:
-        result = subprocess.run(["dotnet", "--version"], capture_output=True, text=True, encoding='utf-8', errors='replace')
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            print(f"   ✓ .NET SDK 확인됨: {version}")
-            if not version.startswith("8."):
-                print(f"   ⚠ .NET 8.0이 아님: {version}")
-        else:
-            print("   ❌ .NET SDK를 찾을 수 없습니다.")
-            errors.append(".NET 8.0 SDK가 설치되어 있지 않습니다.")
-    except FileNotFoundError:
-        print("   ❌ dotnet 명령을 찾을 수 없습니다.")
+    if toolchain.dotnet_version:
+        version = toolchain.dotnet_version
+        ctx.dotnet_version = version
+        cache_note = " (캐시)" if "dotnet" in toolchain.cached_tools else ""
+        print(f"   ✓ .NET SDK 확인됨: {version}{cache_note}")
+        if not version.startswith("8."):
+            print(f"   ⚠ .NET 8.0이 아님: {version}")
+    else:
+        print("   ❌ .NET SDK를 찾을 수 없습니다.")
         errors.append(".NET 8.0 SDK가 설치되어 있지 않습니다.")
     
     # 2. 프로젝트 파일 확인
     print("2. 프로젝트 파일 확인 중...")
-    project_path = Path("..") / "NationalClock" / PROJECT_FILE
-    if project_path.exists():
+    if str(project_path) not in missing_files:
         print(f"   ✓ 프로젝트 파일 확인됨: {project_path}")
     else:
         print(f"   ❌ 프로젝트 파일을 찾을 수 없습니다: {project_path}")
@@ -91,29 +118,26 @@ def check_prerequisites():
     
     # 3. NSIS 확인
     print("3. NSIS 설치 확인 중...")
-    nsis_found = False
-    for nsis_path in NSIS_PATHS:
-        if Path(nsis_path).exists():
-            print(f"   ✓ NSIS 확인됨: {nsis_path}")
-            nsis_found = True
-            break
-    
-    if not nsis_found:
+    if toolchain.nsis_path:
+        cache_note = " (캐시)" if "nsis" in toolchain.cached_tools else ""
+        print(f"   ✓ NSIS 확인됨: {toolchain.nsis_path} ({toolchain.nsis_version}){cache_note}")
+        ctx.nsis_path = toolchain.nsis_path
+        ctx.nsis_version = toolchain.nsis_version
+    else:
         print("   ❌ NSIS를 찾을 수 없습니다.")
         print("   다음 경로를 확인했습니다:")
-        for path in NSIS_PATHS:
+        for path in toolchain.nsis_candidates:
             print(f"   • {path}")
         errors.append("NSIS가 설치되어 있지 않습니다.")
     
     # 4. 스크립트 파일 확인
     print("4. 빌드 스크립트 확인 중...")
-    scripts = ["11_UpdateFromProject.py", "12_BuildInstaller.py"]
     for script in scripts:
-        if Path(script).exists():
-            print(f"   ✓ {script}")
+        if str(script) not in missing_files:
+            print(f"   ✓ {script.name}")
         else:
-            print(f"   ❌ {script}")
-            errors.append(f"필수 스크립트가 없습니다: {script}")
+            print(f"   ❌ {script.name}")
+            errors.append(f"필수 스크립트가 없습니다: {script.name}")
     
     print()
     
@@ -132,38 +156,124 @@ def check_prerequisites():
     print()
     return True
 
-def run_step(step_name, script_name, description):
-    """단계별 스크립트 실행"""
-    print(f"🔧 {step_name}: {description}")
-    print("=" * 60)
-    
-    try:
-        # Python 스크립트 실행
-        result = subprocess.run([sys.executable, script_name], 
-                              capture_output=False, text=True, encoding='utf-8', errors='replace')
-        
-        if result.returncode == 0:
-            print(f"✅ {step_name} 완료!")
-            return True
-        else:
-            print(f"❌ {step_name} 실패! (종료 코드: {result.returncode})")
+def variant_contexts(ctx, variants):
+    """변형별 컨텍스트 목록 (기본 변형 하나면 ctx, 게시 단계를 실행하지 않았으면 (--only) 새로 만듦)"""
+    if variants == [ctx.variant]:
+        return [ctx]
+    return [ctx.variants.setdefault(variant, variant_context(ctx, variant, isolated_build=True))
+            for variant in variants]
+
+def for_each_variant(ctx, variants, stage_func):
+    """변형마다 단계 함수 실행 (하나라도 실패하면 False)"""
+    variant_ctxs = variant_contexts(ctx, variants)
+    for variant_ctx in variant_ctxs:
+        if len(variant_ctxs) > 1:
+            print(f"── [{variant_ctx.variant}] " + "─" * 40)
+        if not stage_func(variant_ctx):
             return False
-            
-    except Exception as e:
-        print(f"❌ {step_name} 중 오류 발생: {str(e)}")
+    print()
+    return True
+
+def restore_step(ctx, variants):
+    """NuGet 패키지 미리 복원 (도구 확인 / 이전 빌드 정리와 동시에 실행, 실패해도 빌드는 계속)"""
+    print("📥 NuGet 패키지 복원")
+    print("=" * 40)
+    return update_stage.restore_packages(ctx, variants)
+
+def publish_step(ctx, variants, jobs):
+    """프로젝트 빌드 및 게시 (변형 매트릭스는 프로세스 풀에서 동시에 게시)"""
+    print("📤 프로젝트 빌드 및 게시")
+    print("=" * 40)
+    
+    if variants != [ctx.variant]:
+        return update_stage.update_variants(ctx, variants, jobs, publish_only=True)
+    
+    result = update_stage.publish_files(ctx)
+    result.name = "update"
+    ctx.results[result.name] = result
+    return result
+
+def manifest_step(ctx, variants, exit_if_unchanged):
+    """게시 매니페스트 생성 및 이전 빌드와 비교 (--exit-if-unchanged 이면 변경이 없을 때 이후 단계 중단)"""
+    print("🧾 게시 매니페스트 생성")
+    print("=" * 40)
+    
+    if not for_each_variant(ctx, variants, update_stage.record_publish_manifest):
         return False
+    
+    variant_ctxs = variant_contexts(ctx, variants)
+    if exit_if_unchanged and all(v.publish_diff and v.publish_diff["is_empty"] for v in variant_ctxs):
+        print("✅ 게시 파일이 이전 빌드와 동일하여 이후 단계를 건너뜁니다. (--exit-if-unchanged)")
+        raise StopPipeline()
+    return True
+
+def restore_manifest_step(ctx, variants):
+    """실행하지 않은 매니페스트 단계의 변형별 매니페스트 / 비교 정보 복원 (--resume / --only, 보고서와 빌드 이력에서 사용)"""
+    return all([update_stage.load_publish_manifest(variant_ctx) for variant_ctx in variant_contexts(ctx, variants)])
+
+def version_info_step(ctx, variants):
+    """버전 / 빌드 정보 파일 기록 (게시한 변형 전체 기준)"""
+    print("📝 버전 / 빌드 정보 기록")
+    print("=" * 40)
+    return update_stage.write_version_files(ctx, variants)
+
+def installer_step(ctx, variants, jobs):
+    """NSIS 설치파일 컴파일 (변형 매트릭스는 프로세스 풀에서 동시에 컴파일)"""
+    print("📦 NSIS 설치파일 컴파일")
+    print("=" * 40)
+    
+    if variants != [ctx.variant]:
+        return installer_stage.create_installers(ctx, variants, jobs, compile_only=True)
+    
+    result = installer_stage.compile_installer(ctx)
+    ctx.results[result.name] = result
+    return result
+
+def checksum_step(ctx, variants):
+    """설치파일 검증 (SHA-256 계산, 레지스트리 등록, 설치파일 캐시 저장)"""
+    print("🔑 설치파일 검증")
+    print("=" * 40)
+    return for_each_variant(ctx, variants, installer_stage.check_installer)
 
-def cleanup_old_files():
-    """이전 빌드 파일 정리"""
+def installer_info_step(ctx, variants):
+    """변형별 설치파일 정보 파일 생성"""
+    print("📄 설치파일 정보 생성")
+    print("=" * 40)
+    return for_each_variant(ctx, variants, lambda c: installer_stage.create_installer_info(c) is not None)
+
+def cleanup_old_files(ctx, store):
+    """이전 빌드 파일 정리 (보관소에 없는 이전 설치파일은 먼저 보관한 뒤 작업 공간에서만 삭제)
+    
+    ctx.warm_workspace 이면 publish 폴더는 삭제하지 않습니다 (11단계에서 변경된 파일만 동기화).
+    """
     print("🗑️ 이전 빌드 파일 정리 중...")
     print("=" * 40)
     
     # 이전 설치파일들 찾기
     pattern = f"{PRODUCT_NAME}_v*_Build_*_Setup.exe"
-    old_installers = list(Path(".").glob(pattern))
+    old_installers = list(ctx.workspace.glob(pattern))
     
     if old_installers:
         print(f"   발견된 이전 설치파일: {len(old_installers)}개")
+        
+        # 보관소에 같은 내용이 없는 설치파일은 하나의 빌드로 보관 (하드링크이므로 복사 비용 없음)
+        unarchived = {}
+        for installer in old_installers:
+            sha256 = hash_file(installer)
+            if not store.has_object(sha256):
+                unarchived[installer.name] = (installer, sha256, True)
+        if unarchived:
+            try:
+                latest = max(path.stat().st_mtime for path, _, _ in unarchived.values())
+                build_id = f"previous_{datetime.fromtimestamp(latest).strftime('%Y%m%d_%H%M%S')}"
+                store.save_build(build_id, unarchived, {"product_version": None,
+                                                        "installers": sorted(unarchived)})
+                print(f"   ✓ 보관되지 않은 설치파일 {len(unarchived)}개 보관: {build_id}")
+            except Exception as e:
+                # 보관하지 못한 설치파일은 삭제하지 않고 남겨둠
+                print(f"   ⚠ 이전 설치파일 보관 실패 (보관되지 않은 파일은 삭제하지 않음): {e}")
+                old_installers = [path for path in old_installers if path.name not in unarchived]
+        
         for installer in old_installers:
             try:
                 installer.unlink()
@@ -174,79 +284,123 @@ def cleanup_old_files():
         print("   • 정리할 이전 설치파일이 없습니다.")
     
     # 임시 폴더 정리
-    temp_dirs = ["publish", "Tmp"]
-    for temp_dir in temp_dirs:
-        temp_path = Path(temp_dir)
+    temp_dirs = [ctx.workspace / "Tmp"] if ctx.warm_workspace else [ctx.publish_root, ctx.workspace / "Tmp"]
+    if ctx.warm_workspace:
+        print("   • publish 폴더 유지 (--warm-workspace)")
+    for temp_path in temp_dirs:
         if temp_path.exists():
             try:
                 shutil.rmtree(temp_path)
-                print(f"   ✓ 임시 폴더 삭제: {temp_dir}")
+                print(f"   ✓ 임시 폴더 삭제: {temp_path.name}")
             except Exception as e:
-                print(f"   ⚠ 임시 폴더 삭제 실패: {temp_dir} ({e})")
+                print(f"   ⚠ 임시 폴더 삭제 실패: {temp_path.name} ({e})")
     
     print("   ✅ 정리 완료!")
     print()
+    return True
 
-def verify_final_result():
-    """최종 결과 검증"""
+def get_main_installer(ctx):
+    """대표 설치파일 레지스트리 항목 (기본 변형 우선, 없으면 처음 등록된 변형)"""
+    entry = ctx.artifacts.get("installer", ctx.variant)
+    if entry is None:
+        installers = ctx.artifacts.find("installer")
+        entry = installers[0] if installers else None
+    return entry
+
+def verify_final_result(ctx):
+    """최종 결과 검증 (산출물 레지스트리 기준, 폴더 검색 없음)"""
     print("🔍 최종 결과 검증 중...")
     print("=" * 40)
     
-    # 설치파일 패턴으로 검색
-    installer_pattern = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_*_Setup.exe"
-    installer_files = list(Path(".").glob(installer_pattern))
-    
-    if not installer_files:
-        print(f"   ❌ 설치파일을 찾을 수 없습니다: {installer_pattern}")
+    installers = ctx.artifacts.find("installer")
+    if not installers:
+        print("   ❌ 등록된 설치파일이 없습니다.")
         return False
     
-    # 가장 최근 파일 선택
-    installer_path = max(installer_files, key=lambda f: f.stat().st_mtime)
-    installer_name = installer_path.name
-    
-    # 파일 정보 출력
-    file_size = installer_path.stat().st_size
-    size_mb = file_size // 1024 // 1024
-    
-    print(f"   ✅ 설치파일: {installer_name}")
-    print(f"   📦 파일 크기: {size_mb} MB ({file_size:,} bytes)")
-    
-    # 생성 시간 확인
-    creation_time = installer_path.stat().st_mtime
-    creation_datetime = datetime.fromtimestamp(creation_time)
-    print(f"   📅 생성 시간: {creation_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # 관련 파일들 확인
-    info_file = f"{installer_name}_INFO.txt"
-    if Path(info_file).exists():
-        print(f"   📄 정보 파일: {info_file}")
-    
-    if Path("VERSION.txt").exists():
-        print(f"   📄 버전 파일: VERSION.txt")
+    for entry in installers:
+        installer_name = Path(entry["path"]).name
+        
+        # 등록 이후 파일이 바뀌었거나 삭제되었으면 실패
+        if not ctx.artifacts.is_current(entry):
+            print(f"   ❌ 설치파일이 없거나 등록 이후 변경되었습니다: {installer_name}")
+            return False
+        
+        # 파일 정보 출력 (등록 시 기록한 값 사용)
+        file_size = entry["size"]
+        size_mb = file_size // 1024 // 1024
+        variant_note = f" [{entry['variant']}]" if len(installers) > 1 else ""
+        
+        print(f"   ✅ 설치파일: {installer_name}{variant_note}")
+        print(f"   📦 파일 크기: {size_mb} MB ({file_size:,} bytes)")
+        print(f"   📅 생성 시간: {datetime.fromtimestamp(entry['mtime']).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"   🔑 SHA-256: {entry['sha256']}")
+        
+        # 관련 파일들 확인
+        info_entry = ctx.artifacts.get("installer_info", entry["variant"])
+        if info_entry:
+            print(f"   📄 정보 파일: {Path(info_entry['path']).name}")
     
-    if Path("BUILD_INFO.txt").exists():
-        print(f"   📄 빌드 정보: BUILD_INFO.txt")
+    for kind, label in (("version_file", "버전 파일"), ("build_info", "빌드 정보")):
+        entry = ctx.artifacts.get(kind)
+        if entry:
+            print(f"   📄 {label}: {Path(entry['path']).name}")
     
     print()
     return True
 
-def generate_build_report():
-    """빌드 보고서 생성"""
+def format_build_steps(steps, run, current):
+    """빌드 보고서의 단계별 실행 결과 (보고서를 만드는 시점 기준, current: 보고서 단계 이름)"""
+    lines = []
+    for number, step in enumerate(steps, 1):
+        if step.name in run.results:
+            result = run.results[step.name]
+            start, end = run.timings[step.name]
+            if step.name in run.skipped:
+                status = "⏭️ 건너뜀 (체크포인트)"
+            elif result.success:
+                cache_note = ", 캐시 사용" if result.cache_hit else ""
+                status = f"✅ ({end - start:.1f}초{cache_note})"
+            else:
+                status = "❌"
+        elif step.name not in run.selected:
+            status = "• 실행하지 않음 (--until / --only)"
+        elif step.name == current:
+            status = "⏳ 진행 중 (이 보고서)"
+        else:
+            status = "⏳ 보고서 생성 이후 실행"
+        lines.append(f"{number}. {step.description} {status}")
+    return "\n".join(lines)
+
+def generate_build_report(ctx, variants, steps, run):
+    """빌드 보고서 생성 (steps / run: 빌드 과정에 기록할 파이프라인 단계와 실행 중인 결과)"""
     print("📊 빌드 보고서 생성 중...")
     print("=" * 40)
     
-    # 설치파일 패턴으로 검색
-    installer_pattern = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_*_Setup.exe"
-    installer_files = list(Path(".").glob(installer_pattern))
+    # 산출물 레지스트리에서 대표 설치파일 정보 사용
+    installer = get_main_installer(ctx)
     
-    if installer_files:
-        # 가장 최근 파일 선택
-        installer_path = max(installer_files, key=lambda f: f.stat().st_mtime)
-        installer_name = installer_path.name
-        file_size = installer_path.stat().st_size
+    if installer:
+        installer_name = Path(installer["path"]).name
+        file_size = installer["size"]
         size_mb = file_size // 1024 // 1024
-        creation_time = installer_path.stat().st_mtime
-        creation_datetime = datetime.fromtimestamp(creation_time)
+        creation_datetime = datetime.fromtimestamp(installer["mtime"])
+        
+        # 게시 파일 정보 (11단계에서 만든 매니페스트 재사용, 변형 빌드 시 기본 변형 기준)
+        main_ctx = ctx.variants.get(ctx.variant, ctx)
+        manifest = main_ctx.publish_manifest or {}
+        publish_count = manifest.get("file_count", 0)
+        publish_size = manifest.get("total_size", 0)
+        publish_hash = manifest.get("tree_hash", "-")[:16]
+        if main_ctx.publish_diff is not None:
+            diff_lines = "\n".join(f"- {line}" for line in format_manifest_diff(main_ctx.publish_diff, limit=50))
+        else:
+            diff_lines = "- 비교 정보 없음"
+        
+        # 기술 사양 / 요구사항은 빌드한 변형 전체 기준
+        architecture, deployment = describe_variants(variants)
+        requirements = get_system_requirements(variants)
+        requirement_lines = "".join(f"- {line}\n" for line in requirements)
+        runtime_note = "- .NET 8.0 Desktop Runtime 필수\n" if ".NET 8.0 Desktop Runtime" in requirements else ""
         
         report_content = f"""==================================================
 {PRODUCT_NAME} 빌드 보고서
@@ -262,19 +416,20 @@ def generate_build_report():
 - 설치파일: {installer_name}
 - 파일 크기: {size_mb} MB ({file_size:,} bytes)
 - 생성 시간: {creation_datetime.strftime('%Y-%m-%d %H:%M:%S')}
+- SHA-256: {installer['sha256']}
+- 게시 파일: {publish_count}개, {publish_size // 1024 // 1024} MB ({publish_size:,} bytes)
+- 게시 폴더 해시: {publish_hash}
 
 기술 사양:
 - 플랫폼: .NET 8.0 WPF
-- 아키텍처: x64
-- 배포 방식: Framework-dependent
+- 아키텍처: {architecture}
+- 배포 방식: {deployment}
 - UI 프레임워크: Material Design
-- 압축 방식: LZMA
+- 압축 방식: {describe_profile(ctx.compression)}
 - 패턴: MVVM
 
 시스템 요구사항:
-- Windows 10 이상 (x64)
-- .NET 8.0 Desktop Runtime
-- 관리자 권한 (설치 시)
+{requirement_lines}- 관리자 권한 (설치 시)
 
 설치 정보:
 - 설치 경로: C:\\Program Files\\{PRODUCT_NAME}
@@ -282,17 +437,15 @@ def generate_build_report():
 - 바로가기: 데스크톱, 시작메뉴
 - 자동 시작: 선택사항
 
+게시 파일 변경 (이전 빌드 대비):
+{diff_lines}
+
 빌드 과정:
-1. 사전 요구사항 확인 ✅
-2. 이전 빌드 정리 ✅
-3. 프로젝트 업데이트 ✅
-4. NSIS 설치파일 생성 ✅
-5. 최종 결과 검증 ✅
+{format_build_steps(steps, run, "report")}
 
 주의사항:
 - 설치 전 이전 버전 제거 권장
-- .NET 8.0 Desktop Runtime 필수
-- 관리자 권한으로 설치 실행
+{runtime_note}- 관리자 권한으로 설치 실행
 - 방화벽 설정 확인 필요
 
 배포 체크리스트:
@@ -311,56 +464,417 @@ def generate_build_report():
 - 테마 시스템: Material Design
 """
         
-        report_file = f"{PRODUCT_NAME}_Build_Report_{BUILD_DATE}.txt"
+        report_file = ctx.workspace / f"{PRODUCT_NAME}_Build_Report_{BUILD_DATE}.txt"
         with open(report_file, "w", encoding="utf-8") as f:
             f.write(report_content)
+        ctx.artifacts.register("build_report", report_file, "report")
         
-        print(f"   ✅ 빌드 보고서 생성: {report_file}")
+        print(f"   ✅ 빌드 보고서 생성: {report_file.name}")
         print()
+    
+    return installer is not None
 
-def main():
-    """메인 실행 함수"""
-    start_time = time.time()
+def collect_build_files(ctx):
+    """보관할 빌드 산출물 목록 (보관 경로 → (원본 경로, SHA-256, 하드링크 허용 여부))
+    
+    설치파일과 게시 폴더는 하드링크로 보관하고, 제자리에서 다시 쓰는 텍스트 파일은 복사합니다.
+    게시 폴더는 11단계 매니페스트의 파일별 해시를 그대로 사용합니다.
+    """
+    files = {}
+    for entry in ctx.artifacts.find("installer"):
+        files[Path(entry["path"]).name] = (ctx.artifacts.resolve(entry), entry["sha256"], True)
+    
+    for kind in ("installer_info", "version_file", "build_info", "build_report"):
+        for entry in ctx.artifacts.find(kind):
+            files[Path(entry["path"]).name] = (ctx.artifacts.resolve(entry), entry["sha256"], False)
     
-    print_header()
+    for entry in ctx.artifacts.find("publish"):
+        manifest_entry = ctx.artifacts.get("publish_manifest", entry["variant"])
+        manifest = load_manifest(ctx.artifacts.resolve(manifest_entry)) if manifest_entry else None
+        if manifest is None:
+            continue
+        publish_dir = ctx.artifacts.resolve(entry)
+        for rel_path, info in manifest["files"].items():
+            files[f"{entry['path']}/{rel_path}"] = (publish_dir / rel_path, info["sha256"], True)
     
-    # 현재 위치를 NSIS_installer로 변경
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    return files
+
+def archive_build(ctx, store):
+    """빌드 산출물을 보관소에 저장하고 보관 정책에 따라 정리"""
+    print("🗄️ 산출물 보관 중...")
+    print("=" * 40)
+    
+    build_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    meta = {
+        "product_version": ctx.product_version,
+        "build_date": ctx.build_date,
+        "variants": sorted(entry["variant"] for entry in ctx.artifacts.find("installer")),
+        "installers": sorted(Path(entry["path"]).name for entry in ctx.artifacts.find("installer"))
+    }
     
     try:
-        # 1. 사전 요구사항 확인
-        if not check_prerequisites():
+        stats = store.save_build(build_id, collect_build_files(ctx), meta)
+    except Exception as e:
+        # 보관 실패는 빌드 실패로 보지 않음
+        print(f"   ⚠ 산출물 보관 실패: {str(e)}")
+        print()
+        return True
+    
+    print(f"   ✓ 빌드 보관: {build_id} (파일 {stats['files']}개)")
+    print(f"   • 새 객체: {stats['new_objects']}개 ({stats['new_bytes']:,} bytes, reflink / 하드링크 {stats['linked']}개), "
+          f"재사용: {stats['reused']}개")
+    for evicted in stats["evicted"]:
+        print(f"   • 보관 정책에 따라 삭제: {evicted}")
+    
+    object_count, total_bytes = store.usage()
+    print(f"   📁 보관소: 객체 {object_count}개, {total_bytes / 1024 / 1024:.1f} MB "
+          f"(최근 {store.keep_builds}개 빌드, 최대 {store.max_bytes / 1024 / 1024:,.0f} MB)")
+    print()
+    return True
+
+def fingerprint_contexts(ctx, variants):
+    """체크포인트 지문 계산용 변형별 컨텍스트 (ctx.variants 는 바꾸지 않음)"""
+    return [variant_context(ctx, variant, ctx.isolated_build) for variant in variants]
+
+def artifact_outputs(ctx, *kinds):
+    """레지스트리에 등록된 산출물 (체크포인트 출력 지문용, 등록 이후 바뀌었거나 삭제된 파일은 해시 대신 None)"""
+    entries = sorted((entry for kind in kinds for entry in ctx.artifacts.find(kind)), key=lambda entry: entry["path"])
+    return [[entry["path"], entry["sha256"] if ctx.artifacts.is_current(entry) else None] for entry in entries]
+
+def build_pipeline(args, variants, store, run):
+    """빌드 단계 의존성 그래프 (선행 단계가 끝난 단계부터 동시에 실행)
+    
+    설치파일 캐시 키에는 게시 폴더 해시가 들어가므로 캐시를 사용할 때만 컴파일이 매니페스트를 기다리고,
+    빌드 보고서에는 설치파일 SHA-256 과 단계별 실행 결과가 들어가므로 최종 결과 검증 이후에 만듭니다.
+    
+    inputs / outputs 는 --resume 체크포인트 지문 대상입니다. 도구 확인, 검증, 보고서, 보관은 빠르므로 항상 실행하고
+    (도구 버전이 바뀌면 이후 단계도 다시 실행), 이전 빌드 정리는 한 번 끝나면 이어서 실행할 때 다시 하지 않습니다.
+    
+    run 은 run_pipeline 에 넘길 PipelineRun 입니다 (빌드 보고서에 단계별 실행 결과 기록).
+    """
+    wait_manifest = not args.no_cache or args.exit_if_unchanged
+    steps = [
+        PipelineStep("prerequisites", "사전 요구사항 확인", check_prerequisites,
+                     outputs=lambda c: [c.dotnet_version, c.nsis_path, c.nsis_version]),
+        PipelineStep("restore", "NuGet 패키지 복원", lambda c: restore_step(c, variants),
+                     inputs=lambda c: [variants, c.isolated_build, c.project_file,
+                                       *(c.project_dir / name for name in update_stage.RESTORE_INPUT_FILES)]),
+        PipelineStep("cleanup", "이전 빌드 파일 정리", lambda c: cleanup_old_files(c, store), ("prerequisites",),
+                     inputs=lambda c: [c.warm_workspace]),
+        PipelineStep("version-info", "버전 / 빌드 정보 기록", lambda c: version_info_step(c, variants), ("prerequisites",),
+                     inputs=lambda c: [c.installer_name, variants, c.compression],
+                     outputs=lambda c: artifact_outputs(c, "version_file", "build_info")),
+        PipelineStep("publish", "프로젝트 빌드 및 게시", lambda c: publish_step(c, variants, args.jobs),
+                     ("cleanup", "restore"),
+                     inputs=lambda c: [variants, hash_sources(c.project_dir), get_version_properties(c)],
+                     outputs=lambda c: [v.publish_dir for v in fingerprint_contexts(c, variants)]),
+        PipelineStep("manifest", "게시 매니페스트 생성", lambda c: manifest_step(c, variants, args.exit_if_unchanged),
+                     ("publish",),
+                     inputs=lambda c: [],
+                     outputs=lambda c: [v.publish_manifest_path for v in fingerprint_contexts(c, variants)],
+                     restore=lambda c: restore_manifest_step(c, variants)),
+        PipelineStep("installer", "NSIS 설치파일 컴파일", lambda c: installer_step(c, variants, args.jobs),
+                     ("publish", "manifest") if wait_manifest else ("publish",),
+                     inputs=lambda c: [c.nsis_script, *map(installer_stage.get_nsis_defines,
+                                                           fingerprint_contexts(c, variants))],
+                     outputs=lambda c: [v.workspace / v.installer_name for v in fingerprint_contexts(c, variants)]),
+        PipelineStep("checksum", "설치파일 검증", lambda c: checksum_step(c, variants), ("installer",),
+                     inputs=lambda c: [],
+                     outputs=lambda c: artifact_outputs(c, "installer")),
+        PipelineStep("installer-info", "설치파일 정보 생성", lambda c: installer_info_step(c, variants), ("installer",),
+                     inputs=lambda c: [],
+                     outputs=lambda c: artifact_outputs(c, "installer_info")),
+        PipelineStep("verify", "최종 결과 검증", verify_final_result, ("checksum", "installer-info", "version-info")),
+        PipelineStep("report", "빌드 보고서 생성", lambda c: generate_build_report(c, variants, steps, run),
+                     ("verify", "manifest")),
+        PipelineStep("archive", "산출물 보관", lambda c: archive_build(c, store), ("verify", "report"))
+    ]
+    return steps
+
+def print_pipeline_summary(steps, run, workers):
+    """단계별 시작 / 종료 시각 (파이프라인 시작 기준) 과 임계 경로 출력"""
+    print(f"⏱️ 단계별 실행 시간 (동시 실행 최대 {workers}개)")
+    print("=" * 40)
+    
+    for step in steps:
+        if step.name in run.skipped:
+            print(f"   ⏭️ {step.name:<16}건너뜀 (체크포인트)")
+        elif step.name in run.timings:
+            start, end = run.timings[step.name]
+            status = "✅" if run.results[step.name].success else "❌"
+            print(f"   {status} {step.name:<16}{start:7.1f}초 → {end:7.1f}초  ({end - start:.1f}초)")
+        elif step.name in run.not_run:
+            print(f"   • {step.name:<16}실행하지 않음")
+    
+    path, seconds = critical_path(steps, run)
+    if path:
+        print(f"   • 임계 경로: {' → '.join(path)} ({seconds:.1f}초 / 전체 {run.elapsed:.1f}초)")
+    print()
+
+def record_build_history(ctx, variants, success, elapsed_time, time_threshold, size_threshold):
+    """빌드 이력 DB 에 기록하고 최근 빌드 기준값 대비 회귀 확인"""
+    print("🗃️ 빌드 이력 기록 중...")
+    print("=" * 40)
+    
+    main_ctx = ctx.variants.get(ctx.variant, ctx)
+    manifest = main_ctx.publish_manifest or {}
+    installer = get_main_installer(ctx)
+    update_result = ctx.results.get("update")
+    installer_result = ctx.results.get("installer")
+    
+    build = {
+        "product_version": ctx.product_version,
+        "build_date": ctx.build_date,
+        "variant": ",".join(variants),
+        "success": int(success),
+        "total_seconds": elapsed_time,
+        "publish_cache_hit": int(update_result.cache_hit) if update_result else None,
+        "installer_cache_hit": int(installer_result.cache_hit) if installer_result else None,
+        "installer_name": Path(installer["path"]).name if installer else None,
+        "installer_size": installer["size"] if installer else None,
+        "publish_file_count": manifest.get("file_count"),
+        "publish_total_size": manifest.get("total_size"),
+        "dotnet_version": ctx.dotnet_version,
+        "nsis_version": ctx.nsis_version,
+        "compression": ctx.compression
+    }
+    
+    db_path = ctx.script_dir / HISTORY_FILE_NAME
+    try:
+        build_id = record_build(db_path, build, ctx.tracer.durations() if ctx.tracer else {})
+        print(f"   ✓ 빌드 #{build_id} 기록: {db_path.name}")
+        if success:
+            _, baseline_count, findings = find_regressions(db_path, build_id, time_threshold=time_threshold,
+                                                           size_threshold=size_threshold)
+            print_regressions(baseline_count, findings)
+    except Exception as e:
+        print(f"   ⚠ 빌드 이력 기록 실패: {str(e)}")
+    print()
+
+def print_regressions(baseline_count, findings):
+    """회귀 확인 결과 출력"""
+    if not findings:
+        print(f"   ✓ 회귀 없음 (기준 빌드 {baseline_count}개)")
+        return
+    
+    print(f"   ⚠ 회귀 {len(findings)}건 (기준 빌드 {baseline_count}개의 중앙값 대비):")
+    for line in format_regressions(findings):
+        print(f"     • {line}")
+
+def show_build_history(args):
+    """빌드 이력 / 회귀 확인 출력 (빌드는 수행하지 않음, 회귀가 있으면 1 반환)"""
+    db_path = Path(__file__).resolve().parent / HISTORY_FILE_NAME
+    if not db_path.exists():
+        print(f"❌ 빌드 이력이 없습니다: {db_path.name}")
+        return 1
+    
+    if args.history:
+        print(f"🗃️ 최근 빌드 {args.history}건")
+        print("=" * 80)
+        for build in recent_builds(db_path, args.history):
+            status = "✅" if build["success"] else "❌"
+            size = f"{build['installer_size']:,} bytes" if build["installer_size"] else "-"
+            print(f"{status} #{build['id']:<4} {build['finished']}  {build['total_seconds'] or 0:7.1f}초  "
+                  f"{size:>18}  {build['variant']}")
+        print()
+    
+    if not args.check_regressions:
+        return 0
+    
+    target, baseline_count, findings = find_regressions(
+        db_path, time_threshold=args.time_threshold / 100, size_threshold=args.size_threshold / 100)
+    if target is None:
+        print(f"❌ 기록된 빌드가 없습니다: {db_path.name}")
+        return 1
+    print(f"🔍 회귀 확인: 빌드 #{target['id']} ({target['finished']}, 시간 +{args.time_threshold:g}% / "
+          f"크기 +{args.size_threshold:g}% 초과 시)")
+    print("=" * 80)
+    print_regressions(baseline_count, findings)
+    return 1 if findings else 0
+
+def run_store_command(args, store):
+    """보관된 빌드 목록 / 복원 / 비교 (빌드는 수행하지 않음)"""
+    if args.list_builds:
+        records = store.list_builds()
+        if not records:
+            print("❌ 보관된 빌드가 없습니다.")
             return 1
         
-        # 2. 이전 빌드 파일 정리
-        cleanup_old_files()
+        print(f"🗄️ 보관된 빌드 {len(records)}건")
+        print("=" * 80)
+        for record in records:
+            print(f"   {record['id']:<24} {record['created']}  v{record.get('product_version') or '-':<10} "
+                  f"{record['total_size']:>15,} bytes  {', '.join(record.get('installers', []))}")
+        object_count, total_bytes = store.usage()
+        print(f"   📁 보관소: 객체 {object_count}개, {total_bytes / 1024 / 1024:.1f} MB")
+        return 0
+    
+    if args.restore_build:
+        record = store.load_build(args.restore_build)
+        if record is None:
+            print(f"❌ 보관된 빌드를 찾을 수 없습니다: {args.restore_build}")
+            return 1
         
-        # 3. 프로젝트 업데이트 단계
-        print("📤 1단계: 프로젝트 업데이트 및 게시")
-        if not run_step("1단계", "11_UpdateFromProject.py", 
-                       "프로젝트 빌드 및 게시 폴더 생성"):
-            print("❌ 프로젝트 업데이트 실패!")
+        dest_dir = Path(args.restore_dir or Path(__file__).resolve().parent / "restored" / record["id"])
+        restored, missing = store.restore_build(record, dest_dir)
+        print(f"📂 빌드 복원: {record['id']} → {dest_dir}")
+        print(f"   ✓ 복원된 파일: {restored}개")
+        for rel_path in missing:
+            print(f"   ❌ 보관소에 없음: {rel_path}")
+        return 1 if missing else 0
+    
+    old_record, new_record = (store.load_build(build_id) for build_id in args.compare_builds)
+    for build_id, record in zip(args.compare_builds, (old_record, new_record)):
+        if record is None:
+            print(f"❌ 보관된 빌드를 찾을 수 없습니다: {build_id}")
             return 1
+    
+    print(f"🔍 빌드 비교: {old_record['id']} → {new_record['id']}")
+    print("=" * 80)
+    for line in format_manifest_diff(diff_manifests(old_record, new_record), limit=50):
+        print(f"   • {line}")
+    return 0
+
+def setup_argparse():
+    """명령행 인자 설정"""
+    parser = argparse.ArgumentParser(description=f'{PRODUCT_NAME} 전체 빌드 프로세스')
+    parser.add_argument('--no-cache', action='store_true', help='빌드/설치파일 캐시를 사용하지 않음')
+    parser.add_argument('--clean', action='store_true', help='프로젝트 빌드 전에 dotnet clean 수행 (기본값: 증분 빌드)')
+    parser.add_argument('--exit-if-unchanged', action='store_true',
+                        help='게시 파일이 이전 빌드와 같으면 설치파일 생성 이후 단계를 건너뛰고 종료 (NSIS 스크립트 변경은 고려하지 않음)')
+    parser.add_argument('--variants', type=str, default=None,
+                        help=f'게시 변형 목록 (쉼표 구분 또는 all, 사용 가능: {", ".join(PUBLISH_VARIANTS)})')
+    parser.add_argument('--jobs', type=int, default=None, help='변형별 동시 게시/NSIS 컴파일 작업 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--step-jobs', type=int, default=STEP_WORKERS,
+                        help='동시에 실행할 빌드 단계 수 (선행 단계가 끝난 단계끼리, 기본값: %(default)s)')
+    steps_group = parser.add_mutually_exclusive_group()
+    steps_group.add_argument('--until', type=str, default=None, metavar='STEPS',
+                             help='지정한 단계와 그 선행 단계까지만 실행 (쉼표 구분, 예: installer)')
+    steps_group.add_argument('--only', type=str, default=None, metavar='STEPS',
+                             help='지정한 단계만 실행 (쉼표 구분, 선행 단계는 이전 빌드 결과를 그대로 사용, 예: installer,checksum)')
+    parser.add_argument('--resume', action='store_true',
+                        help='이전 빌드의 체크포인트에서 이어서 실행 (입력 / 출력이 바뀌지 않은 완료 단계는 건너뜀, '
+                             '예: makensis 실패 후 NSIS 스크립트만 고친 경우)')
+    parser.add_argument('--workspace', type=str, default=None,
+                        help='빌드 작업 공간 (기본값: 스크립트 폴더, 작업 공간마다 게시 폴더 / 산출물 / 로그를 따로 만들어 동시 빌드 가능)')
+    parser.add_argument('--warm-workspace', action='store_true',
+                        help='publish 폴더를 삭제하지 않고 준비 폴더에 게시한 뒤 변경된 파일만 동기화 (수정 시각 유지)')
+    parser.add_argument('--compression', type=str, default=None, choices=[*COMPRESSION_PROFILES, 'auto'],
+                        help='설치파일 압축 프로필 (auto: 12_BuildInstaller.py --benchmark-compression 에서 선택된 프로필)')
+    parser.add_argument('--history', type=int, nargs='?', const=10, default=None, metavar='N',
+                        help=f'빌드하지 않고 {HISTORY_FILE_NAME} 의 최근 빌드 N건 출력 (기본값: 10)')
+    parser.add_argument('--check-regressions', action='store_true',
+                        help='빌드하지 않고 마지막 빌드를 최근 빌드 기준값과 비교 (회귀가 있으면 종료 코드 1)')
+    parser.add_argument('--time-threshold', type=float, default=TIME_THRESHOLD * 100,
+                        help='단계 소요 시간 회귀 기준 (증가율 %%, 기본값: %(default)g)')
+    parser.add_argument('--size-threshold', type=float, default=SIZE_THRESHOLD * 100,
+                        help='설치파일 크기 회귀 기준 (증가율 %%, 기본값: %(default)g)')
+    parser.add_argument('--keep-builds', type=int, default=KEEP_BUILDS,
+                        help='산출물 보관소에 남길 최근 빌드 수 (기본값: %(default)s)')
+    parser.add_argument('--store-max-mb', type=float, default=MAX_STORE_BYTES / 1024 / 1024,
+                        help='산출물 보관소 최대 용량 (MB, 기본값: %(default)g)')
+    parser.add_argument('--list-builds', action='store_true', help='빌드하지 않고 보관된 빌드 목록 출력')
+    parser.add_argument('--restore-build', type=str, default=None, metavar='ID',
+                        help='빌드하지 않고 보관된 빌드 복원 (ID 또는 latest)')
+    parser.add_argument('--restore-dir', type=str, default=None,
+                        help='복원 위치 (기본값: restored/<빌드 ID>)')
+    parser.add_argument('--compare-builds', type=str, nargs=2, default=None, metavar=('OLD', 'NEW'),
+                        help='빌드하지 않고 보관된 두 빌드의 파일 비교 (ID 또는 latest)')
+    return parser
+
+def main():
+    """메인 실행 함수"""
+    start_time = time.time()
+    parser = setup_argparse()
+    args = parser.parse_args()
+    try:
+        variants = parse_variants(args.variants)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.history or args.check_regressions:
+        return show_build_history(args)
+    
+    # 산출물 보관소 (이전 설치파일 보관, 빌드 완료 후 보관, 보관된 빌드 조회 / 복원 / 비교)
+    store = ArtifactStore(keep_builds=args.keep_builds, max_bytes=int(args.store_max_mb * 1024 * 1024))
+    if args.list_builds or args.restore_build or args.compare_builds:
+        return run_store_command(args, store)
+    
+    # 빌드 단계 의존성 그래프와 실행할 단계 (--until / --only)
+    run = PipelineRun()
+    steps = build_pipeline(args, variants, store, run)
+    try:
+        selected = select_steps(steps, args.until, args.only)
+    except ValueError as e:
+        parser.error(str(e))
+    partial = len(selected) < len(steps)
+    
+    # 모든 단계가 공유하는 빌드 컨텍스트 (모든 경로는 작업 공간 기준, 현재 디렉터리는 바꾸지 않음)
+    ctx = BuildContext(
+        product_name=PRODUCT_NAME,
+        product_version=PRODUCT_VERSION,
+        assembly_version=VERSION_INFO.assembly_version,
+        build_date=BUILD_DATE,
+        script_dir=Path(__file__).resolve().parent,
+        workspace_dir=resolve_workspace(args.workspace),
+        project_file_name=PROJECT_FILE,
+        nsis_script_name=NSIS_SCRIPT,
+        use_cache=not args.no_cache,
+        warm_workspace=args.warm_workspace,
+        clean_build=args.clean,
+        tracer=BuildTracer("10_BuildAll")
+    )
+    # 작업 공간을 지정하면 obj/bin 도 작업 공간별로 분리 (같은 프로젝트를 동시에 빌드)
+    ctx.isolated_build = ctx.workspace_dir is not None
+    ctx.artifacts = ArtifactRegistry(ctx.workspace / ARTIFACT_REGISTRY_NAME)
+    ctx.compression = installer_stage.resolve_compression(args.compression)
+    
+    # 단계별 체크포인트 (--resume 은 입력 / 출력이 바뀌지 않은 완료 단계를 건너뜀)
+    checkpoints = CheckpointStore(ctx.state_dir / CHECKPOINT_FILE_NAME)
+    resumed = checkpoints.completed() if args.resume else []
+    if not args.only and not resumed:
+        # 새 빌드 시작 (이전 빌드 산출물 기록 / 체크포인트 삭제, --only / --resume 은 이전 단계 결과 사용)
+        ctx.artifacts.clear()
+        checkpoints.clear()
+    
+    print_header(ctx, variants)
+    
+    # 빌드 이력 기록 여부 (일부 단계만 실행했거나 --exit-if-unchanged / --resume 으로 건너뛴 빌드는 기록하지 않음)
+    build_succeeded = False
+    record_history = not partial
+    
+    try:
+        if partial:
+            print(f"• 실행할 단계: {', '.join(step.name for step in steps if step.name in selected)}")
+            print()
+        if args.resume:
+            if resumed:
+                print(f"• 체크포인트에서 이어서 실행 (이전 빌드 완료 단계: {', '.join(resumed)})")
+            else:
+                print("• 체크포인트가 없어 처음부터 실행합니다.")
+            print()
         
-        print("\n" + "="*80 + "\n")
+        # 선행 단계가 끝난 단계부터 동시에 실행 (출력은 단계별로 모아서 출력)
+        run_pipeline(steps, ctx, selected, args.step_jobs, checkpoints, args.resume, run)
+        print_pipeline_summary(steps, run, args.step_jobs)
         
-        # 4. 설치파일 생성 단계
-        print("📦 2단계: NSIS 설치파일 생성")
-        if not run_step("2단계", "12_BuildInstaller.py", 
-                       "NSIS 설치파일 컴파일"):
-            print("❌ 설치파일 생성 실패!")
-            return 1
+        # 체크포인트로 건너뛴 단계가 있으면 소요 시간이 전체 빌드와 다르므로 이력에 기록하지 않음
+        if run.skipped:
+            record_history = False
         
-        print("\n" + "="*80 + "\n")
+        if run.stopped:
+            record_history = False
+            return 0
         
-        # 5. 최종 결과 검증
-        if not verify_final_result():
-            print("❌ 최종 검증 실패!")
+        if not run.success:
+            failed = run.failed or run.not_run
+            print(f"❌ 빌드 실패: {', '.join(failed)} 단계")
             return 1
         
-        # 6. 빌드 보고서 생성
-        generate_build_report()
+        if partial:
+            print("✅ 선택한 단계가 완료되었습니다.")
+            print()
+            return 0
         
         # 빌드 완료 메시지
         elapsed_time = time.time() - start_time
@@ -371,16 +885,13 @@ def main():
         print("=" * 80)
         print()
         
-        # 실제 생성된 설치파일 찾기
-        installer_pattern = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_*_Setup.exe"
-        installer_files = list(Path(".").glob(installer_pattern))
-        if installer_files:
-            installer_path = max(installer_files, key=lambda f: f.stat().st_mtime)
-            installer_name = installer_path.name
-        else:
-            installer_name = "설치파일을 찾을 수 없음"
+        # 생성된 설치파일 (산출물 레지스트리 기준)
+        installer = get_main_installer(ctx)
+        installer_name = Path(installer["path"]).name if installer else "설치파일을 찾을 수 없음"
         
         print(f"📦 생성된 설치파일: {installer_name}")
+        for variant, variant_ctx in ctx.variants.items():
+            print(f"   • [{variant}] {variant_ctx.installer_name}")
         print(f"⏱️  소요 시간: {minutes:02d}분 {seconds:02d}초")
         print()
         
@@ -393,26 +904,22 @@ def main():
         
         print("📋 생성된 파일 목록:")
         files_created = [
-            installer_name,
-            f"{installer_name}_INFO.txt",
-            "VERSION.txt",
-            "BUILD_INFO.txt"
+            installer,
+            ctx.artifacts.get("installer_info", installer["variant"]) if installer else None,
+            ctx.artifacts.get("version_file"),
+            ctx.artifacts.get("build_info"),
+            ctx.artifacts.get("build_report")
         ]
         
-        # 빌드 리포트 파일도 패턴으로 찾기
-        report_pattern = f"{PRODUCT_NAME}_Build_Report_*.txt"
-        report_files = list(Path(".").glob(report_pattern))
-        if report_files:
-            latest_report = max(report_files, key=lambda f: f.stat().st_mtime)
-            files_created.append(latest_report.name)
-        
-        for file_name in files_created:
-            if Path(file_name).exists():
-                print(f"   ✓ {file_name}")
+        for entry in files_created:
+            if entry and ctx.artifacts.is_current(entry):
+                print(f"   ✓ {Path(entry['path']).name}")
         
         print()
         print("✅ 모든 작업이 성공적으로 완료되었습니다!")
+        print()
         
+        build_succeeded = True
         return 0
         
     except KeyboardInterrupt:
@@ -423,6 +930,18 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        # 빌드 이력 기록 및 회귀 확인 (실패한 빌드도 기록, 기준값에는 성공한 빌드만 사용)
+        if record_history:
+            record_build_history(ctx, variants, build_succeeded, time.time() - start_time,
+                                 args.time_threshold / 100, args.size_threshold / 100)
+        
+        # 빌드 추적 저장 (실패한 빌드도 어느 단계에서 멈췄는지 확인할 수 있도록 항상 저장)
+        try:
+            trace_path = ctx.tracer.write(ctx.workspace / TRACE_FILE_NAME)
+            print(f"📈 빌드 추적 저장: {trace_path.name} (chrome://tracing 또는 ui.perfetto.dev 에서 열기)")
+        except OSError as e:
+            print(f"⚠ 빌드 추적 저장 실패: {str(e)}")
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -5,106 +5,288 @@ NationalClock 프로젝트 업데이트 스크립트
 프로젝트를 빌드하고 NSIS 설치파일 생성을 위한 publish 폴더를 생성합니다.
 
 Framework-dependent (.NET 8.0 Runtime 필요)
+
+단독 실행하거나, 10_BuildAll.py 에서 단계별 함수 (restore_packages, publish_files, record_publish_manifest,
+write_version_files) 를 직접 호출하여 사용합니다.
 """
 
-import os
 import sys
-import subprocess
+import time
+import argparse
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from buildlib.artifacts import ARTIFACT_REGISTRY_NAME, ArtifactRegistry, register_artifact
+from buildlib.cache import BuildCache, hash_file, hash_sources, make_cache_key
+from buildlib.compression import describe_profile
+from buildlib.console import setup_console
+from buildlib.context import BuildContext, StepResult, resolve_workspace
+from buildlib.manifest import build_manifest, diff_manifests, format_manifest_diff, load_manifest, write_manifest
+from buildlib.process import print_failure_tail, run_streaming
+from buildlib.staging import PlacementStats, place_tree
+from buildlib.sync import sync_tree
+from buildlib.toolchain import resolve_toolchain
+from buildlib.trace import trace_span
+from buildlib.variants import (PUBLISH_VARIANTS, describe_variants, get_isolated_build_args, get_publish_args,
+                               get_restore_args, get_system_requirements, parse_variants, run_matrix, variant_context)
+from buildlib.version import get_version_properties, load_version
+
 # 출력 인코딩 설정
-if sys.stdout.encoding != 'utf-8':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
+setup_console()
 
 # ==========================================
 # 설정 (필요시 수정)
 # ==========================================
 PRODUCT_NAME = "NationalClock"
-PRODUCT_VERSION = "1.0.001"
-BUILD_DATE = "20250912_1702"
+VERSION_INFO = load_version()  # 버전 / 빌드 일시는 version.json 에서 관리
+PRODUCT_VERSION = VERSION_INFO.product_version
+BUILD_DATE = VERSION_INFO.build_date
 PROJECT_FILE = "NationalClock.csproj"
 
-def print_header():
+# 변형별 게시를 작업 프로세스에서 실행할 때 사용하는 모듈 이름
+STAGE_MODULE = "11_UpdateFromProject"
+
+# NuGet 복원 입력 (프로젝트 파일 외, 바뀌었을 때만 다시 복원)
+RESTORE_INPUT_FILES = ["Directory.Build.props", "Directory.Packages.props", "nuget.config", "packages.lock.json"]
+
+def print_header(ctx):
     """헤더 출력"""
     print("=" * 60)
     print("NationalClock 프로젝트 업데이트")
     print("Framework-dependent 빌드 (x64 최적화)")
     print("=" * 60)
     print()
-    print(f"제품명: {PRODUCT_NAME}")
-    print(f"버전: {PRODUCT_VERSION}")
-    print(f"빌드 일시: {BUILD_DATE}")
-    print(f"현재 디렉터리: {os.getcwd()}")
+    print(f"제품명: {ctx.product_name}")
+    print(f"버전: {ctx.product_version}")
+    print(f"빌드 일시: {ctx.build_date}")
+    print(f"작업 공간: {ctx.workspace}")
     print()
 
-def clean_publish_folder():
+def clean_publish_folder(ctx):
     """기존 publish 폴더 정리"""
     print("1. 이전 빌드 정리 중...")
     
-    publish_dir = Path("publish")
+    if ctx.warm_workspace:
+        return prepare_staging_folder(ctx)
+    
+    # 다른 변형의 게시 폴더는 건드리지 않음 (동시 게시)
+    publish_dir = ctx.publish_dir
     if publish_dir.exists():
         shutil.rmtree(publish_dir)
-        print("   * 기존 publish 폴더를 삭제했습니다.")
+        print(f"   * 기존 publish 폴더를 삭제했습니다: {publish_dir.name}")
+    if ctx.publish_manifest_path.exists():
+        ctx.publish_manifest_path.unlink()
     
     # 디렉터리 생성
-    publish_dir.mkdir()
-    (publish_dir / "framework-dependent").mkdir()
+    publish_dir.mkdir(parents=True)
     print("   * 새로운 publish 폴더를 생성했습니다.")
     print()
 
-def check_project_file():
+def prepare_staging_folder(ctx):
+    """준비 폴더 비우기 (publish 폴더는 유지하고 이전 매니페스트는 해시 재사용에 사용)"""
+    staging_dir = ctx.staging_dir
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+    ctx.publish_dir.mkdir(parents=True, exist_ok=True)
+    
+    ctx.publish_manifest = load_manifest(ctx.publish_manifest_path)
+    print(f"   * 준비 폴더에 게시합니다: {staging_dir}")
+    print(f"   * 기존 publish 폴더는 유지하고 변경된 파일만 동기화합니다: {ctx.publish_dir.name}")
+    print()
+
+def sync_publish_folder(ctx, source_dir, move=False):
+    """준비 폴더 (또는 캐시) 의 게시 결과를 publish 폴더에 동기화 (준비 폴더는 move=True 로 파일을 옮김)"""
+    with trace_span(ctx, "게시 폴더 동기화", "sync", variant=ctx.variant):
+        stats = sync_tree(source_dir, ctx.publish_dir, ctx.publish_manifest, move)
+    print(f"   ✓ publish 폴더 동기화: 갱신 {stats['updated']}개 ({stats['updated_bytes']:,} bytes), "
+          f"유지 {stats['unchanged']}개, 삭제 {stats['deleted']}개 (해시 계산 {stats['hashed']}개)")
+    if stats["updated"]:
+        print(f"   • 파일 배치: {stats['placement'].summary()}")
+    return stats
+
+def check_project_file(ctx):
     """프로젝트 파일 확인"""
     print("2. 프로젝트 파일 확인 중...")
     
-    project_path = Path("..") / "NationalClock" / PROJECT_FILE
+    project_path = ctx.project_file
     if not project_path.exists():
         print(f"   ❌ 프로젝트 파일을 찾을 수 없습니다: {project_path}")
         return False
-        
+    
     print(f"   ✓ 프로젝트 파일 확인됨: {project_path}")
     return True
 
-def build_project():
-    """프로젝트 빌드 (.NET 8.0)"""
-    print("3. NationalClock 프로젝트 빌드 중...")
+def get_dotnet_version(use_cache=True):
+    """.NET SDK 버전 확인 (캐시 키에 포함, 확인 결과는 도구 캐시에서 재사용)"""
+    return resolve_toolchain(need_nsis=False, use_cache=use_cache).dotnet_version
+
+def compute_build_cache_key(ctx):
+    """빌드 캐시 키 계산 (소스 해시 + 툴체인 버전 + 게시 인자)"""
+    print("3. 빌드 캐시 확인 중...")
+    
+    # 10_BuildAll.py 에서 이미 확인한 버전이 있으면 재사용
+    if ctx.dotnet_version is None:
+        ctx.dotnet_version = get_dotnet_version(ctx.use_cache)
+    
+    if ctx.dotnet_version is None:
+        print("   ⚠ .NET SDK 버전을 확인할 수 없어 캐시를 사용하지 않습니다.")
+        return None
+    
+    with trace_span(ctx, "소스 해시", "hash", variant=ctx.variant):
+        sources_hash = hash_sources(ctx.project_dir)
+    cache_key = make_cache_key("publish", ctx.dotnet_version, get_publish_args(ctx.variant),
+                               get_version_properties(ctx), sources_hash)
     
-    project_path = Path("..") / "NationalClock"
-    os.chdir(project_path)
+    print(f"   • .NET SDK: {ctx.dotnet_version}")
+    print(f"   • 캐시 키: {cache_key[:16]}")
+    return cache_key
+
+def restore_publish_from_cache(ctx, cache_key):
+    """캐시에 저장된 publish 폴더 복원 (적중 시 True)"""
+    cache = BuildCache("publish")
     
+    # 조회와 복원 사이에 다른 빌드가 항목을 정리하지 않도록 잠금 유지
+    with cache.lock():
+        meta = cache.lookup(cache_key)
+        if meta is None:
+            print("   • 캐시 없음: 전체 빌드를 수행합니다.")
+            return False
+        
+        if ctx.warm_workspace:
+            # 캐시에서 바뀐 파일만 가져옴 (유지된 파일은 이전 매니페스트로 해시 재사용)
+            sync_publish_folder(ctx, cache.payload_path(cache_key))
+        else:
+            placement = cache.restore_tree(cache_key, ctx.publish_dir)
+            print(f"   • 파일 배치: {placement.summary()}")
+            
+            # 캐시에 함께 저장된 매니페스트는 검증 단계에서 해시 재사용에 사용 (수정 시각이 유지되므로)
+            ctx.publish_manifest = meta.get("manifest")
+    print(f"   ✓ 캐시 적중: {meta.get('created', '?')} 빌드 결과를 복원했습니다.")
+    print("   ✓ dotnet build/publish 단계를 건너뜁니다.")
+    return True
+
+def store_publish_to_cache(ctx, cache_key):
+    """검증이 끝난 publish 폴더를 캐시에 저장"""
     try:
-        # Clean 빌드
-        print("   • Clean 빌드 수행 중...")
-        result = subprocess.run([
-            "dotnet", "clean",
-            "--configuration", "Release",
-            "--verbosity", "quiet"
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+        placement = BuildCache("publish").store_tree(cache_key, ctx.publish_dir, {
+            "product_version": ctx.product_version,
+            "build_date": ctx.build_date,
+            "publish_args": get_publish_args(ctx.variant),
+            "manifest": ctx.publish_manifest
+        })
+        print(f"   ✓ 빌드 결과를 캐시에 저장했습니다: {cache_key[:16]}")
+        print(f"   • 파일 배치: {placement.summary()}")
+    except Exception as e:
+        print(f"   ⚠ 캐시 저장 실패 (빌드는 계속 진행): {str(e)}")
+
+def is_dotnet_diagnostic(line):
+    """실행 중 바로 출력할 dotnet 출력 줄 (오류/경고)"""
+    return ": error " in line or ": warning " in line
+
+def compute_restore_key(ctx, restore_args):
+    """패키지 복원 입력 해시 (프로젝트 파일, NuGet / MSBuild 설정 파일, 복원 인자 - 소스 파일은 제외)"""
+    inputs = [ctx.project_file, *(ctx.project_dir / name for name in RESTORE_INPUT_FILES)]
+    return make_cache_key("restore", restore_args, {path.name: hash_file(path) for path in inputs if path.exists()})
+
+def restore_packages(ctx, variants=None):
+    """NuGet 패키지 미리 복원 (10_BuildAll.py 에서 도구 확인 / 이전 빌드 정리와 동시에 실행)
+    
+    게시할 변형과 같은 런타임으로 복원하여 이후 build / publish 는 NuGet 전역 패키지 폴더에서 바로 가져옵니다.
+    변형별 obj 폴더를 쓰는 경우 (작업 공간 지정, 변형 매트릭스) 그 폴더에 복원합니다.
+    패키지 참조가 마지막으로 복원했을 때와 같으면 복원하지 않습니다 (캐시 적중 빌드에서 시간을 쓰지 않도록).
+    실패해도 빌드를 중단하지 않습니다 (build / publish 에서 다시 복원).
+    """
+    start_time = time.time()
+    result = StepResult("restore", True)
+    variants = variants or [ctx.variant]
+    
+    # 변형 매트릭스는 항상 변형별 obj 폴더에 게시 (update_variants)
+    isolated = ctx.isolated_build or len(variants) > 1
+    
+    for variant in variants:
+        work_dir = variant_context(ctx, variant, isolated).work_dir
+        restore_args = [*get_restore_args(variant), *(get_isolated_build_args(work_dir) if isolated else [])]
+        restore_key = compute_restore_key(ctx, restore_args)
+        stamp_path = ctx.state_dir / "restore" / f"{variant}.key"
+        try:
+            with open(stamp_path, "r", encoding="utf-8") as f:
+                restored_key = f.read().strip()
+        except OSError:
+            restored_key = None
+        if ctx.use_cache and restored_key == restore_key:
+            print(f"   ✓ {variant}: 패키지 참조가 바뀌지 않아 복원을 건너뜁니다.")
+            result.cache_hit = True
+            continue
         
-        if result.returncode != 0:
-            print(f"   ❌ Clean 실패: {result.stderr}")
-            return False
-        print("   ✓ Clean 완료")
+        print(f"   • {variant} 패키지 복원 중...")
+        try:
+            process = run_streaming([
+                "dotnet", "restore", str(ctx.project_file),
+                *restore_args,
+                "--verbosity", "quiet"
+            ], cwd=ctx.project_dir, log_name=f"{variant}/dotnet_restore.log", log_dir=ctx.log_dir,
+               highlight=is_dotnet_diagnostic, tracer=ctx.tracer)
+        except FileNotFoundError:
+            print("   ⚠ dotnet 명령을 찾을 수 없어 패키지 복원을 건너뜁니다.")
+            break
+        
+        if process.returncode != 0:
+            print(f"   ⚠ 패키지 복원 실패 (게시 단계에서 다시 복원): {process.log_path}")
+            continue
+        
+        print(f"   ✓ 복원 완료 ({process.elapsed:.1f}초)")
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(stamp_path, "w", encoding="utf-8") as f:
+            f.write(restore_key)
+    
+    result.elapsed = time.time() - start_time
+    return result
+
+def build_project(ctx):
+    """프로젝트 빌드 (.NET 8.0)
+    
+    기본값은 증분 빌드입니다 (버전 / 빌드 일시는 -p: 속성으로만 전달되므로 버전을 올려도 obj 상태를 재사용).
+    ctx.clean_build (--clean) 이면 먼저 dotnet clean 을 수행합니다.
+    """
+    print("4. NationalClock 프로젝트 빌드 중...")
+    
+    try:
+        # Clean 빌드 (--clean 지정 시에만)
+        if ctx.clean_build:
+            print("   • Clean 빌드 수행 중...")
+            result = run_streaming([
+                "dotnet", "clean",
+                "--configuration", "Release",
+                "--verbosity", "quiet"
+            ], cwd=ctx.project_dir, log_name=f"{ctx.variant}/dotnet_clean.log", log_dir=ctx.log_dir,
+               highlight=is_dotnet_diagnostic, tracer=ctx.tracer)
+            
+            if result.returncode != 0:
+                print("   ❌ Clean 실패:")
+                print_failure_tail(result)
+                return False
+            print(f"   ✓ Clean 완료 ({result.elapsed:.1f}초)")
         
         # 빌드
         print("   • 프로젝트 빌드 중...")
-        result = subprocess.run([
+        result = run_streaming([
             "dotnet", "build",
             "--configuration", "Release",
+            *get_version_properties(ctx),
             "--verbosity", "quiet"
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+        ], cwd=ctx.project_dir, log_name=f"{ctx.variant}/dotnet_build.log", log_dir=ctx.log_dir, highlight=is_dotnet_diagnostic,
+           tracer=ctx.tracer)
         
         if result.returncode != 0:
             print(f"   ❌ 빌드 실패:")
-            print(f"   {result.stderr}")
+            print_failure_tail(result)
             return False
-        print("   ✓ 빌드 완료")
+        print(f"   ✓ 빌드 완료 ({result.elapsed:.1f}초)")
         
         return True
-        
+    
     except FileNotFoundError:
         print("   ❌ dotnet 명령을 찾을 수 없습니다.")
         print("   .NET 8.0 SDK가 설치되어 있는지 확인하세요.")
@@ -113,40 +295,66 @@ def build_project():
         print(f"   ❌ 빌드 중 오류 발생: {str(e)}")
         return False
 
-def publish_project():
-    """Framework-dependent 방식으로 게시"""
-    print("4. Framework-dependent 게시 중...")
+def publish_project(ctx):
+    """변형별 런타임/배포 방식으로 게시"""
+    print(f"5. {ctx.variant} 게시 중...")
+    
+    publish_path = ctx.staging_dir if ctx.warm_workspace else ctx.publish_dir
     
-    publish_path = Path("..") / "NSIS_installer" / "publish" / "framework-dependent"
+    # 동시 게시 시 변형별 obj/bin 폴더 사용 (별도 clean/build 없이 publish 가 빌드까지 수행)
+    isolated_args = get_isolated_build_args(ctx.work_dir) if ctx.isolated_build else []
     
     try:
         # Publish 실행
-        result = subprocess.run([
+        result = run_streaming([
             "dotnet", "publish",
-            "--configuration", "Release",
-            "--runtime", "win-x64",
-            "--self-contained", "false",
+            *get_publish_args(ctx.variant),
+            *get_version_properties(ctx),
+            *isolated_args,
             "--output", str(publish_path.absolute()),
             "--verbosity", "quiet"
-        ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+        ], cwd=ctx.project_dir, log_name=f"{ctx.variant}/dotnet_publish.log", log_dir=ctx.log_dir, highlight=is_dotnet_diagnostic,
+           tracer=ctx.tracer)
         
         if result.returncode != 0:
             print(f"   ❌ 게시 실패:")
-            print(f"   {result.stderr}")
+            print_failure_tail(result)
             return False
-            
-        print(f"   ✓ 게시 완료: {publish_path}")
-        return True
         
+        print(f"   ✓ 게시 완료 ({result.elapsed:.1f}초): {publish_path}")
+        
+        if ctx.warm_workspace:
+            copy_project_resources(ctx, publish_path / "Resources")
+            sync_publish_folder(ctx, publish_path, move=True)
+        return True
+    
+    except FileNotFoundError:
+        print("   ❌ dotnet 명령을 찾을 수 없습니다.")
+        return False
     except Exception as e:
         print(f"   ❌ 게시 중 오류 발생: {str(e)}")
         return False
 
-def verify_published_files():
+def copy_project_resources(ctx, resources_path):
+    """게시 결과에 Resources 폴더가 없으면 프로젝트의 Resources 폴더에서 배치 (reflink → 하드링크 → 복사)"""
+    if resources_path.exists():
+        return True
+    
+    project_resources = ctx.project_dir / "Resources"
+    if not project_resources.exists():
+        print("   ⚠ 프로젝트 Resources 폴더를 찾을 수 없습니다.")
+        return False
+    
+    placement = PlacementStats()
+    place_tree(project_resources, resources_path, placement)
+    print(f"   ✓ Resources 폴더 배치됨: {placement.summary()}")
+    return True
+
+def verify_published_files(ctx):
     """게시된 파일 검증"""
-    print("5. 게시 파일 검증 중...")
+    print("6. 게시 파일 검증 중...")
     
-    publish_path = Path("..") / "NSIS_installer" / "publish" / "framework-dependent"
+    publish_path = ctx.publish_dir
     
     # 필수 파일 확인
     required_files = [
@@ -172,17 +380,10 @@ def verify_published_files():
     resources_path = publish_path / "Resources"
     if not resources_path.exists():
         print("   • Resources 폴더를 찾을 수 없어 복사합니다.")
-        
-        # 프로젝트의 Resources 폴더에서 복사
-        project_resources = Path("..") / "NationalClock" / "Resources"
-        if project_resources.exists():
-            shutil.copytree(project_resources, resources_path)
-            print("   ✓ Resources 폴더 복사됨")
-        else:
-            print("   ⚠ 프로젝트 Resources 폴더를 찾을 수 없습니다.")
+        copy_project_resources(ctx, resources_path)
     else:
         print("   ✓ Resources 폴더 확인됨")
-        
+    
     # 아이콘 파일 확인
     icon_file = resources_path / "NationalClock.ico"
     if icon_file.exists():
@@ -190,70 +391,117 @@ def verify_published_files():
     else:
         print("   ⚠ NationalClock.ico 파일을 찾을 수 없습니다.")
     
-    # 게시 파일 크기 확인
-    total_size = 0
-    file_count = 0
-    for file_path in publish_path.rglob("*"):
-        if file_path.is_file():
-            total_size += file_path.stat().st_size
-            file_count += 1
+    return True
+
+def record_publish_manifest(ctx):
+    """게시 폴더 매니페스트 생성 및 이전 빌드와 비교 (검증된 게시 결과는 이어서 캐시에 저장)"""
+    print("7. 게시 매니페스트 생성 중...")
+    
+    publish_path = ctx.publish_dir
+    
+    # 게시 파일 매니페스트 생성 (폴더를 한 번만 읽고 이후 단계에서 재사용)
+    with trace_span(ctx, "게시 매니페스트", "hash", variant=ctx.variant):
+        manifest = build_manifest(publish_path, previous=ctx.publish_manifest)
+        write_manifest(manifest, ctx.publish_manifest_path)
+    ctx.publish_manifest = manifest
+    register_artifact(ctx, "publish", publish_path, "update", manifest["total_size"], manifest["tree_hash"])
+    register_artifact(ctx, "publish_manifest", ctx.publish_manifest_path, "update")
     
+    file_count = manifest["file_count"]
+    total_size = manifest["total_size"]
     print(f"   ✓ 총 {file_count}개 파일, 크기: {total_size // 1024 // 1024} MB")
+    print(f"   ✓ 매니페스트 저장: {ctx.publish_manifest_path.name} (해시 계산 {manifest['hashed_count']}개)")
+    
+    # 이전 빌드 매니페스트와 비교 (비교 기준은 따로 보관 - 이어서 실행할 때 같은 비교 정보를 다시 계산)
+    previous_path = ctx.previous_manifest_path
+    previous = load_manifest(previous_path)
+    ctx.publish_diff = diff_manifests(previous, manifest)
+    print("   • 이전 빌드 대비 게시 파일 변경:")
+    for line in format_manifest_diff(ctx.publish_diff, limit=10):
+        print(f"     {line}")
+    if previous is not None:
+        write_manifest(previous, ctx.baseline_manifest_path)
+    else:
+        ctx.baseline_manifest_path.unlink(missing_ok=True)
+    write_manifest(manifest, previous_path)
+    
+    # 검증된 게시 결과 캐시 저장 (캐시에서 복원한 경우 제외)
+    if ctx.publish_cache_key is not None:
+        store_publish_to_cache(ctx, ctx.publish_cache_key)
     return True
 
-def update_version_info():
-    """VERSION.txt 파일 업데이트"""
-    print("6. 버전 정보 업데이트 중...")
+def load_publish_manifest(ctx):
+    """이전 실행에서 기록한 게시 매니페스트와 비교 정보를 ctx 에 복원 (매니페스트가 없으면 False)
     
-    os.chdir(Path("..") / "NSIS_installer")
+    10_BuildAll.py --resume / --only 로 매니페스트 단계를 실행하지 않을 때 이후 단계 (보고서, 빌드 이력) 에서 사용합니다.
+    """
+    manifest = load_manifest(ctx.publish_manifest_path)
+    if manifest is None:
+        return False
+    ctx.publish_manifest = manifest
+    ctx.publish_diff = diff_manifests(load_manifest(ctx.baseline_manifest_path), manifest)
+    return True
+
+def update_version_info(ctx, variants=None):
+    """VERSION.txt 파일 업데이트 (variants: 게시한 변형 목록, 기본값은 ctx 변형)"""
+    print("8. 버전 정보 업데이트 중...")
     
-    version_content = f"""{PRODUCT_NAME} v{PRODUCT_VERSION}
-빌드 일시: {BUILD_DATE}
-설치파일: {PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_{BUILD_DATE}_Setup.exe
-아키텍처: x64
-배포 형식: Framework-dependent
-요구사항: .NET 8.0 Desktop Runtime
-설치 경로: C:\\Program Files\\{PRODUCT_NAME}
-압축 방식: LZMA
+    product_name = ctx.product_name
+    variants = variants or [ctx.variant]
+    architecture, deployment = describe_variants(variants)
+    requirements = ", ".join(get_system_requirements(variants)) or "-"
+    version_content = f"""{product_name} v{ctx.product_version}
+빌드 일시: {ctx.build_date}
+설치파일: {ctx.installer_name}
+아키텍처: {architecture}
+배포 형식: {deployment}
+요구사항: {requirements}
+설치 경로: C:\\Program Files\\{product_name}
+압축 방식: {describe_profile(ctx.compression)}
 개발사: Green Power Co., Ltd.
 목적: 다중 시간대 월드 클록 WPF 애플리케이션
 """
     
-    with open("VERSION.txt", "w", encoding="utf-8") as f:
+    version_file = ctx.workspace / "VERSION.txt"
+    with open(version_file, "w", encoding="utf-8") as f:
         f.write(version_content)
     
+    register_artifact(ctx, "version_file", version_file, "update", variant=None)
     print("   ✓ VERSION.txt 업데이트 완료")
+    return version_file
 
-def update_build_info():
-    """BUILD_INFO.txt 파일 업데이트"""
-    print("7. 빌드 정보 업데이트 중...")
+def update_build_info(ctx, variants=None):
+    """BUILD_INFO.txt 파일 업데이트 (variants: 게시한 변형 목록, 기본값은 ctx 변형)"""
+    print("9. 빌드 정보 업데이트 중...")
     
+    product_name = ctx.product_name
+    variants = variants or [ctx.variant]
+    architecture, deployment = describe_variants(variants)
+    requirements = "".join(f"- {line}\n" for line in get_system_requirements(variants))
     build_info_content = f"""==================================================
-{PRODUCT_NAME} 빌드 정보
+{product_name} 빌드 정보
 ==================================================
 
-제품명: {PRODUCT_NAME}
-버전: {PRODUCT_VERSION}
-빌드 일시: {BUILD_DATE}
-설치파일: {PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_{BUILD_DATE}_Setup.exe
+제품명: {product_name}
+버전: {ctx.product_version}
+빌드 일시: {ctx.build_date}
+설치파일: {ctx.installer_name}
 
 기술 정보:
 - 플랫폼: .NET 8.0
-- 아키텍처: x64
-- 배포: Framework-dependent
+- 아키텍처: {architecture}
+- 배포: {deployment}
 - UI: WPF with Material Design
-- 압축: LZMA
+- 압축: {describe_profile(ctx.compression)}
 
 설치 정보:
-- 설치 경로: C:\\Program Files\\{PRODUCT_NAME}
-- 사용자 데이터: %LocalAppData%\\{PRODUCT_NAME}
+- 설치 경로: C:\\Program Files\\{product_name}
+- 사용자 데이터: %LocalAppData%\\{product_name}
 - 바로가기: 데스크톱, 시작메뉴
 - 자동 시작: 선택사항
 
 시스템 요구사항:
-- Windows 10 이상 (x64)
-- .NET 8.0 Desktop Runtime
-- Material Design UI 지원
+{requirements}- Material Design UI 지원
 
 주요 기능:
 - 다중 시간대 실시간 표시
@@ -263,48 +511,188 @@ def update_build_info():
 - MVVM 패턴 기반 WPF 아키텍처
 """
     
-    with open("BUILD_INFO.txt", "w", encoding="utf-8") as f:
+    build_info_file = ctx.workspace / "BUILD_INFO.txt"
+    with open(build_info_file, "w", encoding="utf-8") as f:
         f.write(build_info_content)
     
+    register_artifact(ctx, "build_info", build_info_file, "update", variant=None)
     print("   ✓ BUILD_INFO.txt 업데이트 완료")
+    return build_info_file
+
+def publish_files(ctx):
+    """게시 변형 하나에 대한 정리/빌드/게시/검증 (1~6, 매니페스트와 캐시 저장은 record_publish_manifest)"""
+    start_time = time.time()
+    result = StepResult(f"publish:{ctx.variant}", False)
+    ctx.publish_cache_key = None
+    
+    # 1. 폴더 정리
+    clean_publish_folder(ctx)
+    
+    # 2. 프로젝트 파일 확인
+    if not check_project_file(ctx):
+        return result
+    
+    # 3. 빌드 캐시 확인
+    cache_key = compute_build_cache_key(ctx) if ctx.use_cache else None
+    result.cache_hit = cache_key is not None and restore_publish_from_cache(ctx, cache_key)
+    print()
+    
+    if not result.cache_hit:
+        # 4. 프로젝트 빌드 (동시 게시 중에는 공유 obj 폴더를 쓰지 않도록 publish 에 맡김)
+        if not ctx.isolated_build and not build_project(ctx):
+            return result
+        
+        # 5. 프로젝트 게시
+        if not publish_project(ctx):
+            return result
+        ctx.publish_cache_key = cache_key
+    
+    # 6. 게시 파일 검증
+    with trace_span(ctx, "게시 파일 검증", variant=ctx.variant):
+        verified = verify_published_files(ctx)
+    if not verified:
+        return result
+    
+    result.success = True
+    result.artifacts = {"publish_dir": ctx.publish_dir}
+    result.elapsed = time.time() - start_time
+    return result
+
+def publish_variant(ctx):
+    """게시 변형 하나에 대한 정리/빌드/게시/검증/매니페스트 (1~7)"""
+    start_time = time.time()
+    result = publish_files(ctx)
+    if not result.success:
+        return result
+    
+    # 7. 게시 매니페스트 (검증된 게시 결과 캐시 저장)
+    if not record_publish_manifest(ctx):
+        result.success = False
+        return result
+    
+    result.artifacts["manifest"] = ctx.publish_manifest_path
+    result.elapsed = time.time() - start_time
+    return result
+
+def write_version_files(ctx, variants=None):
+    """버전 / 빌드 정보 파일 기록 (8~9, 게시 결과와 무관하므로 10_BuildAll.py 에서는 설치파일 생성과 동시에 실행)
+    
+    여러 변형이 함께 쓰는 파일이므로 variants 에 게시한 변형 목록을 넘깁니다 (기본값은 ctx 변형).
+    """
+    start_time = time.time()
+    result = StepResult("version_info", True)
+    
+    # 8. 버전 정보 업데이트
+    result.artifacts["version_file"] = update_version_info(ctx, variants)
+    
+    # 9. 빌드 정보 업데이트
+    result.artifacts["build_info_file"] = update_build_info(ctx, variants)
+    
+    result.elapsed = time.time() - start_time
+    return result
+
+def update_project(ctx):
+    """프로젝트 업데이트 단계 실행 (10_BuildAll.py 에서 직접 호출)"""
+    start_time = time.time()
+    result = publish_variant(ctx)
+    result.name = "update"
+    if not result.success:
+        return result
+    
+    # 8~9. 버전 / 빌드 정보 업데이트
+    result.artifacts.update(write_version_files(ctx).artifacts)
+    result.elapsed = time.time() - start_time
+    ctx.results[result.name] = result
+    return result
+
+def update_variants(ctx, variants, jobs=None, publish_only=False):
+    """여러 게시 변형을 프로세스 풀에서 동시에 게시 (변형별 컨텍스트는 ctx.variants 에 저장)
+    
+    publish_only=True 이면 변형별 1~6 만 수행합니다 (매니페스트 / 버전 파일은 10_BuildAll.py 의 별도 단계).
+    """
+    start_time = time.time()
+    result = StepResult("update", False)
+    
+    print(f"• 게시 변형 {len(variants)}개 동시 게시: {', '.join(variants)} (동시 작업: {jobs or '자동'})")
+    print()
+    
+    # 도구 버전은 작업 프로세스마다 다시 확인하지 않도록 미리 확인
+    if ctx.use_cache and ctx.dotnet_version is None:
+        ctx.dotnet_version = get_dotnet_version()
+    
+    contexts = [variant_context(ctx, variant, isolated_build=True) for variant in variants]
+    failed = []
+    stage_func = "publish_files" if publish_only else "publish_variant"
+    for variant_ctx, variant_result in run_matrix(STAGE_MODULE, stage_func, contexts, jobs):
+        ctx.variants[variant_ctx.variant] = variant_ctx
+        if variant_result is None or not variant_result.success:
+            failed.append(variant_ctx.variant)
+            continue
+        variant_ctx.results[variant_result.name] = variant_result
+        result.cache_hit = result.cache_hit or variant_result.cache_hit
+        result.artifacts[variant_ctx.variant] = variant_ctx.publish_dir
+    
+    if failed:
+        print(f"   ❌ 게시 실패 변형: {', '.join(failed)}")
+        return result
+    
+    # 8~9. 버전/빌드 정보는 한 번만 기록
+    if not publish_only:
+        result.artifacts.update(write_version_files(ctx, variants).artifacts)
+    
+    result.success = True
+    result.elapsed = time.time() - start_time
+    ctx.results[result.name] = result
+    return result
+
+def setup_argparse():
+    """명령행 인자 설정"""
+    parser = argparse.ArgumentParser(description=f'{PRODUCT_NAME} 프로젝트 빌드 및 게시')
+    parser.add_argument('--no-cache', action='store_true', help='빌드 캐시를 사용하지 않고 항상 전체 빌드 수행')
+    parser.add_argument('--clean', action='store_true', help='빌드 전에 dotnet clean 수행 (기본값: 증분 빌드)')
+    parser.add_argument('--variants', type=str, default=None,
+                        help=f'게시 변형 목록 (쉼표 구분 또는 all, 사용 가능: {", ".join(PUBLISH_VARIANTS)})')
+    parser.add_argument('--jobs', type=int, default=None, help='동시 게시 작업 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--warm-workspace', action='store_true',
+                        help='publish 폴더를 삭제하지 않고 준비 폴더에 게시한 뒤 변경된 파일만 동기화')
+    parser.add_argument('--workspace', type=str, default=None,
+                        help='빌드 작업 공간 (기본값: 스크립트 폴더, 지정하면 obj/bin 도 작업 공간별로 분리하여 동시 빌드 가능)')
+    return parser
 
 def main():
     """메인 실행 함수"""
-    print_header()
+    parser = setup_argparse()
+    args = parser.parse_args()
+    try:
+        variants = parse_variants(args.variants)
+    except ValueError as e:
+        parser.error(str(e))
     
-    # 현재 위치를 NSIS_installer로 변경
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    ctx = BuildContext(
+        product_name=PRODUCT_NAME,
+        product_version=PRODUCT_VERSION,
+        assembly_version=VERSION_INFO.assembly_version,
+        build_date=BUILD_DATE,
+        script_dir=Path(__file__).resolve().parent,
+        project_file_name=PROJECT_FILE,
+        use_cache=not args.no_cache,
+        warm_workspace=args.warm_workspace,
+        clean_build=args.clean,
+        workspace_dir=resolve_workspace(args.workspace)
+    )
+    ctx.isolated_build = ctx.workspace_dir is not None
+    ctx.artifacts = ArtifactRegistry(ctx.workspace / ARTIFACT_REGISTRY_NAME)
+    
+    print_header(ctx)
     
     try:
-        # 1. 폴더 정리
-        clean_publish_folder()
-        
-        # 2. 프로젝트 파일 확인
-        if not check_project_file():
-            return 1
-        
-        # 3. 프로젝트 빌드
-        if not build_project():
-            return 1
-        
-        # 4. 프로젝트 게시
-        if not publish_project():
-            return 1
-        
-        # 5. 게시 파일 검증
-        if not verify_published_files():
+        if variants == [ctx.variant]:
+            result = update_project(ctx)
+        else:
+            result = update_variants(ctx, variants, args.jobs)
+        if not result.success:
             return 1
         
-        # NSIS_installer 디렉터리로 이동
-        os.chdir(script_dir)
-        
-        # 6. 버전 정보 업데이트
-        update_version_info()
-        
-        # 7. 빌드 정보 업데이트
-        update_build_info()
-        
         print()
         print("=" * 60)
         print("✅ 프로젝트 업데이트 완료!")
@@ -316,7 +704,7 @@ def main():
         print()
         
         return 0
-        
+    
     except KeyboardInterrupt:
         print("\n❌ 사용자에 의해 중단되었습니다.")
         return 1
@@ -325,4 +713,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -6,29 +6,49 @@ NSIS 컴파일러를 사용하여 Windows 설치파일을 생성합니다.
 
 파일명 형식: NationalClock_v1.0.001_Build_20250909_2006_Setup.exe
 아키텍처: x64 최적화
-압축: LZMA 고압축 적용
+압축: LZMA 고압축 적용 (--compression 으로 변경, --benchmark-compression 으로 프로필 비교)
+
+단독 실행하거나, 10_BuildAll.py 에서 단계별 함수 (compile_installer, check_installer, create_installer_info) 를
+직접 호출하여 사용합니다.
 """
 
 import os
 import sys
-import subprocess
+import time
+import argparse
 import shutil
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from buildlib.artifacts import ARTIFACT_REGISTRY_NAME, ArtifactRegistry, register_artifact
+from buildlib.cache import BuildCache, hash_file, make_cache_key
+from buildlib.compression import (COMPRESSION_PROFILES, describe_profile, estimate_extraction_seconds,
+                                  get_compression_defines, load_selected_profile, save_benchmark, select_profile)
+from buildlib.console import setup_console
+from buildlib.context import BuildContext, StepResult, resolve_workspace
+from buildlib.manifest import build_manifest, load_manifest, write_manifest
+from buildlib.process import print_failure_tail, run_streaming
+from buildlib.toolchain import resolve_toolchain
+from buildlib.trace import trace_span
+from buildlib.variants import (PUBLISH_VARIANTS, describe_variant, get_system_requirements, parse_variants, run_matrix,
+                               variant_context)
+from buildlib.version import load_version
 
 # 출력 인코딩 설정
-if sys.stdout.encoding != 'utf-8':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
+setup_console()
 
 # ==========================================
 # 설정 (필요시 수정)
 # ==========================================
 PRODUCT_NAME = "NationalClock"
-PRODUCT_VERSION = "1.0.001"
-BUILD_DATE = "20250912_1702"
+VERSION_INFO = load_version()  # 버전 / 빌드 일시는 version.json 에서 관리
+PRODUCT_VERSION = VERSION_INFO.product_version
+BUILD_DATE = VERSION_INFO.build_date
 NSIS_SCRIPT = "NationalClock_Installer.nsi"
+
+# 변형별 설치파일을 작업 프로세스에서 만들 때 사용하는 모듈 이름
+STAGE_MODULE = "12_BuildInstaller"
 NSIS_PATH = r"C:\Program Files (x86)\NSIS\makensis.exe"
 
 # Alternative NSIS paths
@@ -39,31 +59,33 @@ NSIS_PATHS = [
     r"D:\Program Files\NSIS\makensis.exe"
 ]
 
-def print_header():
+def print_header(ctx):
     """헤더 출력"""
     print("=" * 70)
     print("NationalClock NSIS 설치파일 빌드")
     print("Framework-dependent x64 최적화 버전")
     print("=" * 70)
     print()
-    print(f"제품명: {PRODUCT_NAME}")
-    print(f"버전: {PRODUCT_VERSION}")
-    print(f"빌드 일시: {BUILD_DATE}")
-    print(f"현재 디렉터리: {os.getcwd()}")
+    print(f"제품명: {ctx.product_name}")
+    print(f"버전: {ctx.product_version}")
+    print(f"빌드 일시: {ctx.build_date}")
+    print(f"작업 공간: {ctx.workspace}")
     print()
 
-def find_nsis():
-    """NSIS 설치 경로 찾기"""
+def find_nsis(ctx):
+    """NSIS 설치 경로 찾기 (PATH 및 후보 경로, 확인 결과는 캐시에서 재사용)"""
     print("1. NSIS 설치 확인 중...")
     
-    for nsis_path in NSIS_PATHS:
-        if Path(nsis_path).exists():
-            print(f"   ✓ NSIS 발견: {nsis_path}")
-            return nsis_path
+    toolchain = resolve_toolchain(nsis_paths=NSIS_PATHS, need_dotnet=False, use_cache=ctx.use_cache)
+    if toolchain.nsis_path:
+        ctx.nsis_version = toolchain.nsis_version
+        cache_note = " (캐시)" if "nsis" in toolchain.cached_tools else ""
+        print(f"   ✓ NSIS 발견: {toolchain.nsis_path} ({toolchain.nsis_version}){cache_note}")
+        return toolchain.nsis_path
     
     print("   ❌ NSIS를 찾을 수 없습니다.")
     print("   다음 경로를 확인했습니다:")
-    for path in NSIS_PATHS:
+    for path in toolchain.nsis_candidates:
         print(f"   • {path}")
     print()
     print("   해결방법:")
@@ -73,23 +95,23 @@ def find_nsis():
     
     return None
 
-def check_nsis_script():
+def check_nsis_script(ctx):
     """NSIS 스크립트 파일 확인"""
     print("2. NSIS 스크립트 확인 중...")
     
-    if not Path(NSIS_SCRIPT).exists():
-        print(f"   ❌ NSIS 스크립트를 찾을 수 없습니다: {NSIS_SCRIPT}")
+    if not ctx.nsis_script.exists():
+        print(f"   ❌ NSIS 스크립트를 찾을 수 없습니다: {ctx.nsis_script_name}")
         print("   11_UpdateFromProject.py를 먼저 실행하세요.")
         return False
     
-    print(f"   ✓ NSIS 스크립트 확인: {NSIS_SCRIPT}")
+    print(f"   ✓ NSIS 스크립트 확인: {ctx.nsis_script_name}")
     return True
 
-def check_publish_folder():
+def check_publish_folder(ctx):
     """게시 폴더 확인"""
     print("3. 게시 폴더 확인 중...")
     
-    publish_path = Path("publish") / "framework-dependent"
+    publish_path = ctx.publish_dir
     if not publish_path.exists():
         print(f"   ❌ 게시 폴더를 찾을 수 없습니다: {publish_path}")
         print("   11_UpdateFromProject.py를 먼저 실행하세요.")
@@ -115,58 +137,138 @@ def check_publish_folder():
     print(f"   ✓ 게시 폴더 확인됨: {publish_path}")
     return True
 
-def build_installer(nsis_exe_path):
+def get_nsis_defines(ctx):
+    """makensis /D 정의 목록 (설치파일 캐시 키에도 포함됨)"""
+    defines = {
+        "BUILD_DATE": ctx.build_date,
+        "PRODUCT_NAME": ctx.product_name,
+        "PRODUCT_VERSION": ctx.product_version,
+        "PUBLISH_DIR": str(PureWindowsPath(ctx.publish_dir.relative_to(ctx.workspace)))
+    }
+    if ctx.installer_suffix:
+        defines["OUTFILE_SUFFIX"] = ctx.installer_suffix
+    defines.update(get_compression_defines(ctx.compression))
+    return defines
+
+def get_publish_manifest(ctx):
+    """게시 폴더 매니페스트 (11단계에서 만든 것을 재사용, 단독 실행 시 저장된 JSON 기준으로 변경분만 해시)"""
+    if ctx.publish_manifest is None:
+        previous = load_manifest(ctx.publish_manifest_path)
+        manifest = build_manifest(ctx.publish_dir, previous=previous)
+        if previous is None or manifest["tree_hash"] != previous["tree_hash"]:
+            write_manifest(manifest, ctx.publish_manifest_path)
+        ctx.publish_manifest = manifest
+    
+    return ctx.publish_manifest
+
+def compute_installer_cache_key(ctx):
+    """설치파일 캐시 키 계산 (게시 폴더 + NSIS 스크립트 + /D 정의 + makensis 버전)"""
+    print("4. 설치파일 캐시 확인 중...")
+    
+    # 10_BuildAll.py / find_nsis 에서 확인한 버전을 재사용 (없으면 도구 캐시를 거쳐 확인)
+    if ctx.nsis_version is None:
+        toolchain = resolve_toolchain(nsis_paths=NSIS_PATHS, need_dotnet=False, use_cache=ctx.use_cache)
+        ctx.nsis_version = toolchain.nsis_version
+    
+    if ctx.nsis_version is None:
+        print("   ⚠ makensis 버전을 확인할 수 없어 캐시를 사용하지 않습니다.")
+        return None
+    
+    with trace_span(ctx, "설치파일 입력 해시", "hash", variant=ctx.variant):
+        publish_hash = get_publish_manifest(ctx)["tree_hash"]
+        script_hash = hash_file(ctx.nsis_script)
+    cache_key = make_cache_key("installer", ctx.nsis_version, get_nsis_defines(ctx), script_hash, publish_hash)
+    
+    print(f"   • makensis: {ctx.nsis_version}")
+    print(f"   • 캐시 키: {cache_key[:16]}")
+    return cache_key
+
+def restore_installer_from_cache(ctx, cache_key):
+    """캐시에 저장된 설치파일 재사용 (적중 시 True)"""
+    cache = BuildCache("installer")
+    
+    # 조회와 복원 사이에 다른 빌드가 항목을 정리하지 않도록 잠금 유지
+    with cache.lock():
+        meta = cache.lookup(cache_key)
+        if meta is None:
+            print("   • 캐시 없음: NSIS 컴파일을 수행합니다.")
+            return False
+        
+        installer_path = cache.restore_file(cache_key, ctx.workspace)
+    
+    print(f"   ✓ 캐시 적중: {meta.get('created', '?')} 생성된 설치파일을 재사용합니다.")
+    print(f"   ✓ NSIS 컴파일을 건너뜁니다: {installer_path.name}")
+    return True
+
+def store_installer_to_cache(ctx, cache_key):
+    """검증이 끝난 설치파일을 캐시에 저장"""
+    try:
+        BuildCache("installer").store_file(cache_key, ctx.installer_path, {
+            "installer": ctx.installer_name,
+            "defines": get_nsis_defines(ctx)
+        })
+        print(f"   ✓ 설치파일을 캐시에 저장했습니다: {cache_key[:16]}")
+    except Exception as e:
+        print(f"   ⚠ 캐시 저장 실패 (빌드는 계속 진행): {str(e)}")
+
+def is_makensis_summary(line):
+    """실행 중 바로 출력할 makensis 출력 줄 (컴파일 결과, 경고/오류)"""
+    return any(keyword in line for keyword in ("Total size:", "Compressed", "Output", "Error", "warning:"))
+
+def run_makensis(ctx, defines, log_name="makensis.log", highlight=None):
+    """makensis 실행 (/D 정의 지정, 출력은 변형별 로그 파일에 기록)
+    
+    /NOCD 로 실행하여 OutFile 과 PUBLISH_DIR 상대 경로가 스크립트 폴더가 아닌 작업 공간 기준이 되게 합니다.
+    """
+    cmd = [ctx.nsis_path, "/NOCD"]
+    cmd += [f"/D{name}={value}" for name, value in defines.items()]
+    cmd.append(str(ctx.nsis_script))
+    
+    print(f"   • 명령: {' '.join(cmd)}")
+    return run_streaming(cmd, cwd=ctx.workspace, log_name=f"{ctx.variant}/{log_name}", log_dir=ctx.log_dir,
+                         highlight=highlight, tracer=ctx.tracer)
+
+def build_installer(ctx):
     """NSIS 설치파일 빌드"""
-    print("4. NSIS 설치파일 빌드 중...")
+    print("5. NSIS 설치파일 빌드 중...")
+    
+    # 캐시에서 하드링크로 복원된 파일이 있으면 먼저 제거 (캐시 원본 덮어쓰기 방지)
+    installer_path = ctx.workspace / ctx.installer_name
+    if installer_path.exists():
+        installer_path.unlink()
     
     try:
-        # NSIS 컴파일 실행
-        cmd = [
-            nsis_exe_path,
-            f"/DBUILD_DATE={BUILD_DATE}",
-            f"/DPRODUCT_NAME={PRODUCT_NAME}",
-            f"/DPRODUCT_VERSION={PRODUCT_VERSION}",
-            NSIS_SCRIPT
-        ]
-        
-        print(f"   • 명령: {' '.join(cmd)}")
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        # NSIS 컴파일 실행 (컴파일 결과는 실행 중 바로 출력)
+        result = run_makensis(ctx, get_nsis_defines(ctx), highlight=is_makensis_summary)
         
         if result.returncode != 0:
             print("   ❌ NSIS 컴파일 실패:")
-            print(f"   stdout: {result.stdout}")
-            print(f"   stderr: {result.stderr}")
+            print_failure_tail(result)
             return False
         
-        print("   ✓ NSIS 컴파일 완료")
-        
-        # 컴파일 결과 출력 (정보성)
-        if result.stdout:
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if line.strip():
-                    if "Total size:" in line or "Compressed" in line or "Output" in line:
-                        print(f"   • {line.strip()}")
-        
+        print(f"   ✓ NSIS 컴파일 완료 ({result.elapsed:.1f}초)")
         return True
-        
+    
     except Exception as e:
         print(f"   ❌ NSIS 컴파일 중 오류 발생: {str(e)}")
         return False
 
-def verify_installer():
+def verify_installer(ctx):
     """생성된 설치파일 검증"""
-    print("5. 설치파일 검증 중...")
+    print("6. 설치파일 검증 중...")
     
-    installer_name = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_{BUILD_DATE}_Setup.exe"
-    installer_path = Path(installer_name)
+    installer_name = ctx.installer_name
+    installer_path = ctx.workspace / installer_name
     
     if not installer_path.exists():
         print(f"   ❌ 설치파일을 찾을 수 없습니다: {installer_name}")
         return False
     
-    file_size = installer_path.stat().st_size
+    ctx.installer_path = installer_path
+    
+    # 산출물 레지스트리 등록 (10_BuildAll.py 의 검증/보고서는 폴더를 검색하지 않고 이 기록을 사용)
+    entry = register_artifact(ctx, "installer", installer_path, "installer")
+    file_size = entry["size"] if entry else installer_path.stat().st_size
     size_mb = file_size // 1024 // 1024
     
     print(f"   ✓ 설치파일 생성됨: {installer_name}")
@@ -180,42 +282,43 @@ def verify_installer():
     
     return True
 
-def create_installer_info():
+def create_installer_info(ctx):
     """설치파일 정보 텍스트 생성"""
-    print("6. 설치파일 정보 생성 중...")
+    print("7. 설치파일 정보 생성 중...")
     
-    installer_name = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_{BUILD_DATE}_Setup.exe"
-    installer_path = Path(installer_name)
+    installer_name = ctx.installer_name
+    installer_path = ctx.workspace / installer_name
+    product_name = ctx.product_name
+    architecture, deployment = describe_variant(ctx.variant)
+    requirement_lines = "".join(f"- {line}\n" for line in get_system_requirements([ctx.variant]))
     
     if installer_path.exists():
         file_size = installer_path.stat().st_size
         size_mb = file_size // 1024 // 1024
         
         info_content = f"""==================================================
-{PRODUCT_NAME} 설치파일 정보
+{product_name} 설치파일 정보
 ==================================================
 
 파일명: {installer_name}
-빌드 일시: {BUILD_DATE}
+빌드 일시: {ctx.build_date}
 파일 크기: {size_mb} MB ({file_size:,} bytes)
 
 제품 정보:
-- 제품명: {PRODUCT_NAME}
-- 버전: {PRODUCT_VERSION}
-- 아키텍처: x64
-- 배포 형식: Framework-dependent
-- 압축: LZMA
+- 제품명: {product_name}
+- 버전: {ctx.product_version}
+- 아키텍처: {architecture}
+- 배포 형식: {deployment}
+- 압축: {describe_profile(ctx.compression)}
 
 설치 정보:
-- 설치 경로: C:\\Program Files\\{PRODUCT_NAME}
-- 사용자 데이터: %LocalAppData%\\{PRODUCT_NAME}
+- 설치 경로: C:\\Program Files\\{product_name}
+- 사용자 데이터: %LocalAppData%\\{product_name}
 - 바로가기: 데스크톱, 시작메뉴
 - 시작프로그램: 선택사항
 
 시스템 요구사항:
-- Windows 10 이상 (x64)
-- .NET 8.0 Desktop Runtime
-- 관리자 권한 (설치 시)
+{requirement_lines}- 관리자 권한 (설치 시)
 
 개발 정보:
 - 개발사: Green Power Co., Ltd.
@@ -235,53 +338,324 @@ def create_installer_info():
 - 방화벽 설정에서 차단되지 않도록 주의
 """
         
-        info_file = f"{installer_name}_INFO.txt"
+        info_file = ctx.workspace / f"{installer_name}_INFO.txt"
         with open(info_file, "w", encoding="utf-8") as f:
             f.write(info_content)
         
-        print(f"   ✓ 설치파일 정보 생성: {info_file}")
+        register_artifact(ctx, "installer_info", info_file, "installer")
+        print(f"   ✓ 설치파일 정보 생성: {info_file.name}")
+        return info_file
+    
+    return None
 
-def main():
-    """메인 실행 함수"""
-    print_header()
+def compile_compression_profile(ctx, profile, installed_size):
+    """압축 프로필 하나로 NSIS 컴파일 후 시간/크기 측정 (측정용 설치파일은 삭제)"""
+    suffix = f"{ctx.installer_suffix}_bench_{profile}"
+    output_path = ctx.workspace / f"{ctx.product_name}_v{ctx.product_version}_Build_{ctx.build_date}{suffix}_Setup.exe"
     
-    # 현재 위치를 NSIS_installer로 변경
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    defines = get_nsis_defines(ctx)
+    defines.pop("COMPRESSOR", None)
+    defines.pop("COMPRESSOR_DICT_SIZE", None)
+    defines.update(get_compression_defines(profile))
+    defines["OUTFILE_SUFFIX"] = suffix
     
+    entry = {"profile": profile, "success": False, "compile_time": 0.0, "size": 0,
+             "extract_time": estimate_extraction_seconds(profile, installed_size)}
     try:
-        # 1. NSIS 설치 확인
-        nsis_exe = find_nsis()
-        if not nsis_exe:
-            return 1
+        result = run_makensis(ctx, defines, log_name=f"makensis_bench_{profile}.log")
+        entry["compile_time"] = result.elapsed
         
-        # 2. NSIS 스크립트 확인
-        if not check_nsis_script():
-            return 1
-        
-        # 3. 게시 폴더 확인
-        if not check_publish_folder():
-            return 1
+        if result.returncode == 0 and output_path.exists():
+            entry["success"] = True
+            entry["size"] = output_path.stat().st_size
+        else:
+            entry["error"] = "\n".join(result.tail_lines(5, stream="err") or result.tail_lines(5))
+    except Exception as e:
+        entry["error"] = str(e)
+    finally:
+        if output_path.exists():
+            output_path.unlink()
+    
+    return entry
+
+def print_benchmark_table(results, installed_size, selected):
+    """압축 프로필 벤치마크 결과 표 출력"""
+    print(f"   {'프로필':<16}{'컴파일(초)':>10}{'크기(MB)':>10}{'압축률':>8}{'해제 추정(초)':>14}")
+    print("   " + "-" * 62)
+    for entry in results:
+        if not entry["success"]:
+            error_lines = entry.get("error", "").splitlines()
+            print(f"   {entry['profile']:<16}   ❌ 실패: {error_lines[-1] if error_lines else '알 수 없는 오류'}")
+            continue
         
-        # 4. 설치파일 빌드
-        if not build_installer(nsis_exe):
-            return 1
+        ratio = entry["size"] / installed_size * 100 if installed_size else 0
+        mark = "  ◀" if entry["profile"] == selected else ""
+        print(f"   {entry['profile']:<16}{entry['compile_time']:>12.2f}{entry['size'] / 1024 / 1024:>12.2f}"
+              f"{ratio:>9.1f}%{entry['extract_time']:>15.2f}{mark}")
+
+def benchmark_compression(ctx, profiles, jobs=None, size_budget_mb=None, time_budget=None):
+    """압축 프로필별 NSIS 컴파일을 동시에 수행하고 예산에 맞는 프로필 선택"""
+    print(f"• 압축 프로필 벤치마크: {', '.join(profiles)} (동시 작업: {jobs or '자동'})")
+    print()
+    
+    # 1. NSIS 설치 확인
+    if ctx.nsis_path is None:
+        ctx.nsis_path = find_nsis(ctx)
+        if not ctx.nsis_path:
+            return None
+    
+    # 2. NSIS 스크립트 확인
+    if not check_nsis_script(ctx):
+        return None
+    
+    # 3. 게시 폴더 확인
+    if not check_publish_folder(ctx):
+        return None
+    
+    installed_size = get_publish_manifest(ctx)["total_size"]
+    
+    # 4. 프로필별 NSIS 컴파일 (makensis 는 별도 프로세스이므로 스레드 풀로 충분)
+    print("4. 압축 프로필별 NSIS 컴파일 중...")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(profiles)))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(lambda p: compile_compression_profile(ctx, p, installed_size), profiles))
+    
+    # 5. 예산에 맞는 프로필 선택
+    size_budget = size_budget_mb * 1024 * 1024 if size_budget_mb is not None else None
+    best = select_profile(results, size_budget, time_budget)
+    selected = best["profile"] if best else None
+    
+    print()
+    print(f"5. 벤치마크 결과 (게시 파일 {installed_size / 1024 / 1024:.2f} MB 기준)")
+    print_benchmark_table(results, installed_size, selected)
+    print()
+    
+    budgets = []
+    if size_budget_mb is not None:
+        budgets.append(f"크기 ≤ {size_budget_mb} MB")
+    if time_budget is not None:
+        budgets.append(f"컴파일 ≤ {time_budget}초")
+    budget_text = f" ({', '.join(budgets)})" if budgets else ""
+    
+    if selected:
+        print(f"   ✓ 선택된 프로필{budget_text}: {selected} - {describe_profile(selected)}")
+        print("   • 다음 빌드에서 --compression auto 로 사용할 수 있습니다.")
+    else:
+        print(f"   ⚠ 예산{budget_text}을 만족하는 프로필이 없습니다.")
+    
+    try:
+        save_benchmark(results, selected)
+    except OSError as e:
+        print(f"   ⚠ 벤치마크 결과 저장 실패: {str(e)}")
+    
+    return selected
+
+def resolve_compression(value):
+    """명령행 --compression 값 해석 (auto 이면 마지막 벤치마크에서 선택된 프로필)"""
+    if value != "auto":
+        return value
+    
+    profile = load_selected_profile()
+    if profile is None:
+        print("⚠ 저장된 압축 벤치마크 결과가 없어 기본 압축을 사용합니다. (--benchmark-compression 으로 측정)")
+    return profile
+
+def parse_profiles(value):
+    """명령행 --benchmark-compression 값 해석 (\"all\" 또는 쉼표 구분 목록)"""
+    if value.strip().lower() == "all":
+        return list(COMPRESSION_PROFILES)
+    
+    profiles = [p.strip() for p in value.split(",") if p.strip()]
+    unknown = [p for p in profiles if p not in COMPRESSION_PROFILES]
+    if unknown:
+        raise ValueError(f"알 수 없는 압축 프로필: {', '.join(unknown)} (사용 가능: {', '.join(COMPRESSION_PROFILES)})")
+    return list(dict.fromkeys(profiles))
+
+def setup_argparse():
+    """명령행 인자 설정"""
+    parser = argparse.ArgumentParser(description=f'{PRODUCT_NAME} NSIS 설치파일 빌드')
+    parser.add_argument('--no-cache', action='store_true', help='설치파일 캐시를 사용하지 않고 항상 NSIS 컴파일 수행')
+    parser.add_argument('--variants', type=str, default=None,
+                        help=f'설치파일을 만들 게시 변형 목록 (쉼표 구분 또는 all, 사용 가능: {", ".join(PUBLISH_VARIANTS)})')
+    parser.add_argument('--jobs', type=int, default=None, help='동시 NSIS 컴파일 작업 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--compression', type=str, default=None, choices=[*COMPRESSION_PROFILES, 'auto'],
+                        help='설치파일 압축 프로필 (auto: 마지막 --benchmark-compression 결과에서 선택된 프로필)')
+    parser.add_argument('--benchmark-compression', type=str, nargs='?', const='all', default=None, metavar='PROFILES',
+                        help=f'압축 프로필별 컴파일 시간/크기 비교 (쉼표 구분 또는 all, 사용 가능: {", ".join(COMPRESSION_PROFILES)})')
+    parser.add_argument('--size-budget', type=float, default=None, help='벤치마크 프로필 선택 시 최대 설치파일 크기 (MB)')
+    parser.add_argument('--time-budget', type=float, default=None, help='벤치마크 프로필 선택 시 최대 컴파일 시간 (초)')
+    parser.add_argument('--workspace', type=str, default=None,
+                        help='빌드 작업 공간 (기본값: 스크립트 폴더, 게시 폴더를 읽고 설치파일을 만드는 위치)')
+    return parser
+
+def compile_installer(ctx):
+    """설치파일 컴파일 (1~5, 검증 / 캐시 저장은 check_installer, 정보 파일은 create_installer_info)"""
+    start_time = time.time()
+    result = StepResult("installer", False)
+    ctx.installer_cache_key = None
+    
+    # 1. NSIS 설치 확인 (10_BuildAll.py 에서 이미 확인한 경로가 있으면 재사용)
+    if ctx.nsis_path is None:
+        ctx.nsis_path = find_nsis(ctx)
+        if not ctx.nsis_path:
+            return result
+    
+    # 2. NSIS 스크립트 확인
+    if not check_nsis_script(ctx):
+        return result
+    
+    # 3. 게시 폴더 확인
+    if not check_publish_folder(ctx):
+        return result
+    
+    # 4. 설치파일 캐시 확인
+    cache_key = compute_installer_cache_key(ctx) if ctx.use_cache else None
+    result.cache_hit = cache_key is not None and restore_installer_from_cache(ctx, cache_key)
+    
+    # 5. 설치파일 빌드
+    if not result.cache_hit:
+        if not build_installer(ctx):
+            return result
+        ctx.installer_cache_key = cache_key
+    
+    result.success = True
+    result.elapsed = time.time() - start_time
+    return result
+
+def check_installer(ctx):
+    """설치파일 검증 (6, SHA-256 계산 및 레지스트리 등록) 후 캐시 저장"""
+    with trace_span(ctx, "설치파일 검증", variant=ctx.variant):
+        verified = verify_installer(ctx)
+    if not verified:
+        return False
+    
+    # 컴파일한 설치파일만 캐시에 저장 (캐시에서 복원한 경우 제외)
+    if ctx.installer_cache_key is not None:
+        store_installer_to_cache(ctx, ctx.installer_cache_key)
+    return True
+
+def create_installer(ctx):
+    """설치파일 생성 단계 실행 (1~7, 단독 실행 및 변형별 작업 프로세스)"""
+    start_time = time.time()
+    
+    # 1~5. 설치파일 컴파일
+    result = compile_installer(ctx)
+    if not result.success:
+        return result
+    
+    # 6. 설치파일 검증
+    if not check_installer(ctx):
+        result.success = False
+        return result
+    
+    # 7. 설치파일 정보 생성
+    info_file = create_installer_info(ctx)
+    
+    result.artifacts = {
+        "installer": ctx.installer_path,
+        "info_file": info_file
+    }
+    result.elapsed = time.time() - start_time
+    ctx.results[result.name] = result
+    return result
+
+def create_installers(ctx, variants, jobs=None, compile_only=False):
+    """게시 변형별 설치파일을 프로세스 풀에서 동시에 생성
+    
+    compile_only=True 이면 변형별 1~5 만 수행합니다 (검증 / 정보 파일은 10_BuildAll.py 의 별도 단계).
+    """
+    start_time = time.time()
+    result = StepResult("installer", False)
+    
+    print(f"• 게시 변형 {len(variants)}개 설치파일 동시 생성: {', '.join(variants)} (동시 작업: {jobs or '자동'})")
+    print()
+    
+    # NSIS 경로/버전은 작업 프로세스마다 다시 확인하지 않도록 미리 확인
+    if ctx.nsis_path is None:
+        ctx.nsis_path = find_nsis(ctx)
+        if not ctx.nsis_path:
+            return result
+    
+    contexts = []
+    for variant in variants:
+        variant_ctx = ctx.variants.get(variant) or variant_context(ctx, variant, isolated_build=False)
+        variant_ctx.nsis_path = ctx.nsis_path
+        variant_ctx.nsis_version = ctx.nsis_version
+        contexts.append(variant_ctx)
+    
+    failed = []
+    stage_func = "compile_installer" if compile_only else "create_installer"
+    for done_ctx, variant_result in run_matrix(STAGE_MODULE, stage_func, contexts, jobs):
+        # 게시 단계에서 만든 변형별 컨텍스트는 그대로 두고 설치파일 결과만 옮김 (매니페스트 단계가 동시에 사용)
+        variant_ctx = ctx.variants.setdefault(done_ctx.variant, done_ctx)
+        variant_ctx.installer_path = done_ctx.installer_path
+        variant_ctx.installer_cache_key = done_ctx.installer_cache_key
+        if variant_ctx.publish_manifest is None and done_ctx.publish_manifest is not None:
+            variant_ctx.publish_manifest = done_ctx.publish_manifest
+        if variant_result is None or not variant_result.success:
+            failed.append(variant_ctx.variant)
+            continue
+        variant_ctx.results[variant_result.name] = variant_result
+        result.cache_hit = result.cache_hit or variant_result.cache_hit
+        result.artifacts[variant_ctx.variant] = variant_ctx.workspace / variant_ctx.installer_name
+    
+    if failed:
+        print(f"   ❌ 설치파일 생성 실패 변형: {', '.join(failed)}")
+        return result
+    
+    result.success = True
+    result.elapsed = time.time() - start_time
+    ctx.results[result.name] = result
+    return result
+
+def main():
+    """메인 실행 함수"""
+    parser = setup_argparse()
+    args = parser.parse_args()
+    try:
+        variants = parse_variants(args.variants)
+        profiles = parse_profiles(args.benchmark_compression) if args.benchmark_compression else None
+    except ValueError as e:
+        parser.error(str(e))
+    if profiles and len(variants) != 1:
+        parser.error("--benchmark-compression 은 게시 변형 하나에 대해서만 실행할 수 있습니다.")
+    
+    ctx = BuildContext(
+        product_name=PRODUCT_NAME,
+        product_version=PRODUCT_VERSION,
+        assembly_version=VERSION_INFO.assembly_version,
+        build_date=BUILD_DATE,
+        script_dir=Path(__file__).resolve().parent,
+        nsis_script_name=NSIS_SCRIPT,
+        use_cache=not args.no_cache,
+        variant=variants[0],
+        workspace_dir=resolve_workspace(args.workspace)
+    )
+    ctx.artifacts = ArtifactRegistry(ctx.workspace / ARTIFACT_REGISTRY_NAME)
+    
+    print_header(ctx)
+    
+    try:
+        if profiles:
+            selected = benchmark_compression(ctx, profiles, args.jobs, args.size_budget, args.time_budget)
+            return 0 if selected else 1
         
-        # 5. 설치파일 검증
-        if not verify_installer():
+        ctx.compression = resolve_compression(args.compression)
+        if variants == [ctx.variant]:
+            result = create_installer(ctx)
+        else:
+            result = create_installers(ctx, variants, args.jobs)
+        if not result.success:
             return 1
         
-        # 6. 설치파일 정보 생성
-        create_installer_info()
-        
         print()
         print("=" * 70)
         print("✅ NSIS 설치파일 빌드 완료!")
         print("=" * 70)
         print()
         
-        installer_name = f"{PRODUCT_NAME}_v{PRODUCT_VERSION}_Build_{BUILD_DATE}_Setup.exe"
-        print(f"생성된 파일: {installer_name}")
+        for variant_ctx in (ctx.variants.values() or [ctx]):
+            print(f"생성된 파일: {variant_ctx.installer_name}")
         print()
         print("다음 단계:")
         print("1. 설치파일을 테스트해보세요")
@@ -290,7 +664,7 @@ def main():
         print()
         
         return 0
-        
+    
     except KeyboardInterrupt:
         print("\n❌ 사용자에 의해 중단되었습니다.")
         return 1
@@ -299,4 +673,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
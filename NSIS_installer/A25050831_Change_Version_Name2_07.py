@@ -2,13 +2,20 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import sys
 import json
+import codecs
+import hashlib
 import time
+import uuid
+import shutil
 import argparse
 import datetime
+import threading
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # 기본 문자열 설정 (이 부분을 수정하여 기본 문자열을 변경할 수 있습니다)
 BASE_FILENAME_PREFIX = "A25050831_Change_Version_Name2"
@@ -23,12 +30,38 @@ DEFAULT_FILE_LIST = f"{BASE_FILENAME_PREFIX}_INPUT_FileList.json"
 DEFAULT_REPLACE_STRING_LIST = f"{BASE_FILENAME_PREFIX}_INPUT_ReplaceStringList.json"
 DEFAULT_LOG_FILE = f"OUTPUT_{timestamp}_{BASE_FILENAME_ABBR}_Log.txt"
 
+# 인코딩 감지 설정 (BOM 이 있으면 BOM 기준, 없으면 아래 순서로 디코딩 시도)
+# UTF-32 LE BOM 은 UTF-16 LE BOM 으로 시작하므로 UTF-32 를 먼저 확인
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be')
+]
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949', 'euc-kr', 'latin1']
+
+# 파일 검색 설정 (glob 패턴 검색 시 제외할 폴더, 동시 처리 작업 수)
+SKIP_DIRECTORIES = {'bin', 'obj', '.git', '.vs'}
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+
+# 대용량 파일 설정 (이 크기 이상인 파일은 전체를 읽지 않고 일정 크기 조각씩 읽어 교체)
+STREAM_THRESHOLD = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 # 로그 파일 경로 설정
 OUTPUT_DIR = "Output_Result"
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 DEFAULT_LOG_PATH = os.path.join(OUTPUT_DIR, DEFAULT_LOG_FILE)
 
+# 건너뛰기 인덱스 경로 (교체할 내용이 없었던 파일을 기억하여 다음 실행 시 읽지 않음)
+DEFAULT_INDEX_PATH = os.path.join(OUTPUT_DIR, f"{BASE_FILENAME_ABBR}_SkipIndex.json")
+
+# 로그 버퍼 설정 (파일 핸들을 한 번만 열고 버퍼에 모아서 기록)
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 1.0  # 초
+
 def setup_argparse():
     """명령행 인자 설정"""
     parser = argparse.ArgumentParser(description=f'파일 내의 문자열을 교체하는 스크립트 - {BASE_FILENAME_PREFIX}')
@@ -39,6 +72,14 @@ def setup_argparse():
                         help=f'Replace String List JSON 입력파일명 (기본값: {DEFAULT_REPLACE_STRING_LIST})')
     parser.add_argument('--log', type=str, default=DEFAULT_LOG_PATH,
                         help=f'Log 파일명 (기본값: {DEFAULT_LOG_PATH})')
+    parser.add_argument('--quiet', action='store_true', help='파일별 처리 내용은 기록하지 않고 오류/경고와 요약만 기록')
+    parser.add_argument('--json-log', type=str, nargs='?', const='', default=None,
+                        help='파일별 처리 결과를 JSON Lines 형식으로도 기록 (파일명 생략 시 Log 파일명.jsonl)')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'동시에 처리할 파일 수 (기본값: {DEFAULT_JOBS}, 1이면 순차 처리)')
+    parser.add_argument('--index', type=str, default=DEFAULT_INDEX_PATH,
+                        help=f'건너뛰기 인덱스 파일명 (기본값: {DEFAULT_INDEX_PATH})')
+    parser.add_argument('--no-index', action='store_true', help='건너뛰기 인덱스를 사용하지 않고 모든 파일 처리')
     return parser
 
 def load_json_file(filename):
@@ -50,77 +91,540 @@ def load_json_file(filename):
         print(f"오류: {filename} 파일을 로드하는 데 실패했습니다. - {str(e)}")
         return None
 
-def write_log(log_file, message):
-    """로그 파일에 메시지 기록"""
-    log_dir = os.path.dirname(log_file)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+class ReplaceMatcher:
+    """교체 규칙 목록을 한 번만 컴파일하여 파일마다 한 번의 탐색으로 모든 규칙을 적용하는 매처
+
+    우선순위: 같은 위치에서 여러 규칙이 맞으면 가장 긴 'from' 이 우선하며, 교체된 결과는 다시 탐색하지 않습니다.
+    'from' 이 같은 규칙이 여러 개면 먼저 나온 규칙만 사용합니다.
+    """
+    
+    def __init__(self, replace_strings):
+        self.rules = []
+        self.ignored = []
+        index_by_from = {}
+        
+        for replace_item in replace_strings:
+            from_str = replace_item['from']
+            if not from_str or from_str in index_by_from:
+                self.ignored.append(replace_item)
+                continue
+            index_by_from[from_str] = len(self.rules)
+            self.rules.append(replace_item)
+        
+        self.index_by_from = index_by_from
+        self.replacements = [rule['to'] for rule in self.rules]
+        self.max_length = max((len(p) for p in index_by_from), default=0)
+        
+        # 규칙 해시 (규칙이 바뀌면 건너뛰기 인덱스의 기존 기록을 무효화)
+        rules_json = json.dumps(self.rules, ensure_ascii=False, sort_keys=True)
+        self.rules_hash = hashlib.sha256(rules_json.encode('utf-8')).hexdigest()
+        
+        # 긴 패턴을 앞에 두어 정규식 대체(alternation)가 가장 긴 일치를 선택하도록 함
+        patterns = sorted(index_by_from, key=len, reverse=True)
+        self.pattern = re.compile("|".join(re.escape(p) for p in patterns)) if patterns else None
+    
+    def replace(self, content):
+        """한 번의 탐색으로 교체 (교체된 내용, 규칙별 일치 횟수) 반환"""
+        counts = [0] * len(self.rules)
+        if self.pattern is None:
+            return content, counts
+        
+        def substitute(match):
+            index = self.index_by_from[match.group(0)]
+            counts[index] += 1
+            return self.replacements[index]
+        
+        return self.pattern.sub(substitute, content), counts
+    
+    def _replace_until(self, buffer, limit, counts):
+        """limit 이전에서 시작하는 일치만 교체 - (교체된 앞부분, 다음 조각과 합칠 뒷부분) 반환"""
+        pieces = []
+        pos = 0
+        for match in self.pattern.finditer(buffer):
+            if match.start() >= limit:
+                break
+            index = self.index_by_from[match.group(0)]
+            counts[index] += 1
+            pieces.append(buffer[pos:match.start()])
+            pieces.append(self.replacements[index])
+            pos = match.end()
+        
+        end = max(pos, limit)
+        pieces.append(buffer[pos:end])
+        return "".join(pieces), buffer[end:]
+    
+    def replace_stream(self, chunks, counts):
+        """문자열 조각을 차례로 교체하여 생성 (규칙별 일치 횟수는 counts 에 누적)
+        
+        조각 끝의 (가장 긴 'from' 길이 - 1) 글자는 일치 여부가 다음 조각에 따라 달라질 수 있으므로
+        다음 조각과 합쳐 다시 탐색합니다. 결과는 파일 전체를 replace() 한 것과 같습니다.
+        """
+        if self.pattern is None:
+            yield from chunks
+            return
+        
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + chunk
+            done, carry = self._replace_until(buffer, len(buffer) - self.max_length + 1, counts)
+            if done:
+                yield done
+        
+        if carry:
+            done, _ = self._replace_until(carry, len(carry), counts)
+            yield done
+
+class LogWriter:
+    """로그 기록기 (로그 파일을 한 번만 열어 버퍼에 모아 기록하고, 일정 간격 및 종료 시 flush)
+    
+    quiet 모드에서는 파일별 처리 내용(detail)을 생략하고 오류/경고와 요약만 기록합니다.
+    json_file 을 지정하면 record() 로 남기는 처리 결과를 JSON Lines 형식으로 함께 기록합니다.
+    """
+    
+    def __init__(self, log_file, quiet=False, json_file=None, flush_interval=LOG_FLUSH_INTERVAL):
+        self.log_file = log_file
+        self.json_file = json_file
+        self.quiet = quiet
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        
+        for path in (log_file, json_file):
+            log_dir = os.path.dirname(path) if path else ""
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+        
+        self._file = open(log_file, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+        self._json = open(json_file, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE) if json_file else None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def write(self, message, detail=False):
+        """메시지 기록 및 출력 (detail 메시지는 quiet 모드에서 생략)"""
+        if detail and self.quiet:
+            return
+        self._file.write(f"{message}\n")
+        print(message)
+        self._maybe_flush()
     
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(f"{message}\n")
+    def record(self, event, **fields):
+        """JSON Lines 기록 (json_file 을 지정한 경우만)"""
+        if self._json is None:
+            return
+        entry = {"time": datetime.datetime.now().isoformat(timespec='seconds'), "event": event, **fields}
+        self._json.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._maybe_flush()
     
-    print(message)
+    def _maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self):
+        """버퍼 내용을 파일에 기록"""
+        self._file.flush()
+        if self._json is not None:
+            self._json.flush()
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """버퍼 flush 후 파일 닫기"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        if self._json is not None:
+            self._json.close()
 
-def detect_encoding(file_path):
-    """파일의 인코딩 감지"""
-    encodings = ['utf-8', 'cp949', 'euc-kr', 'ascii', 'latin1']
+def detect_encoding(data):
+    """파일 내용(bytes)의 인코딩 감지 및 디코딩 - (인코딩, BOM, 내용) 반환, 실패 시 (None, b"", None)
+    
+    BOM 확인 → ASCII 확인 → 후보 인코딩 순서로 메모리에서만 디코딩합니다 (파일을 다시 읽지 않음).
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if data.startswith(bom):
+            return encoding, bom, data[len(bom):].decode(encoding)
+    
+    # ASCII 파일은 UTF-8 로 취급 (교체 문자열에 한글 등이 있어도 저장 가능)
+    if data.isascii():
+        return 'utf-8', b"", data.decode('ascii')
     
-    for encoding in encodings:
+    for encoding in CANDIDATE_ENCODINGS:
         try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                file.read()
-                return encoding
+            return encoding, b"", data.decode(encoding)
         except UnicodeDecodeError:
             continue
     
-    return None
+    return None, b"", None
+
+def is_glob_pattern(path):
+    """glob 패턴 여부 (*, ?, [ 포함)"""
+    return any(char in path for char in '*?[')
+
+def class_end(pattern, start):
+    """pattern[start] 의 '[' 로 시작하는 문자 클래스를 닫는 ']' 위치 (없으면 -1, 맨 앞 ! 와 ] 는 클래스 내용)"""
+    i = start + 1
+    if i < len(pattern) and pattern[i] == '!':
+        i += 1
+    if i < len(pattern) and pattern[i] == ']':
+        i += 1
+    return pattern.find(']', i)
+
+def glob_to_regex(pattern):
+    """glob 패턴을 정규식으로 변환 (** 는 하위 폴더 포함, * 와 ? 는 폴더 구분자 '/' 제외)"""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            regex.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and class_end(pattern, i) > 0:
+            # 문자 클래스는 범위 (a-z) 를 유지하고 \, [, ], 맨 앞 ^ 만 이스케이프 (fnmatch.translate 와 같은 방식)
+            end = class_end(pattern, i)
+            body = pattern[i + 1:end]
+            negate = body.startswith('!')
+            if negate:
+                body = body[1:]
+            body = body.replace('\\', '\\\\').replace('[', '\\[').replace(']', '\\]')
+            if body.startswith('^'):
+                body = '\\' + body
+            regex.append(('[^' if negate else '[') + body + ']')
+            i = end + 1
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+    
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    return re.compile(''.join(regex) + r'\Z', flags)
+
+def pattern_root(pattern):
+    """패턴 앞부분의 고정 폴더 경로 (이 폴더부터만 검색)"""
+    parts = pattern.split('/')[:-1]
+    root = []
+    for part in parts:
+        if is_glob_pattern(part):
+            break
+        root.append(part)
+    return '/'.join(root)
+
+def scan_files(base_path, root):
+    """os.scandir 기반 폴더 순회 (SKIP_DIRECTORIES 제외) - base_path 기준 상대경로('/' 구분) 목록"""
+    start = base_path / root if root else base_path
+    if not start.is_dir():
+        return []
+    
+    found = []
+    pending = [(str(start), root)]
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRECTORIES:
+                        pending.append((entry.path, rel_path))
+                elif entry.is_file():
+                    found.append(rel_path)
+    
+    found.sort()
+    return found
 
-def replace_strings_in_file(file_path, replace_strings, log_file):
-    """파일 내의 문자열 교체"""
+def expand_file_list(item, base_path):
+    """파일 리스트 항목을 처리 대상 상대경로 목록으로 변환
+    
+    'files' 의 일반 경로는 그대로 (없으면 처리 시 오류로 기록), glob 패턴과 'include' 패턴은 폴더를 검색하여
+    일치하는 파일로 바꾸고, 'exclude' 패턴에 일치하는 파일은 제외합니다. 순서는 입력 순서, 중복은 제거합니다.
+    """
+    entries = [path.replace('\\', '/') for path in item.get('files', []) + item.get('include', [])]
+    excludes = [glob_to_regex(path.replace('\\', '/')) for path in item.get('exclude', [])]
+    
+    # 같은 고정 폴더를 쓰는 패턴은 한 번만 검색
+    scanned = {}
+    targets = []
+    for entry in entries:
+        if not is_glob_pattern(entry):
+            targets.append(entry)
+            continue
+        
+        root = pattern_root(entry)
+        if root not in scanned:
+            scanned[root] = scan_files(base_path, root)
+        regex = glob_to_regex(entry)
+        targets += [rel_path for rel_path in scanned[root] if regex.match(rel_path)]
+    
+    targets = [path for path in targets if not any(regex.match(path) for regex in excludes)]
+    return list(dict.fromkeys(targets))
+
+def make_temp_path(file_path):
+    """원본과 같은 폴더의 임시 파일 경로 (같은 드라이브 안에서 교체해야 원자적으로 바뀜)"""
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+def commit_temp_file(temp_path, file_path):
+    """임시 파일로 원본 교체 (원본 권한 유지, 교체 도중 중단되어도 원본이 깨지지 않음)"""
+    shutil.copymode(file_path, temp_path)
+    os.replace(temp_path, file_path)
+
+def discard_temp_file(temp_path):
+    """교체하지 않은 임시 파일 삭제"""
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+def write_file_atomic(file_path, data):
+    """임시 파일에 기록한 뒤 원본과 교체"""
+    temp_path = make_temp_path(file_path)
     try:
-        # 파일 인코딩 감지
-        encoding = detect_encoding(file_path)
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        commit_temp_file(temp_path, file_path)
+    finally:
+        discard_temp_file(temp_path)
+
+def detect_bom(file_path):
+    """파일 앞부분의 BOM 확인 - (인코딩, BOM), 없으면 (None, b"")"""
+    with open(file_path, 'rb') as file:
+        head = file.read(4)
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding, bom
+    return None, b""
+
+def read_decoded_chunks(file, encoding, chunk_size=STREAM_CHUNK_SIZE, digest=None):
+    """파일을 chunk_size 씩 읽어 디코딩한 문자열 조각 생성 (조각 경계에 걸친 멀티바이트 문자 처리, digest 에 읽은 bytes 반영)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while True:
+        data = file.read(chunk_size)
+        if not data:
+            break
+        if digest is not None:
+            digest.update(data)
+        text = decoder.decode(data)
+        if text:
+            yield text
+    
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+def replace_strings_in_large_file(file_path, matcher, chunk_size=STREAM_CHUNK_SIZE):
+    """대용량 파일 문자열 교체 (조각 단위 스트리밍, 메모리 사용량은 파일 크기와 무관)
+    
+    BOM 이 없으면 후보 인코딩 순서로 디코딩하며 교체하고, 디코딩에 실패하면 다음 인코딩으로 처음부터 다시 처리합니다.
+    교체 결과는 같은 폴더의 임시 파일에 기록하고 변경된 경우에만 원본과 교체합니다. 반환값은 replace_strings_in_file 과 같습니다.
+    """
+    encoding, bom = detect_bom(file_path)
+    
+    for encoding in [encoding] if encoding else CANDIDATE_ENCODINGS:
+        counts = [0] * len(matcher.rules)
+        digest = hashlib.sha256(bom)
+        temp_path = make_temp_path(file_path)
+        try:
+            with open(file_path, 'rb') as source, open(temp_path, 'wb') as target:
+                source.seek(len(bom))
+                target.write(bom)
+                encoder = codecs.getincrementalencoder(encoding)()
+                for text in matcher.replace_stream(read_decoded_chunks(source, encoding, chunk_size, digest), counts):
+                    target.write(encoder.encode(text))
+                target.write(encoder.encode("", final=True))
+            
+            # 'from' 과 'to' 가 다른 규칙이 한 번이라도 적용되었으면 내용이 바뀐 것
+            replaced_items = [dict(rule, count=count) for rule, count in zip(matcher.rules, counts) if count]
+            changed = any(rule['from'] != rule['to'] for rule in replaced_items)
+            if changed:
+                commit_temp_file(temp_path, file_path)
+        except UnicodeDecodeError:
+            continue
+        finally:
+            discard_temp_file(temp_path)
         
-        if encoding is None:
-            write_log(log_file, f"  경고: {file_path} 파일의 인코딩을 감지할 수 없습니다.")
-            return False, []
+        return (True, replaced_items, None, digest.hexdigest()) if changed else (False, [], None, digest.hexdigest())
+    
+    return False, [], f"  경고: {file_path} 파일의 인코딩을 감지할 수 없습니다.", None
+
+def replace_strings_in_file(file_path, matcher):
+    """파일 내의 문자열 교체 - (변경 여부, 교체된 규칙 목록, 오류 메시지, 원본 내용 SHA-256) 반환
+    
+    교체된 규칙 목록에는 'count' 로 일치 횟수가 포함됩니다. 작업 스레드에서 호출되므로 로그는 직접 기록하지 않습니다.
+    원본 내용 해시는 교체하면서 읽은 bytes 로 계산하므로 건너뛰기 인덱스에 기록할 때 파일을 다시 읽지 않습니다 (오류 시 None).
+    STREAM_THRESHOLD 이상인 파일은 replace_strings_in_large_file 로 조각 단위 처리합니다.
+    """
+    try:
+        if os.path.getsize(file_path) >= STREAM_THRESHOLD:
+            return replace_strings_in_large_file(file_path, matcher)
         
-        # 파일 내용 읽기
-        with open(file_path, 'r', encoding=encoding) as file:
-            content = file.read()
+        # 파일 내용 읽기 (bytes 로 한 번만 읽음)
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        sha256 = hashlib.sha256(data).hexdigest()
         
-        # 문자열 교체 및 교체된 문자열 추적
-        original_content = content
-        replaced_items = []
+        # 파일 인코딩 감지 (메모리에서 디코딩, 줄바꿈은 변환하지 않음)
+        encoding, bom, content = detect_encoding(data)
         
-        for replace_item in replace_strings:
-            from_str = replace_item['from']
-            to_str = replace_item['to']
-            
-            if from_str in content:
-                content = content.replace(from_str, to_str)
-                replaced_items.append(replace_item)
+        if encoding is None:
+            return False, [], f"  경고: {file_path} 파일의 인코딩을 감지할 수 없습니다.", None
+        
+        # 문자열 교체 (모든 규칙을 한 번에 적용) 및 규칙별 일치 횟수 추적
+        original_content = content
+        content, counts = matcher.replace(content)
+        replaced_items = [dict(rule, count=count) for rule, count in zip(matcher.rules, counts) if count]
         
-        # 변경사항이 있는 경우에만 파일 저장
+        # 변경사항이 있는 경우에만 파일 저장 (원래 인코딩, BOM, 줄바꿈 유지, 임시 파일 기록 후 교체)
         if content != original_content:
-            with open(file_path, 'w', encoding=encoding) as file:
-                file.write(content)
-            return True, replaced_items
+            write_file_atomic(file_path, bom + content.encode(encoding))
+            return True, replaced_items, None, sha256
         else:
-            return False, []
+            return False, [], None, sha256
     
     except Exception as e:
-        write_log(log_file, f"  오류: 파일 처리 중 오류 발생 - {str(e)}")
-        return False, []
+        return False, [], f"  오류: {file_path} 파일 처리 중 오류 발생 - {str(e)}", None
+
+def hash_file(file_path):
+    """파일 내용 해시 (SHA-256, 조각 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        while True:
+            data = file.read(STREAM_CHUNK_SIZE)
+            if not data:
+                break
+            digest.update(data)
+    return digest.hexdigest()
+
+class SkipIndex:
+    """교체할 내용이 없었던 파일 기록 (다음 실행 시 파일을 읽지 않고 건너뜀)
+    
+    파일 경로별로 크기, 수정 시각, 내용 해시, 교체 규칙 해시를 저장합니다.
+    규칙이나 크기가 다르면 다시 처리하고, 수정 시각만 다르면 (복사, 체크아웃 등) 내용 해시를 비교합니다.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, index_file, rules_hash):
+        self.index_file = index_file
+        self.rules_hash = rules_hash
+        self.entries = self._load()
+        self.dirty = False
+        self._lock = threading.Lock()
+    
+    def _load(self):
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return {}
+        return data.get('files', {})
+    
+    @staticmethod
+    def _key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+    
+    def is_unchanged(self, file_path):
+        """이전 실행에서 교체할 내용이 없었고 이후 파일과 규칙이 바뀌지 않았으면 True"""
+        key = self._key(file_path)
+        entry = self.entries.get(key)
+        if entry is None or entry['rules'] != self.rules_hash:
+            return False
+        
+        stat = os.stat(file_path)
+        if entry['size'] != stat.st_size:
+            return False
+        if entry['mtime_ns'] == stat.st_mtime_ns:
+            return True
+        
+        # 수정 시각만 바뀐 경우 내용 해시 비교 (같으면 수정 시각만 갱신)
+        if hash_file(file_path) != entry['sha256']:
+            return False
+        with self._lock:
+            self.entries[key] = dict(entry, mtime_ns=stat.st_mtime_ns)
+            self.dirty = True
+        return True
+    
+    def add(self, file_path, sha256, stat):
+        """교체할 내용이 없었던 파일 기록 (sha256: 교체 단계에서 읽은 내용의 해시 - 파일을 다시 읽지 않음)
+        
+        stat 은 내용을 읽기 전에 확인한 값이어야 합니다. 읽은 뒤 파일이 바뀌면 기록과 수정 시각이 달라
+        다음 실행에서 내용 해시를 다시 비교합니다.
+        """
+        entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                 'sha256': sha256, 'rules': self.rules_hash}
+        with self._lock:
+            self.entries[self._key(file_path)] = entry
+            self.dirty = True
+    
+    def discard(self, file_path):
+        """기록 삭제 (파일이 변경되었거나 처리 중 오류가 난 경우)"""
+        with self._lock:
+            if self.entries.pop(self._key(file_path), None) is not None:
+                self.dirty = True
+    
+    def save(self):
+        """인덱스 저장 (변경된 경우만, 임시 파일 기록 후 교체)"""
+        if not self.dirty:
+            return
+        
+        index_dir = os.path.dirname(self.index_file)
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+        
+        temp_path = make_temp_path(self.index_file)
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({'version': self.VERSION, 'files': self.entries}, file, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.index_file)
+        finally:
+            discard_temp_file(temp_path)
+        self.dirty = False
 
-def process_files(file_list, replace_strings, log_file):
-    """파일 리스트 처리"""
+# 건너뛴 파일의 처리 결과
+SKIPPED = "skipped"
+
+def process_file(file_path, matcher, index=None):
+    """작업 스레드: 파일 하나 처리 (파일이 없으면 None, 인덱스 기준 변경 없는 파일은 SKIPPED)"""
+    if not file_path.is_file():
+        return None
+    if index is not None and index.is_unchanged(file_path):
+        return SKIPPED
+    
+    # 건너뛰기 인덱스에는 내용을 읽기 전의 크기 / 수정 시각을 기록 (처리 중에 바뀐 파일을 건너뛰지 않도록)
+    stat = os.stat(file_path) if index is not None else None
+    changed, replaced_items, error, sha256 = replace_strings_in_file(str(file_path), matcher)
+    if index is not None:
+        if changed or error:
+            index.discard(file_path)
+        else:
+            index.add(file_path, sha256, stat)
+    return changed, replaced_items, error
+
+def process_files(file_list, replace_strings, log, jobs=DEFAULT_JOBS, index_file=None):
+    """파일 리스트 처리 (파일은 작업 스레드에서 동시에 처리하고, 로그는 파일 순서대로 기록)
+    
+    index_file 을 지정하면 건너뛰기 인덱스를 사용합니다. 반환값: (성공 수, 실패 수, 건너뛴 수)
+    """
     success_count = 0
     fail_count = 0
+    skip_count = 0
+    
+    # 교체 규칙은 한 번만 컴파일하여 모든 파일에 사용
+    matcher = ReplaceMatcher(replace_strings)
+    for replace_item in matcher.ignored:
+        log.write(f"경고: 빈 문자열이거나 중복된 교체 규칙은 무시합니다: \"{replace_item['from']}\"")
+    
+    index = SkipIndex(index_file, matcher.rules_hash) if index_file else None
     
     for item in file_list:
         base_dir = item['base_directory']
-        files = item['files']
         
         # 상대 경로 또는 절대 경로 처리
         if base_dir.startswith(('C:', 'D:', 'E:', 'F:', 'G:')):
@@ -128,30 +632,59 @@ def process_files(file_list, replace_strings, log_file):
         else:
             base_path = Path(os.path.join(os.path.dirname(os.path.abspath(__file__)), base_dir))
         
-        write_log(log_file, f"기준 디렉토리: {base_dir}")
+        files = expand_file_list(item, base_path)
+        log.write(f"기준 디렉토리: {base_dir} (대상 파일 {len(files)}개)", detail=True)
         
-        for file_rel_path in files:
-            file_path = base_path / file_rel_path
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            results = executor.map(lambda file_rel_path: process_file(base_path / file_rel_path, matcher, index),
+                                   files)
             
-            if not file_path.exists():
-                write_log(log_file, f"  오류: {file_rel_path} 파일을 찾을 수 없습니다.")
-                fail_count += 1
-                continue
-            
-            write_log(log_file, f"  처리: {file_rel_path}")
-            
-            result, replaced_items = replace_strings_in_file(str(file_path), replace_strings, log_file)
-            if result:
-                # 교체된 문자열 정보 표시
-                for item in replaced_items:
-                    write_log(log_file, f"    교체: \"{item['from']}\" → \"{item['to']}\"")
-                write_log(log_file, f"    결과: 성공")
-                success_count += 1
-            else:
-                write_log(log_file, f"    결과: 변경사항 없음")
-                fail_count += 1
-    
-    return success_count, fail_count
+            # executor.map 은 입력 순서대로 결과를 돌려주므로 로그 순서가 항상 같음
+            for file_rel_path, outcome in zip(files, results):
+                if outcome is SKIPPED:
+                    skip_count += 1
+                if log_file_result(log, base_path / file_rel_path, file_rel_path, outcome):
+                    success_count += 1
+                else:
+                    fail_count += 1
+    
+    if index is not None:
+        try:
+            index.save()
+        except OSError as e:
+            log.write(f"경고: 건너뛰기 인덱스를 저장하지 못했습니다: {index_file} - {str(e)}")
+    
+    return success_count, fail_count, skip_count
+
+def log_file_result(log, file_path, file_rel_path, outcome):
+    """파일 하나의 처리 결과 기록 (변경된 경우 True)"""
+    if outcome is None:
+        log.write(f"  오류: {file_rel_path} 파일을 찾을 수 없습니다.")
+        log.record("file", path=str(file_path), result="not_found")
+        return False
+    
+    if outcome is SKIPPED:
+        log.write(f"  건너뜀: {file_rel_path} (이전 실행 이후 파일과 규칙 변경 없음)", detail=True)
+        log.record("file", path=str(file_path), result="skipped")
+        return False
+    
+    log.write(f"  처리: {file_rel_path}", detail=True)
+    
+    result, replaced_items, error = outcome
+    if error:
+        log.write(error)
+    
+    if result:
+        # 교체된 문자열 정보 표시
+        for item in replaced_items:
+            log.write(f"    교체: \"{item['from']}\" → \"{item['to']}\" ({item['count']}회)", detail=True)
+        log.write(f"    결과: 성공", detail=True)
+    else:
+        log.write(f"    결과: 변경사항 없음", detail=True)
+    
+    log.record("file", path=str(file_path), result="changed" if result else "unchanged",
+               replacements=replaced_items)
+    return result
 
 def main():
     """메인 함수"""
@@ -163,42 +696,51 @@ def main():
     
     # 로그 파일 경로 설정
     log_file = args.log
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 로그 시작
-    write_log(log_file, f"스크립트: {os.path.basename(__file__)}")
-    write_log(log_file, f"실행 시간: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    write_log(log_file, f"파일 리스트: {args.file_list}")
-    write_log(log_file, f"문자열 교체 리스트: {args.replace_string_list}")
-    write_log(log_file, f"로그 파일: {log_file}")
-    write_log(log_file, "-" * 80)
-    
-    # JSON 파일 로드
-    file_list = load_json_file(args.file_list)
-    if file_list is None:
-        write_log(log_file, f"오류: 파일 리스트를 로드할 수 없습니다: {args.file_list}")
-        input("엔터 키를 눌러 종료하세요...")
-        sys.exit(1)
-    
-    replace_strings = load_json_file(args.replace_string_list)
-    if replace_strings is None:
-        write_log(log_file, f"오류: 문자열 교체 리스트를 로드할 수 없습니다: {args.replace_string_list}")
-        input("엔터 키를 눌러 종료하세요...")
-        sys.exit(1)
+    json_log_file = None
+    if args.json_log is not None:
+        json_log_file = args.json_log or f"{os.path.splitext(log_file)[0]}.jsonl"
     
-    # 파일 처리
-    write_log(log_file, "문자열 교체 작업 시작...")
-    success_count, fail_count = process_files(file_list, replace_strings, log_file)
-    
-    # 결과 요약
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    
-    write_log(log_file, "-" * 80)
-    write_log(log_file, f"처리 완료: 성공 {success_count}개, 실패 {fail_count}개")
-    write_log(log_file, f"처리 시간: {elapsed_time:.2f}초")
+    with LogWriter(log_file, quiet=args.quiet, json_file=json_log_file) as log:
+        # 로그 시작
+        log.write(f"스크립트: {os.path.basename(__file__)}")
+        log.write(f"실행 시간: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        log.write(f"파일 리스트: {args.file_list}")
+        log.write(f"문자열 교체 리스트: {args.replace_string_list}")
+        log.write(f"로그 파일: {log_file}")
+        if json_log_file:
+            log.write(f"JSON 로그 파일: {json_log_file}")
+        index_file = None if args.no_index else args.index
+        log.write(f"건너뛰기 인덱스: {index_file or '사용 안 함'}")
+        log.write("-" * 80)
+        
+        # JSON 파일 로드
+        file_list = load_json_file(args.file_list)
+        if file_list is None:
+            log.write(f"오류: 파일 리스트를 로드할 수 없습니다: {args.file_list}")
+            log.close()
+            input("엔터 키를 눌러 종료하세요...")
+            sys.exit(1)
+        
+        replace_strings = load_json_file(args.replace_string_list)
+        if replace_strings is None:
+            log.write(f"오류: 문자열 교체 리스트를 로드할 수 없습니다: {args.replace_string_list}")
+            log.close()
+            input("엔터 키를 눌러 종료하세요...")
+            sys.exit(1)
+        
+        # 파일 처리
+        log.write("문자열 교체 작업 시작...")
+        success_count, fail_count, skip_count = process_files(file_list, replace_strings, log, args.jobs, index_file)
+        
+        # 결과 요약
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        
+        log.write("-" * 80)
+        log.write(f"처리 완료: 성공 {success_count}개, 실패 {fail_count}개 (변경 없어 건너뜀 {skip_count}개)")
+        log.write(f"처리 시간: {elapsed_time:.2f}초")
+        log.record("summary", success=success_count, fail=fail_count, skipped=skip_count,
+                   elapsed=round(elapsed_time, 3))
     
     # --no-wait-exit 옵션이 사용된 경우에만 로그 파일 열기
     if args.no_wait_exit:
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 스크립트 공용 라이브러리
+10_BuildAll.py / 11_UpdateFromProject.py / 12_BuildInstaller.py 에서 함께 사용하는 기능을 모아둡니다.
+
+- cache: 입력 해시 기반 빌드 캐시 (publish 폴더, 설치파일)
+- console: 콘솔 출력 인코딩 설정 / 동시에 실행되는 단계의 출력 분리
+- context: 빌드 단계 간 공유 컨텍스트 / 단계 결과 / 작업 공간 경로
+- toolchain: .NET SDK / NSIS 동시 확인 및 확인 결과 캐시
+- manifest: 게시 폴더 매니페스트 (파일별 크기, 수정 시각, SHA-256) 및 이전 빌드와의 비교
+- variants: 게시 변형 (런타임 / self-contained) 매트릭스와 프로세스 풀 실행
+- compression: 설치파일 압축 프로필 (makensis /D 정의) 및 프로필 벤치마크 결과
+- process: dotnet / makensis 실행 (출력 동시 읽기, 단계별 로그 파일, 진행 상황 출력)
+- trace: 빌드 추적 (Chrome trace-event 형식 build_trace.json)
+- history: 빌드 이력 (SQLite) 기록 및 소요 시간 / 설치파일 크기 회귀 확인
+- version: 버전 정보 (version.json) 및 dotnet -p: 버전 속성
+- artifacts: 산출물 레지스트리 (경로, 크기, SHA-256, 변형, 생성 단계)
+- store: 콘텐츠 주소 기반 산출물 보관소 (빌드별 보관, 보관 정책, 복원 / 비교)
+- sync: 준비 폴더 → publish 폴더 동기화 (변경된 파일만 복사, 없어진 파일 삭제)
+- staging: 파일 배치 (reflink → 하드링크 → 복사) 및 복사하지 않은 bytes 통계
+- locks: 공유 빌드 캐시 / 보관소 잠금 (여러 빌드 동시 실행)
+- pipeline: 빌드 단계 의존성 그래프와 단계 동시 실행 (--until / --only)
+- checkpoint: 단계별 입력 / 출력 지문 체크포인트 (--resume 에서 바뀌지 않은 완료 단계 건너뛰기)
+"""
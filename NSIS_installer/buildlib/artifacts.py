@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 산출물 레지스트리 (build_artifacts.json)
+각 단계가 산출물을 만들 때마다 경로, 크기, SHA-256, 변형, 생성 단계를 기록합니다.
+검증 / 보고서 / 최종 요약은 폴더를 검색하지 않고 이 레지스트리에서 바로 찾습니다.
+"""
+
+import os
+import json
+import uuid
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from .cache import hash_file
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+ARTIFACT_REGISTRY_NAME = "build_artifacts.json"
+REGISTRY_VERSION = 1
+
+class ArtifactRegistry:
+    """산출물 레지스트리 (종류:변형 키로 한 건씩 보관, 같은 키로 다시 등록하면 교체)
+
+    path 가 None 이면 메모리에만 기록합니다 (작업 프로세스용, 작업이 끝나면 merge 로 합쳐짐).
+    """
+
+    def __init__(self, path=None, base_dir=None):
+        self.path = Path(path) if path else None
+        self.base_dir = Path(base_dir) if base_dir else (self.path.parent if self.path else None)
+        self.entries = self._load()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != REGISTRY_VERSION:
+            return {}
+        return data.get("artifacts", {})
+
+    @staticmethod
+    def _key(kind, variant=None):
+        return f"{kind}:{variant}" if variant else kind
+
+    def register(self, kind, path, step, variant=None, size=None, sha256=None):
+        """산출물 등록 (폴더는 size / sha256 을 직접 지정, 파일은 계산) - 등록된 항목 반환"""
+        path = Path(path)
+        stat = path.stat()
+        if size is None:
+            size = stat.st_size
+        if sha256 is None and path.is_file():
+            sha256 = hash_file(path)
+
+        try:
+            stored_path = path.resolve().relative_to(self.base_dir.resolve()) if self.base_dir else path
+        except ValueError:
+            stored_path = path.resolve()
+
+        entry = {
+            "kind": kind,
+            "variant": variant,
+            "step": step,
+            "path": stored_path.as_posix(),
+            "size": size,
+            "sha256": sha256,
+            "mtime": stat.st_mtime,
+            "registered": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        with self._lock:
+            self.entries[self._key(kind, variant)] = entry
+        self.save()
+        return entry
+
+    def get(self, kind, variant=None):
+        """종류(와 변형)로 산출물 찾기 (없으면 None)"""
+        return self.entries.get(self._key(kind, variant))
+
+    def find(self, kind):
+        """종류가 같은 산출물 목록 (등록 순서)"""
+        return [entry for entry in self.entries.values() if entry["kind"] == kind]
+
+    def resolve(self, entry):
+        """항목의 실제 경로"""
+        path = Path(entry["path"])
+        return path if path.is_absolute() or self.base_dir is None else self.base_dir / path
+
+    def is_current(self, entry):
+        """등록 이후 파일이 바뀌지 않았는지 확인 (크기 / 수정 시각 비교, 해시는 다시 계산하지 않음, 폴더는 존재 여부만)"""
+        path = self.resolve(entry)
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return path.is_dir() or (stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"])
+
+    def clear(self):
+        """새 빌드 시작 시 이전 빌드 항목 삭제"""
+        with self._lock:
+            self.entries.clear()
+        self.save()
+
+    def fork(self):
+        """작업 프로세스용 빈 레지스트리 (작업이 끝나면 merge 로 합침)"""
+        return ArtifactRegistry(base_dir=self.base_dir)
+
+    def merge(self, other):
+        """작업 프로세스에서 등록된 산출물 합치기"""
+        if other is None or other is self:
+            return
+        with self._lock:
+            self.entries.update(other.entries)
+        self.save()
+
+    def save(self):
+        """레지스트리 저장 (임시 파일 기록 후 교체, 메모리 전용이면 아무것도 하지 않음)
+
+        동시에 실행되는 단계가 등록할 때 이전 내용으로 덮어쓰지 않도록 교체까지 잠금 안에서 수행합니다.
+        """
+        if self.path is None:
+            return
+
+        with self._lock:
+            data = {"version": REGISTRY_VERSION, "artifacts": dict(self.entries)}
+            temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+
+def register_artifact(ctx, kind, path, step, size=None, sha256=None, variant=True):
+    """컨텍스트에 레지스트리가 있으면 산출물 등록 (variant=True 이면 ctx.variant, None 이면 변형 구분 없음)"""
+    if ctx.artifacts is None or path is None:
+        return None
+    return ctx.artifacts.register(kind, path, step, ctx.variant if variant is True else variant, size, sha256)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 캐시
+입력 파일들의 해시를 키로 사용하는 콘텐츠 주소 기반 캐시입니다.
+동일한 입력으로 다시 빌드하는 경우 저장된 결과물을 복원하여 빌드를 건너뜁니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import shutil
+import hashlib
+from pathlib import Path
+
+from .locks import file_lock
+from .staging import PlacementStats, place_file, place_tree
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+CACHE_ROOT = Path(__file__).resolve().parent.parent / ".build_cache"
+CACHE_MAX_ENTRIES = 6
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 소스 해시 대상 (Resources 폴더는 확장자와 관계없이 모두 포함)
+SOURCE_SUFFIXES = {".cs", ".xaml", ".csproj"}
+SOURCE_RESOURCE_DIR = "Resources"
+SOURCE_EXCLUDE_DIRS = {"bin", "obj", ".vs", ".git"}
+
+META_FILE = "meta.json"
+PAYLOAD_DIR = "payload"
+LOCK_FILE = ".lock"
+
+def hash_file(file_path):
+    """파일 SHA-256 해시 계산"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def collect_source_files(project_dir):
+    """캐시 키 계산 대상 소스 파일 목록 (상대경로 정렬)"""
+    project_dir = Path(project_dir)
+    source_files = []
+
+    for dir_path, dir_names, file_names in os.walk(project_dir):
+        dir_names[:] = [d for d in dir_names if d not in SOURCE_EXCLUDE_DIRS]
+        rel_dir = Path(dir_path).relative_to(project_dir)
+        in_resources = SOURCE_RESOURCE_DIR in rel_dir.parts
+
+        for file_name in file_names:
+            if in_resources or Path(file_name).suffix.lower() in SOURCE_SUFFIXES:
+                source_files.append((rel_dir / file_name).as_posix())
+
+    return sorted(source_files)
+
+def hash_sources(project_dir):
+    """프로젝트 소스 전체에 대한 단일 해시 계산"""
+    project_dir = Path(project_dir)
+    digest = hashlib.sha256()
+
+    for rel_path in collect_source_files(project_dir):
+        digest.update(rel_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(hash_file(project_dir / rel_path).encode("ascii"))
+        digest.update(b"\n")
+
+    return digest.hexdigest()
+
+def make_cache_key(*parts):
+    """여러 입력값을 조합하여 캐시 키 생성"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class BuildCache:
+    """네임스페이스별 캐시 저장소
+
+    항목 구조: <root>/<namespace>/<key>/meta.json, payload/
+    저장은 임시 폴더에 기록한 뒤 이름을 바꾸는 방식이므로 중단되어도 불완전한 항목이 남지 않습니다.
+    여러 빌드가 함께 쓰므로 항목 등록 / 복원 / 정리는 네임스페이스 잠금 안에서 수행하며,
+    조회 후 복원처럼 여러 단계를 묶을 때는 호출하는 쪽에서 lock() 으로 감쌉니다.
+    """
+
+    def __init__(self, namespace, root=CACHE_ROOT, max_entries=CACHE_MAX_ENTRIES):
+        self.namespace = namespace
+        self.base_dir = Path(root) / namespace
+        self.max_entries = max_entries
+
+    def entry_path(self, key):
+        """캐시 항목 경로"""
+        return self.base_dir / key
+
+    def lock(self):
+        """네임스페이스 잠금 (다른 빌드의 등록 / 정리와 겹치지 않도록)"""
+        return file_lock(self.base_dir / LOCK_FILE)
+
+    def lookup(self, key):
+        """캐시 항목 조회 (없으면 None)"""
+        with self.lock():
+            return self._lookup(key)
+
+    def _lookup(self, key):
+        entry = self.entry_path(key)
+        meta_path = entry / META_FILE
+        if not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # 최근 사용 시각 갱신 (정리 시 오래된 항목부터 삭제)
+        os.utime(meta_path, None)
+        return meta
+
+    def _store(self, key, write_payload, meta):
+        """임시 폴더에 기록 후 원자적으로 항목 등록"""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        temp_entry = self.base_dir / f".tmp-{uuid.uuid4().hex}"
+
+        try:
+            write_payload(temp_entry / PAYLOAD_DIR)
+
+            meta = dict(meta or {})
+            meta["key"] = key
+            meta["created"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            with open(temp_entry / META_FILE, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+
+            with self.lock():
+                entry = self.entry_path(key)
+                if entry.exists():
+                    shutil.rmtree(entry)
+                os.replace(temp_entry, entry)
+                self.prune()
+        finally:
+            if temp_entry.exists():
+                shutil.rmtree(temp_entry, ignore_errors=True)
+
+    def store_tree(self, key, source_dir, meta=None):
+        """폴더 전체를 캐시에 저장 (reflink / 하드링크 우선) - 파일 배치 통계 반환"""
+        stats = PlacementStats()
+        self._store(key, lambda payload: place_tree(source_dir, payload, stats, link_shared=False), meta)
+        return stats
+
+    def payload_path(self, key):
+        """캐시된 결과물 경로 (폴더 동기화 등 복사하지 않고 직접 읽을 때 사용)"""
+        return self.entry_path(key) / PAYLOAD_DIR
+
+    def restore_tree(self, key, dest_dir):
+        """캐시된 폴더를 대상 경로로 복원 (기존 내용은 삭제, reflink / 하드링크 우선) - 파일 배치 통계 반환"""
+        payload = self.payload_path(key)
+        dest_dir = Path(dest_dir)
+        if dest_dir.exists():
+            shutil.rmtree(dest_dir)
+        stats = PlacementStats()
+        with self.lock():
+            place_tree(payload, dest_dir, stats)
+        return stats
+
+    def store_file(self, key, source_file, meta=None):
+        """단일 파일을 캐시에 저장"""
+        source_file = Path(source_file)
+
+        def write_payload(payload):
+            payload.mkdir(parents=True)
+            place_file(source_file, payload / source_file.name, link_shared=False)
+
+        self._store(key, write_payload, meta)
+
+    def restore_file(self, key, dest_dir):
+        """캐시된 파일을 대상 폴더로 복원 (reflink → 하드링크 → 복사)"""
+        with self.lock():
+            payload = self.payload_path(key)
+            cached_file = next(payload.iterdir())
+            dest_path = Path(dest_dir) / cached_file.name
+
+            if dest_path.exists():
+                dest_path.unlink()
+
+            place_file(cached_file, dest_path)
+        return dest_path
+
+    def prune(self):
+        """최근 사용 순으로 max_entries 개만 남기고 삭제"""
+        if not self.base_dir.exists():
+            return
+
+        with self.lock():
+            entries = [p for p in self.base_dir.iterdir()
+                       if p.is_dir() and (p / META_FILE).exists()]
+            entries.sort(key=lambda p: (p / META_FILE).stat().st_mtime, reverse=True)
+
+            for entry in entries[self.max_entries:]:
+                shutil.rmtree(entry, ignore_errors=True)
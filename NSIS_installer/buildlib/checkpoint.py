@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 체크포인트 (build_checkpoints.json)
+파이프라인 단계가 끝날 때마다 단계 입력 / 출력 지문을 작업 공간 상태 폴더에 기록합니다.
+10_BuildAll.py --resume 은 입력과 출력이 기록과 같은 단계를 건너뛰고, 입력이 바뀌었거나 완료되지 않은 단계부터
+다시 실행합니다 (예: makensis 가 실패한 뒤 NSIS 스크립트만 고친 경우 dotnet clean/build/publish 없이 컴파일부터).
+
+단계 입력 지문에는 선행 단계의 출력 지문이 들어가므로 앞 단계가 다른 결과를 만들면 뒤 단계도 다시 실행됩니다.
+"""
+
+import os
+import json
+import uuid
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from .cache import hash_file, make_cache_key
+from .manifest import scan_tree
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+CHECKPOINT_FILE_NAME = "build_checkpoints.json"
+CHECKPOINT_VERSION = 1
+
+def fingerprint(items):
+    """입력 / 출력 지문 (파일은 내용 해시, 폴더는 파일별 상대경로 / 크기 / 수정 시각, 없는 경로는 None, 그 외는 값)"""
+    parts = []
+    for item in items:
+        if isinstance(item, Path):
+            if item.is_file():
+                parts.append([str(item), hash_file(item)])
+            elif item.is_dir():
+                parts.append([str(item), scan_tree(item)])
+            else:
+                parts.append([str(item), None])
+        else:
+            parts.append(item)
+    return make_cache_key(*parts)
+
+class CheckpointStore:
+    """단계별 체크포인트 (단계 이름 → 입력 지문, 출력 지문, 완료 시각, 소요 시간)
+
+    입력 지문이 None 인 단계 (항상 실행하는 단계) 도 출력 지문을 기록하여 --only 로 건너뛴 선행 단계의 지문으로 사용합니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CHECKPOINT_VERSION:
+            return {}
+        return data.get("steps", {})
+
+    def get(self, name):
+        """단계 체크포인트 (없으면 None)"""
+        return self.entries.get(name)
+
+    def completed(self):
+        """체크포인트가 있는 단계 이름 목록 (완료 순서)"""
+        return sorted(self.entries, key=lambda name: self.entries[name]["completed"])
+
+    def record(self, name, inputs, outputs, elapsed):
+        """단계 완료 기록"""
+        entry = {
+            "inputs": inputs,
+            "outputs": outputs,
+            "elapsed": round(elapsed, 3),
+            "completed": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        with self._lock:
+            self.entries[name] = entry
+        self.save()
+        return entry
+
+    def discard(self, name):
+        """단계 체크포인트 삭제 (다시 실행을 시작할 때 - 실패하면 기록이 남지 않도록)"""
+        with self._lock:
+            if self.entries.pop(name, None) is None:
+                return
+        self.save()
+
+    def clear(self):
+        """새 빌드 시작 시 이전 빌드 체크포인트 삭제"""
+        with self._lock:
+            self.entries.clear()
+        self.save()
+
+    def save(self):
+        """체크포인트 저장 (임시 파일 기록 후 교체, 동시에 끝난 단계가 덮어쓰지 않도록 잠금 안에서 교체)"""
+        with self._lock:
+            data = {"version": CHECKPOINT_VERSION, "steps": dict(self.entries)}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 설치파일 압축 프로필
+NSIS 스크립트를 수정하지 않고 /DCOMPRESSOR, /DCOMPRESSOR_DICT_SIZE 정의로 압축 방식을 바꿉니다.
+12_BuildInstaller.py --benchmark-compression 에서 프로필별 결과를 비교하고 예산에 맞는 프로필을 고릅니다.
+"""
+
+import os
+import json
+import uuid
+from pathlib import Path
+
+from .cache import CACHE_ROOT
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+COMPRESSION_PROFILES = {
+    "lzma-solid": {"compressor": "/SOLID lzma", "dict_size": None},
+    "lzma-solid-32m": {"compressor": "/SOLID lzma", "dict_size": 32},
+    "lzma-solid-64m": {"compressor": "/SOLID lzma", "dict_size": 64},
+    "lzma": {"compressor": "lzma", "dict_size": None},
+    "bzip2-solid": {"compressor": "/SOLID bzip2", "dict_size": None},
+    "bzip2": {"compressor": "bzip2", "dict_size": None},
+    "zlib-solid": {"compressor": "/SOLID zlib", "dict_size": None},
+    "zlib": {"compressor": "zlib", "dict_size": None}
+}
+DEFAULT_PROFILE = "lzma-solid"
+
+# 설치 시 압축 해제 속도 추정치 (MB/s, 일반적인 x64 PC 기준 대략값)
+DECOMPRESS_THROUGHPUT_MB = {"zlib": 250.0, "lzma": 80.0, "bzip2": 35.0}
+
+BENCHMARK_RESULT_FILE = CACHE_ROOT / "compression_benchmark.json"
+
+def get_compression_defines(profile):
+    """프로필에 해당하는 makensis /D 정의 (기본 프로필은 정의 없음 = NSIS 스크립트 기본값)"""
+    if not profile or profile == DEFAULT_PROFILE:
+        return {}
+
+    spec = COMPRESSION_PROFILES[profile]
+    defines = {"COMPRESSOR": spec["compressor"]}
+    if spec["dict_size"]:
+        defines["COMPRESSOR_DICT_SIZE"] = str(spec["dict_size"])
+    return defines
+
+def describe_profile(profile):
+    """프로필 설명 (정보 파일 출력용)"""
+    spec = COMPRESSION_PROFILES[profile or DEFAULT_PROFILE]
+    solid = spec["compressor"].startswith("/SOLID")
+    text = spec["compressor"].split()[-1].upper() + (" (solid)" if solid else "")
+    if spec["dict_size"]:
+        text += f", 사전 {spec['dict_size']} MB"
+    return text
+
+def estimate_extraction_seconds(profile, installed_bytes):
+    """설치 시 압축 해제 시간 추정 (초)
+
+    solid 압축은 파일 하나만 필요해도 앞부분을 모두 풀어야 하지만 전체 설치 기준으로는 같으므로
+    알고리즘별 처리량만으로 추정합니다.
+    """
+    algorithm = COMPRESSION_PROFILES[profile]["compressor"].split()[-1]
+    return installed_bytes / 1024 / 1024 / DECOMPRESS_THROUGHPUT_MB[algorithm]
+
+def select_profile(results, size_budget=None, time_budget=None):
+    """예산에 맞는 프로필 선택
+
+    results: [{"profile", "success", "size", "compile_time", ...}]
+    size_budget: 설치파일 최대 크기 (bytes), time_budget: 최대 컴파일 시간 (초)
+    크기 예산만 있으면 그 안에서 가장 빠른 프로필, 그 외에는 예산 안에서 가장 작은 프로필을 고릅니다.
+    """
+    candidates = [r for r in results if r["success"]]
+    if size_budget is not None:
+        candidates = [r for r in candidates if r["size"] <= size_budget]
+    if time_budget is not None:
+        candidates = [r for r in candidates if r["compile_time"] <= time_budget]
+    if not candidates:
+        return None
+
+    if size_budget is not None and time_budget is None:
+        return min(candidates, key=lambda r: (r["compile_time"], r["size"]))
+    return min(candidates, key=lambda r: (r["size"], r["compile_time"]))
+
+def save_benchmark(results, selected, benchmark_file=BENCHMARK_RESULT_FILE):
+    """벤치마크 결과 저장 (--compression auto 에서 선택된 프로필 사용)"""
+    benchmark_file = Path(benchmark_file)
+    benchmark_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = benchmark_file.with_name(f".{benchmark_file.name}.{uuid.uuid4().hex}")
+
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump({"selected": selected, "results": results}, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, benchmark_file)
+
+def load_selected_profile(benchmark_file=BENCHMARK_RESULT_FILE):
+    """저장된 벤치마크에서 선택된 프로필 (없으면 None)"""
+    try:
+        with open(benchmark_file, "r", encoding="utf-8") as f:
+            selected = json.load(f).get("selected")
+    except (OSError, ValueError):
+        return None
+    return selected if selected in COMPRESSION_PROFILES else None
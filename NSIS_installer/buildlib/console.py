@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 콘솔 설정
+출력 인코딩 설정과, 동시에 실행되는 빌드 단계의 출력이 섞이지 않도록 단계별로 모아서 출력하는 기능을 제공합니다.
+"""
+
+import io
+import sys
+import codecs
+import threading
+from contextlib import contextmanager
+
+def setup_console():
+    """표준 출력/오류를 UTF-8로 설정 (여러 번 호출해도 한 번만 적용)"""
+    # 이미 UTF-8 이거나 콘솔이 아닌 스트림 (출력 수집용 StringIO 등) 은 그대로 사용
+    if not hasattr(sys.stdout, "buffer") or (sys.stdout.encoding or "").lower() in ("utf-8", "utf8"):
+        return
+
+    if hasattr(sys.stdout, "reconfigure") and hasattr(sys.stderr, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+    elif not isinstance(sys.stdout, codecs.StreamWriter):
+        sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "replace")
+        sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "replace")
+
+class StepOutput:
+    """단계별 출력 분리 (sys.stdout 대신 사용, 스레드마다 출력 대상을 따로 둠)
+
+    먼저 시작한 단계 하나는 바로 출력하고, 그동안 함께 실행되는 단계의 출력은 모아 두었다가
+    바로 출력하는 단계가 끝나면 단계 단위로 출력합니다.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live = None
+        self._pending = []
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def target(self):
+        """현재 스레드의 출력 대상 (모으는 중이면 버퍼)"""
+        return getattr(self._local, "buffer", None) or self.stream
+
+    def write(self, text):
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+    @contextmanager
+    def capture(self):
+        """현재 스레드에서 실행하는 단계의 출력 구간"""
+        with self._lock:
+            live = self._live is None
+            if live:
+                self._live = threading.get_ident()
+        self._local.buffer = None if live else io.StringIO()
+        try:
+            yield
+        finally:
+            buffer = self._local.buffer
+            self._local.buffer = None
+            with self._lock:
+                if live:
+                    self._live = None
+                else:
+                    self._pending.append(buffer.getvalue())
+                if self._live is None:
+                    for text in self._pending:
+                        self.stream.write(text)
+                    self._pending.clear()
+                    self.stream.flush()
+
+def current_output():
+    """현재 스레드의 출력 대상 (도구 출력을 읽는 스레드처럼 단계 안에서 만든 스레드에 넘겨줄 때 사용)"""
+    stream = sys.stdout
+    return stream.target() if isinstance(stream, StepOutput) else stream
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 컨텍스트
+10_BuildAll.py 가 각 빌드 단계(11, 12)를 같은 프로세스에서 호출할 때 공유하는 정보입니다.
+
+모든 산출물 경로는 작업 공간 (workspace) 기준으로 계산하며 현재 디렉터리를 바꾸지 않습니다.
+작업 공간을 따로 지정하면 같은 컴퓨터에서 여러 빌드를 동시에 실행할 수 있습니다
+(빌드 캐시 / 산출물 보관소 / 도구 확인 결과는 스크립트 폴더의 .build_cache 를 잠금과 함께 공유).
+"""
+
+from pathlib import Path
+from dataclasses import dataclass, field
+
+from .variants import DEFAULT_VARIANT
+
+@dataclass
+class BuildContext:
+    """빌드 단계 간 공유 정보 (제품 정보, 확인된 도구 경로, 산출물 경로)"""
+    product_name: str
+    product_version: str
+    build_date: str
+    script_dir: Path
+    assembly_version: str = None
+
+    # 빌드 작업 공간 (None이면 script_dir) - 게시 폴더, 설치파일, 정보 파일, 로그, 준비 폴더를 이 아래에 만듦
+    workspace_dir: Path = None
+    project_file_name: str = "NationalClock.csproj"
+    nsis_script_name: str = "NationalClock_Installer.nsi"
+    use_cache: bool = True
+
+    # 게시 변형 (isolated_build 이면 변형별 obj/bin 폴더로 게시만 수행 - 동시 실행용)
+    variant: str = DEFAULT_VARIANT
+    isolated_build: bool = False
+
+    # 준비 폴더에 게시한 뒤 publish 폴더에 변경된 파일만 동기화 (publish 폴더를 삭제하지 않음)
+    warm_workspace: bool = False
+
+    # 빌드 전에 dotnet clean 수행 (기본값은 MSBuild 증분 빌드 - 버전이 바뀌어도 -p: 속성만 새로 전달)
+    clean_build: bool = False
+
+    # 설치파일 압축 프로필 (None이면 NSIS 스크립트 기본값)
+    compression: str = None
+
+    # 확인된 도구 정보 (None이면 각 단계에서 직접 확인)
+    dotnet_version: str = None
+    nsis_path: str = None
+    nsis_version: str = None
+
+    # 단계별 결과 (캐시 키는 캐시를 사용하지 않았거나 적중하면 None - 나뉜 단계에서 결과를 캐시에 저장할 때 사용)
+    publish_manifest: dict = None
+    publish_diff: dict = None
+    installer_path: Path = None
+    publish_cache_key: str = None
+    installer_cache_key: str = None
+    results: dict = field(default_factory=dict)
+    variants: dict = field(default_factory=dict)
+
+    # 빌드 추적 (BuildTracer, None이면 기록하지 않음)
+    tracer: object = None
+
+    # 산출물 레지스트리 (ArtifactRegistry, None이면 기록하지 않음)
+    artifacts: object = None
+
+    @property
+    def project_dir(self):
+        return self.script_dir.parent / "NationalClock"
+
+    @property
+    def project_file(self):
+        return self.project_dir / self.project_file_name
+
+    @property
+    def workspace(self):
+        return self.workspace_dir or self.script_dir
+
+    @property
+    def state_dir(self):
+        """작업 공간 전용 상태 폴더 (기본 작업 공간이면 공유 캐시 폴더와 같음)"""
+        return self.workspace / ".build_cache"
+
+    @property
+    def log_dir(self):
+        return self.state_dir / "logs"
+
+    @property
+    def work_dir(self):
+        """변형별 obj/bin 폴더 (동시 게시용)"""
+        return self.state_dir / "work" / self.variant
+
+    @property
+    def publish_root(self):
+        return self.workspace / "publish"
+
+    @property
+    def publish_dir(self):
+        return self.publish_root / self.variant
+
+    @property
+    def staging_dir(self):
+        return self.state_dir / "staging" / self.variant
+
+    @property
+    def publish_manifest_path(self):
+        return self.publish_root / f"{self.publish_dir.name}.manifest.json"
+
+    @property
+    def previous_manifest_path(self):
+        """이전 빌드 매니페스트 보관 경로 (publish 폴더는 빌드마다 삭제되므로 상태 폴더에 보관)"""
+        return self.state_dir / "manifests" / f"{self.publish_dir.name}.last.json"
+
+    @property
+    def baseline_manifest_path(self):
+        """마지막 매니페스트 단계가 비교한 이전 빌드 매니페스트 (--resume 으로 건너뛸 때 비교 정보를 다시 계산)"""
+        return self.state_dir / "manifests" / f"{self.publish_dir.name}.base.json"
+
+    @property
+    def nsis_script(self):
+        return self.script_dir / self.nsis_script_name
+
+    @property
+    def installer_suffix(self):
+        return "" if self.variant == DEFAULT_VARIANT else f"_{self.variant}"
+
+    @property
+    def installer_name(self):
+        return f"{self.product_name}_v{self.product_version}_Build_{self.build_date}{self.installer_suffix}_Setup.exe"
+
+@dataclass
+class StepResult:
+    """빌드 단계 실행 결과"""
+    name: str
+    success: bool
+    cache_hit: bool = False
+    artifacts: dict = field(default_factory=dict)
+    elapsed: float = 0.0
+
+def resolve_workspace(path):
+    """명령행 --workspace 값을 작업 공간 경로로 변환 (없으면 생성, 지정하지 않으면 None = 스크립트 폴더)"""
+    if not path:
+        return None
+    workspace = Path(path).resolve()
+    workspace.mkdir(parents=True, exist_ok=True)
+    return workspace
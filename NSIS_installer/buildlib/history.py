@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 이력 (SQLite)
+빌드마다 단계별 소요 시간, 설치파일 크기, 게시 파일 수/크기, 도구 버전을 기록하고
+최근 빌드 기준값과 비교하여 빌드 시간 / 설치파일 크기 회귀를 찾습니다.
+"""
+
+import sqlite3
+import statistics
+from datetime import datetime
+from contextlib import closing
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+HISTORY_FILE_NAME = "build_history.db"
+BASELINE_WINDOW = 10        # 기준값 계산에 사용할 최근 성공 빌드 수
+MIN_BASELINE_BUILDS = 3     # 기준 빌드가 이보다 적으면 비교하지 않음
+TIME_THRESHOLD = 0.20       # 단계 소요 시간 증가 허용 비율 (20%)
+SIZE_THRESHOLD = 0.05       # 설치파일 크기 증가 허용 비율 (5%)
+MIN_STEP_SECONDS = 1.0      # 기준값이 이보다 짧은 단계는 비교하지 않음 (측정 오차)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    finished TEXT NOT NULL,
+    product_version TEXT,
+    build_date TEXT,
+    variant TEXT,
+    success INTEGER NOT NULL,
+    total_seconds REAL,
+    publish_cache_hit INTEGER,
+    installer_cache_hit INTEGER,
+    installer_name TEXT,
+    installer_size INTEGER,
+    publish_file_count INTEGER,
+    publish_total_size INTEGER,
+    dotnet_version TEXT,
+    nsis_version TEXT,
+    compression TEXT
+);
+CREATE TABLE IF NOT EXISTS steps (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (build_id, name)
+);
+"""
+
+def connect(db_path):
+    """이력 DB 연결 (없으면 생성)"""
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def record_build(db_path, build, steps):
+    """빌드 한 건 기록 (build: builds 열 이름별 값, steps: 단계 이름별 초) - 기록된 id 반환"""
+    build = dict(build, finished=build.get("finished") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    columns = ", ".join(build)
+    placeholders = ", ".join("?" for _ in build)
+
+    with closing(connect(db_path)) as conn, conn:
+        build_id = conn.execute(f"INSERT INTO builds ({columns}) VALUES ({placeholders})",
+                                list(build.values())).lastrowid
+        conn.executemany("INSERT INTO steps (build_id, name, seconds) VALUES (?, ?, ?)",
+                         [(build_id, name, seconds) for name, seconds in steps.items()])
+    return build_id
+
+def recent_builds(db_path, limit=10):
+    """최근 빌드 목록 (최신순)"""
+    with closing(connect(db_path)) as conn:
+        return [dict(row) for row in conn.execute("SELECT * FROM builds ORDER BY id DESC LIMIT ?", (limit,))]
+
+def _steps(conn, build_id):
+    return {row["name"]: row["seconds"]
+            for row in conn.execute("SELECT name, seconds FROM steps WHERE build_id = ?", (build_id,))}
+
+def _check(findings, metric, value, samples, threshold, minimum=0):
+    """기준값(중앙값) 대비 threshold 비율 이상 증가했으면 findings 에 추가"""
+    if value is None or len(samples) < MIN_BASELINE_BUILDS:
+        return
+
+    baseline = statistics.median(samples)
+    if baseline < minimum or baseline <= 0:
+        return
+    change = value / baseline - 1
+    if change > threshold:
+        findings.append({"metric": metric, "baseline": baseline, "value": value, "change": change})
+
+def find_regressions(db_path, build_id=None, window=BASELINE_WINDOW,
+                     time_threshold=TIME_THRESHOLD, size_threshold=SIZE_THRESHOLD):
+    """빌드 한 건을 최근 성공 빌드 기준값과 비교
+
+    시간은 같은 변형이면서 캐시 사용 여부가 같은 빌드끼리만 비교합니다 (캐시 적중 빌드는 훨씬 빠름).
+    반환값: (대상 빌드, 기준 빌드 수, 회귀 목록) - 대상 빌드가 없으면 (None, 0, [])
+    """
+    with closing(connect(db_path)) as conn:
+        if build_id is None:
+            target = conn.execute("SELECT * FROM builds ORDER BY id DESC LIMIT 1").fetchone()
+        else:
+            target = conn.execute("SELECT * FROM builds WHERE id = ?", (build_id,)).fetchone()
+        if target is None:
+            return None, 0, []
+
+        same_kind = conn.execute(
+            """SELECT * FROM builds WHERE success = 1 AND id < ? AND variant IS ?
+               AND publish_cache_hit IS ? AND installer_cache_hit IS ?
+               ORDER BY id DESC LIMIT ?""",
+            (target["id"], target["variant"], target["publish_cache_hit"], target["installer_cache_hit"], window)
+        ).fetchall()
+        same_variant = conn.execute(
+            "SELECT installer_size FROM builds WHERE success = 1 AND id < ? AND variant IS ? ORDER BY id DESC LIMIT ?",
+            (target["id"], target["variant"], window)
+        ).fetchall()
+
+        findings = []
+        _check(findings, "전체 소요 시간 (초)", target["total_seconds"],
+               [row["total_seconds"] for row in same_kind if row["total_seconds"] is not None],
+               time_threshold, MIN_STEP_SECONDS)
+
+        baseline_steps = [_steps(conn, row["id"]) for row in same_kind]
+        for name, seconds in sorted(_steps(conn, target["id"]).items()):
+            _check(findings, f"{name} (초)", seconds,
+                   [steps[name] for steps in baseline_steps if name in steps],
+                   time_threshold, MIN_STEP_SECONDS)
+
+        _check(findings, "설치파일 크기 (bytes)", target["installer_size"],
+               [row["installer_size"] for row in same_variant if row["installer_size"]],
+               size_threshold)
+
+    return dict(target), len(same_kind), findings
+
+def format_regressions(findings):
+    """회귀 목록을 출력용 문자열 목록으로 변환 (증가율이 큰 순)"""
+    lines = []
+    for finding in sorted(findings, key=lambda f: f["change"], reverse=True):
+        if "bytes" in finding["metric"]:
+            values = f"{finding['baseline']:,.0f} → {finding['value']:,}"
+        else:
+            values = f"{finding['baseline']:.1f} → {finding['value']:.1f}"
+        lines.append(f"{finding['metric']}: {values} ({finding['change']:+.0%})")
+    return lines
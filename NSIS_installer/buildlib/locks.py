@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 공유 캐시 잠금
+여러 빌드 (다른 작업 공간, 다른 프로세스 / 스레드) 가 같은 빌드 캐시와 산출물 보관소를 함께 쓸 때
+항목 저장 / 복원 / 정리가 서로 겹치지 않도록 잠금 파일로 배타 잠금을 잡습니다.
+같은 스레드에서는 다시 잡을 수 있습니다 (조회 후 복원처럼 여러 단계를 한 번에 묶을 때).
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Unix
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+LOCK_RETRY_INTERVAL = 0.1  # 초 (Windows 잠금 재시도 간격)
+
+class _PathLock:
+    """잠금 파일 하나에 대한 스레드 잠금 + 파일 잠금 상태"""
+
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.handle = None
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+def _acquire(handle):
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return
+
+    handle.seek(0)
+    while True:
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            time.sleep(LOCK_RETRY_INTERVAL)
+
+def _release(handle):
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def file_lock(lock_path):
+    """lock_path 잠금 파일로 프로세스 간 배타 잠금 (같은 스레드에서 중첩 허용)"""
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    key = os.path.normcase(str(lock_path.resolve()))
+
+    with _locks_guard:
+        entry = _locks.setdefault(key, _PathLock())
+
+    with entry.thread_lock:
+        if entry.depth == 0:
+            entry.handle = open(lock_path, "a+b")
+            try:
+                _acquire(entry.handle)
+            except BaseException:
+                entry.handle.close()
+                entry.handle = None
+                raise
+        entry.depth += 1
+        try:
+            yield
+        finally:
+            entry.depth -= 1
+            if entry.depth == 0:
+                _release(entry.handle)
+                entry.handle.close()
+                entry.handle = None
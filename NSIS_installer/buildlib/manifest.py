@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 게시 폴더 매니페스트
+publish 폴더를 한 번만 읽어 파일별 (상대경로, 크기, 수정 시각, SHA-256) 목록을 만들고 JSON으로 저장합니다.
+게시 파일 검증, 설치파일 캐시 키, 빌드 보고서가 모두 이 매니페스트를 사용합니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import hash_file
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+MANIFEST_VERSION = 1
+HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+def scan_tree(root_dir):
+    """os.scandir 기반 폴더 순회 (상대경로, 크기, 수정 시각 목록)"""
+    root_dir = Path(root_dir)
+    entries = []
+    pending = [(str(root_dir), "")]
+
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, rel_path))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    entries.append((rel_path, stat.st_size, stat.st_mtime_ns))
+
+    entries.sort()
+    return entries
+
+def compute_tree_hash(files):
+    """파일 목록 전체를 대표하는 해시 (상대경로 + 크기 + 내용 해시)"""
+    digest = hashlib.sha256()
+    for rel_path in sorted(files):
+        info = files[rel_path]
+        digest.update(f"{rel_path}\0{info['size']}\0{info['sha256']}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def build_manifest(root_dir, previous=None, workers=HASH_WORKERS):
+    """매니페스트 생성
+
+    previous 매니페스트에서 크기와 수정 시각이 같은 파일은 해시를 재사용하고,
+    나머지 파일만 스레드 풀에서 병렬로 해시합니다 (hashlib 은 GIL 을 해제함).
+    """
+    root_dir = Path(root_dir)
+    previous_files = (previous or {}).get("files", {})
+
+    files = {}
+    to_hash = []
+    for rel_path, size, mtime_ns in scan_tree(root_dir):
+        info = {"size": size, "mtime_ns": mtime_ns}
+        old = previous_files.get(rel_path)
+        if old and old.get("size") == size and old.get("mtime_ns") == mtime_ns and old.get("sha256"):
+            info["sha256"] = old["sha256"]
+        else:
+            to_hash.append(rel_path)
+        files[rel_path] = info
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(lambda rel: hash_file(root_dir / rel), to_hash)
+            for rel_path, digest in zip(to_hash, digests):
+                files[rel_path]["sha256"] = digest
+
+    return {
+        "version": MANIFEST_VERSION,
+        "root": str(root_dir),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "file_count": len(files),
+        "total_size": sum(info["size"] for info in files.values()),
+        "hashed_count": len(to_hash),
+        "tree_hash": compute_tree_hash(files),
+        "files": files
+    }
+
+def write_manifest(manifest, manifest_path):
+    """매니페스트 JSON 저장 (임시 파일 기록 후 교체)"""
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_name(f".{manifest_path.name}.{uuid.uuid4().hex}")
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+def load_manifest(manifest_path):
+    """매니페스트 JSON 로드 (없거나 형식이 다르면 None)"""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+def diff_manifests(old, new):
+    """두 매니페스트 비교 (추가/삭제/변경 파일과 크기 변화)"""
+    old_files = (old or {}).get("files", {})
+    new_files = new.get("files", {})
+
+    added = [(rel, new_files[rel]["size"]) for rel in sorted(new_files.keys() - old_files.keys())]
+    removed = [(rel, old_files[rel]["size"]) for rel in sorted(old_files.keys() - new_files.keys())]
+    changed = [(rel, old_files[rel]["size"], new_files[rel]["size"])
+               for rel in sorted(new_files.keys() & old_files.keys())
+               if new_files[rel]["sha256"] != old_files[rel]["sha256"]]
+
+    size_delta = (sum(size for _, size in added) - sum(size for _, size in removed)
+                  + sum(new_size - old_size for _, old_size, new_size in changed))
+
+    return {
+        "has_previous": old is not None,
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "size_delta": size_delta,
+        "is_empty": old is not None and not (added or removed or changed)
+    }
+
+def format_manifest_diff(diff, limit=20):
+    """매니페스트 비교 결과를 출력용 문자열 목록으로 변환 (크기 변화가 큰 순)"""
+    if not diff["has_previous"]:
+        return ["이전 빌드 매니페스트 없음 (첫 빌드)"]
+    if diff["is_empty"]:
+        return ["변경된 파일 없음"]
+
+    lines = [f"추가 {len(diff['added'])}개, 삭제 {len(diff['removed'])}개, "
+             f"변경 {len(diff['changed'])}개, 크기 변화 {diff['size_delta']:+,} bytes"]
+
+    rows = [(size, f"+ {rel} ({size:+,} bytes)") for rel, size in diff["added"]]
+    rows += [(-size, f"- {rel} ({-size:+,} bytes)") for rel, size in diff["removed"]]
+    rows += [(new - old, f"* {rel} ({old:,} → {new:,}, {new - old:+,} bytes)")
+             for rel, old, new in diff["changed"]]
+    rows.sort(key=lambda row: abs(row[0]), reverse=True)
+
+    lines += [text for _, text in rows[:limit]]
+    if len(rows) > limit:
+        lines.append(f"... 외 {len(rows) - limit}개")
+    return lines
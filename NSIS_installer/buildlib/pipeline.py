@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 파이프라인 (단계 의존성 그래프)
+10_BuildAll.py 의 빌드 단계를 선행 단계와 함께 선언하고, 선행 단계가 모두 끝난 단계부터
+작업 수 제한 안에서 동시에 실행합니다 (예: 도구 확인과 NuGet 복원, makensis 와 버전 파일 기록).
+
+단계 함수는 같은 컨텍스트를 공유하는 스레드에서 실행되며 (dotnet / makensis 는 별도 프로세스),
+출력은 단계별로 모아서 출력합니다 (console.StepOutput).
+한 단계가 실패하면 새 단계는 시작하지 않고 실행 중인 단계가 끝나기를 기다립니다.
+
+체크포인트 저장소를 넘기면 끝난 단계마다 입력 / 출력 지문을 기록하고, resume=True 이면
+입력과 출력이 기록과 같은 단계는 실행하지 않고 건너뜁니다 (checkpoint.CheckpointStore).
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .cache import make_cache_key
+from .checkpoint import fingerprint
+from .console import StepOutput
+from .context import StepResult
+from .trace import trace_span
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+STEP_WORKERS = 4  # 동시에 실행할 빌드 단계 수
+
+@dataclass
+class PipelineStep:
+    """파이프라인 단계 (name: 명령행에서 쓰는 이름, func: ctx 를 받아 StepResult 또는 bool 반환)
+
+    inputs / outputs: ctx 를 받아 체크포인트 지문 대상 (경로 또는 값) 목록을 반환하는 함수
+    inputs 가 None 이면 --resume 에서도 항상 실행하고, outputs 가 None 이면 입력 지문을 출력 지문으로 사용합니다.
+    restore: 체크포인트로 건너뛰거나 선택되지 않은 단계가 이후 단계에서 읽는 ctx 값을 이전 실행 결과로 채우는 함수
+    (False 를 반환하면 건너뛰지 않고 다시 실행)
+    """
+    name: str
+    description: str
+    func: object
+    deps: tuple = ()
+    inputs: object = None
+    outputs: object = None
+    restore: object = None
+
+class StopPipeline(Exception):
+    """남은 단계를 시작하지 않고 파이프라인을 정상 종료 (예: --exit-if-unchanged)"""
+
+@dataclass
+class PipelineRun:
+    """파이프라인 실행 결과 (단계별 결과, 파이프라인 시작 기준 시작 / 종료 시각, 체크포인트로 건너뛴 단계)
+
+    실행 중에도 끝난 단계부터 채워지므로 단계 함수에서 앞 단계 결과를 읽을 수 있습니다 (빌드 보고서).
+    """
+    selected: list = field(default_factory=list)
+    results: dict = field(default_factory=dict)
+    timings: dict = field(default_factory=dict)
+    failed: list = field(default_factory=list)
+    not_run: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    stopped: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def success(self):
+        return not self.failed and not self.not_run
+
+def check_graph(steps):
+    """단계 이름 중복, 없는 선행 단계, 순환 의존 확인 (문제가 있으면 ValueError)"""
+    by_name = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"단계 이름 중복: {step.name}")
+        by_name[step.name] = step
+
+    for step in steps:
+        unknown = [dep for dep in step.deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"{step.name}: 알 수 없는 선행 단계 {', '.join(unknown)}")
+
+    # 선행 단계가 없는 단계부터 차례로 지워 나가며 남는 단계가 있으면 순환
+    remaining = {step.name: set(step.deps) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"순환 의존: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return by_name
+
+def _with_dependencies(by_name, names):
+    """지정한 단계와 그 선행 단계 전체"""
+    selected = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(by_name[name].deps)
+    return selected
+
+def parse_step_names(steps, value):
+    """명령행 단계 목록 해석 (쉼표 구분, 알 수 없는 이름이면 ValueError)"""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    known = [step.name for step in steps]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {', '.join(unknown)} (사용 가능: {', '.join(known)})")
+    return names
+
+def select_steps(steps, until=None, only=None):
+    """실행할 단계 이름 집합
+
+    until: 지정한 단계와 그 선행 단계 전체
+    only: 지정한 단계만 (선행 단계는 실행하지 않고 이전 빌드에서 만든 결과를 그대로 사용)
+    """
+    by_name = check_graph(steps)
+    if only:
+        return set(parse_step_names(steps, only))
+    if until:
+        return _with_dependencies(by_name, parse_step_names(steps, until))
+    return set(by_name)
+
+def _input_key(step, ctx, dep_outputs):
+    """단계 입력 지문 (단계 입력 + 선행 단계 출력 지문, 항상 실행하는 단계는 None)"""
+    if step.inputs is None:
+        return None
+    return make_cache_key(step.name, fingerprint(step.inputs(ctx)), dep_outputs)
+
+def _output_key(step, ctx, input_key):
+    """단계 출력 지문"""
+    return fingerprint(step.outputs(ctx)) if step.outputs else input_key
+
+def _can_skip(step, ctx, checkpoint, input_key):
+    """체크포인트와 입력 / 출력 지문이 같은지 확인 (출력 파일이 지워졌거나 바뀌었으면 다시 실행)"""
+    return (checkpoint is not None and input_key is not None and checkpoint["inputs"] == input_key
+            and checkpoint["outputs"] == _output_key(step, ctx, input_key))
+
+def _restore(step, ctx):
+    """실행하지 않는 단계의 ctx 값 복원 (복원할 수 없으면 False)"""
+    return step.restore is None or bool(step.restore(ctx))
+
+def _run_step(step, ctx, output, checkpoints=None, dep_outputs=None, resume=False):
+    """단계 하나 실행 (작업 스레드) - (StepResult, StopPipeline 여부, 건너뜀 여부, 출력 지문, 시작 시각, 종료 시각)"""
+    with output.capture():
+        start_time = time.time()
+        stopped = skipped = False
+        output_key = None
+        try:
+            with trace_span(ctx, step.description, "stage", step=step.name):
+                input_key = _input_key(step, ctx, dep_outputs) if checkpoints is not None else None
+                checkpoint = checkpoints.get(step.name) if checkpoints is not None else None
+                if resume and _can_skip(step, ctx, checkpoint, input_key) and _restore(step, ctx):
+                    outcome, skipped, output_key = True, True, checkpoint["outputs"]
+                else:
+                    if checkpoints is not None:
+                        checkpoints.discard(step.name)
+                    outcome = step.func(ctx)
+        except StopPipeline:
+            outcome, stopped = True, True
+        except Exception as e:
+            print(f"   ❌ {step.name} 중 오류 발생: {str(e)}")
+            outcome = False
+
+        if isinstance(outcome, StepResult):
+            result = outcome
+        else:
+            result = StepResult(step.name, bool(outcome))
+
+        # 끝난 단계의 출력 지문 기록 (중단된 단계는 기록하지 않음)
+        if result.success and not skipped and not stopped and checkpoints is not None:
+            try:
+                output_key = _output_key(step, ctx, input_key)
+                checkpoints.record(step.name, input_key, output_key, time.time() - start_time)
+            except Exception as e:
+                print(f"   ⚠ 체크포인트 기록 실패 (다음 --resume 에서 다시 실행): {str(e)}")
+        end_time = time.time()
+
+        if skipped:
+            print(f"⏭️ {step.name} 건너뜀 (입력 / 출력이 {checkpoint['completed']} 체크포인트와 같음)")
+        elif result.success:
+            cache_note = " (캐시 사용)" if result.cache_hit else ""
+            print(f"✅ {step.name} 완료! ({end_time - start_time:.1f}초){cache_note}")
+        else:
+            print(f"❌ {step.name} 실패!")
+        print()
+        return result, stopped, skipped, output_key, start_time, end_time
+
+def run_pipeline(steps, ctx, selected=None, workers=STEP_WORKERS, checkpoints=None, resume=False, run=None):
+    """선택된 단계를 의존 순서대로 실행 (선행 단계가 끝난 단계는 workers 개까지 동시에) - PipelineRun
+
+    run 을 넘기면 그 PipelineRun 에 결과를 기록합니다 (단계 함수가 실행 중인 결과를 읽을 때).
+
+    선택되지 않은 선행 단계는 이미 끝난 것으로 보고 출력 지문은 체크포인트 기록을, ctx 값은 restore 를 사용합니다 (--only).
+    checkpoints 가 있으면 끝난 단계를 기록하고, resume=True 이면 기록과 같은 단계는 건너뜁니다.
+    """
+    by_name = check_graph(steps)
+    selected = set(by_name) if selected is None else set(selected)
+    order = [step.name for step in steps if step.name in selected]
+    done = set(by_name) - selected
+    output_keys = {}
+    if checkpoints is not None:
+        for name in done:
+            checkpoint = checkpoints.get(name)
+            output_keys[name] = checkpoint["outputs"] if checkpoint else None
+    if run is None:
+        run = PipelineRun()
+    run.selected = order
+    pipeline_start = time.time()
+
+    # 선택되지 않은 단계의 결과는 이전 실행 기록에서 복원 (--only)
+    for step in steps:
+        if step.name in done:
+            _restore(step, ctx)
+
+    # 동시에 실행되는 단계의 출력이 섞이지 않도록 파이프라인 실행 중에는 단계별로 출력
+    output = StepOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            running = {}
+            pending = list(order)
+            while pending or running:
+                # 실패 / 중단 후에는 새 단계를 시작하지 않음
+                if not run.failed and not run.stopped:
+                    for name in [name for name in pending if done.issuperset(by_name[name].deps)]:
+                        pending.remove(name)
+                        dep_outputs = {dep: output_keys.get(dep) for dep in by_name[name].deps}
+                        running[executor.submit(_run_step, by_name[name], ctx, output, checkpoints, dep_outputs,
+                                                resume)] = name
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    result, stopped, skipped, output_key, start_time, end_time = future.result()
+                    # 실행 중에 결과를 읽는 단계가 있으므로 results 는 시각 / 건너뜀 기록 뒤에 추가
+                    run.timings[name] = (start_time - pipeline_start, end_time - pipeline_start)
+                    if skipped:
+                        run.skipped.append(name)
+                    run.results[name] = result
+                    run.stopped = run.stopped or stopped
+                    if result.success:
+                        done.add(name)
+                        output_keys[name] = output_key
+                    else:
+                        run.failed.append(name)
+
+            run.not_run = [name for name in order if name in pending]
+    finally:
+        sys.stdout = output.stream
+
+    run.elapsed = time.time() - pipeline_start
+    return run
+
+def critical_path(steps, run):
+    """실행된 단계 중 소요 시간 합이 가장 긴 의존 경로 (체크포인트로 건너뛴 단계 제외) - (단계 이름 목록, 초)"""
+    by_name = {step.name: step for step in steps}
+    durations = {name: end - start for name, (start, end) in run.timings.items() if name not in run.skipped}
+    longest = {}
+
+    def path_to(name):
+        if name not in longest:
+            previous = max((path_to(dep) for dep in by_name[name].deps if dep in durations),
+                           key=lambda item: item[1], default=([], 0.0))
+            longest[name] = (previous[0] + [name], previous[1] + durations[name])
+        return longest[name]
+
+    return max((path_to(name) for name in durations), key=lambda item: item[1], default=([], 0.0))
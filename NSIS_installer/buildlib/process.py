@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 도구 실행 (dotnet, makensis)
+stdout/stderr 를 동시에 한 줄씩 읽어 경과 시간과 함께 단계별 로그 파일에 기록하고,
+실행 중에는 진행 상황을 출력합니다. 메모리에는 오류 보고용으로 마지막 N줄만 보관합니다.
+"""
+
+import time
+import threading
+import subprocess
+from pathlib import Path
+from collections import deque
+from dataclasses import dataclass, field
+
+from .cache import CACHE_ROOT
+from .console import current_output
+from .trace import child_usage_snapshot, process_usage
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+LOG_ROOT = CACHE_ROOT / "logs"
+TAIL_LINES = 200
+PROGRESS_INTERVAL = 5.0  # 초
+
+@dataclass
+class ProcessResult:
+    """도구 실행 결과 (전체 출력은 로그 파일, 메모리에는 마지막 N줄만)"""
+    returncode: int
+    elapsed: float
+    log_path: Path
+    line_count: int = 0
+    tail: deque = field(default_factory=deque)
+    cpu_time: float = None
+    peak_rss: int = None
+
+    def tail_lines(self, limit=None, stream=None):
+        """마지막 출력 줄 목록 (stream: "out" / "err" 지정 시 해당 출력만)"""
+        lines = [text for _, name, text in self.tail if stream is None or name == stream]
+        return lines[-limit:] if limit else lines
+
+def _pump(pipe, name, start_time, log_file, tail, lock, state, highlight, output):
+    """출력 파이프 하나를 줄 단위로 읽어 로그 파일/링 버퍼에 기록 (스레드)"""
+    for line in pipe:
+        text = line.rstrip("\r\n")
+        offset = time.perf_counter() - start_time
+        with lock:
+            log_file.write(f"[{offset:9.3f}s] [{name}] {text}\n")
+            tail.append((offset, name, text))
+            state["lines"] += 1
+            state["last"] = text
+            if highlight is not None and text.strip() and highlight(text):
+                print(f"   • {text.strip()}", file=output, flush=True)
+    pipe.close()
+
+def run_streaming(cmd, cwd, log_name, log_dir=LOG_ROOT, tail_lines=TAIL_LINES,
+                  progress_interval=PROGRESS_INTERVAL, highlight=None, tracer=None):
+    """도구 실행 (stdout/stderr 동시 읽기, 로그 파일 기록, 진행 상황 출력)
+
+    log_name: 로그 파일 이름 (log_dir 기준 상대 경로, 실행할 때마다 새로 기록)
+    highlight: 실행 중 바로 출력할 줄을 고르는 함수 (예: 경고/오류, 컴파일 결과)
+    tracer: BuildTracer 를 넘기면 실행 구간과 CPU 시간 / 최대 메모리 (Windows 만) 를 추적 이벤트로 기록
+    실행 파일이 없으면 FileNotFoundError 가 그대로 발생합니다.
+    """
+    log_path = Path(log_dir) / log_name
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tail = deque(maxlen=tail_lines)
+    lock = threading.Lock()
+    state = {"lines": 0, "last": ""}
+    output = current_output()  # 출력 읽기 스레드도 호출한 단계의 출력으로 보냄
+    usage_before = child_usage_snapshot()
+    start_us = time.time_ns() // 1000
+    start_time = time.perf_counter()
+
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(f"# {' '.join(str(part) for part in cmd)}\n# cwd: {cwd}\n")
+        process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, encoding='utf-8', errors='replace', bufsize=1)
+
+        readers = [threading.Thread(target=_pump, daemon=True,
+                                    args=(pipe, name, start_time, log_file, tail, lock, state, highlight, output))
+                   for pipe, name in ((process.stdout, "out"), (process.stderr, "err"))]
+        for reader in readers:
+            reader.start()
+
+        # 진행 상황 출력 (일정 간격으로 경과 시간, 출력 줄 수, 마지막 줄)
+        while True:
+            try:
+                process.wait(timeout=progress_interval)
+                break
+            except subprocess.TimeoutExpired:
+                elapsed = time.perf_counter() - start_time
+                with lock:
+                    lines, last = state["lines"], state["last"].strip()
+                print(f"   … {elapsed:.0f}초 경과, 출력 {lines}줄{': ' + last[:80] if last else ''}", flush=True)
+
+        for reader in readers:
+            reader.join()
+
+        elapsed = time.perf_counter() - start_time
+        cpu_time, peak_rss = process_usage(process, usage_before)
+        log_file.write(f"# exit code {process.returncode}, {elapsed:.3f}s\n")
+
+    if tracer is not None:
+        tracer.process(Path(log_name).stem, start_us, int(elapsed * 1_000_000), cpu_time, peak_rss,
+                       log=log_name, exit_code=process.returncode)
+
+    return ProcessResult(process.returncode, elapsed, log_path, state["lines"], tail, cpu_time, peak_rss)
+
+def print_failure_tail(result, limit=20):
+    """실패 시 마지막 출력과 로그 파일 위치 출력"""
+    for line in result.tail_lines(limit):
+        print(f"   {line}")
+    print(f"   • 전체 로그: {result.log_path}")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 파일 배치 (reflink → 하드링크 → 복사)
+publish 폴더, 빌드 캐시, 산출물 보관소로 파일을 옮길 때 내용을 복사하지 않는 방법을 먼저 시도합니다.
+
+- reflink: 쓰기 시 복사 (Linux FICLONE - Btrfs / XFS, macOS clonefile - APFS), 원본과 독립된 파일
+- 하드링크: 같은 파일을 공유 (같은 볼륨), 제자리에서 덮어쓰면 원본도 바뀌므로
+  배치된 파일은 삭제 후 새로 만들어야 함 (publish 폴더 동기화 / 캐시 복원은 모두 교체 방식)
+- 복사: 위 방법을 쓸 수 없을 때 (다른 볼륨, 지원하지 않는 파일 시스템)
+
+빌드 캐시 / 보관소처럼 오래 보관하는 곳에는 이미 다른 곳과 하드링크된 파일 (프로젝트 Resources 등) 을
+다시 하드링크하지 않습니다 (link_shared=False) - 원본을 제자리에서 고치면 보관된 내용까지 바뀌기 때문입니다.
+
+Windows 는 reflink (ReFS 블록 복제) 를 시도하지 않고 하드링크부터 사용합니다.
+"""
+
+import os
+import sys
+import uuid
+import errno
+import shutil
+from pathlib import Path
+from dataclasses import dataclass
+
+try:
+    import fcntl  # Unix 전용
+except ImportError:
+    fcntl = None
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+FICLONE = 0x40049409  # Linux ioctl: 파일 내용 공유 복제
+
+# reflink 를 지원하지 않는 것으로 확인된 볼륨 (st_dev) - 실패한 시도를 반복하지 않음
+_no_reflink_devices = set()
+
+@dataclass
+class PlacementStats:
+    """파일 배치 통계 (방법별 파일 수, 복사하지 않은 bytes / 실제 복사한 bytes)"""
+    moved: int = 0
+    reflinked: int = 0
+    hardlinked: int = 0
+    copied: int = 0
+    bytes_avoided: int = 0
+    bytes_copied: int = 0
+
+    def add(self, method, size):
+        if method == "copy":
+            self.copied += 1
+            self.bytes_copied += size
+            return
+
+        if method == "move":
+            self.moved += 1
+        elif method == "reflink":
+            self.reflinked += 1
+        else:
+            self.hardlinked += 1
+        self.bytes_avoided += size
+
+    @property
+    def files(self):
+        return self.moved + self.reflinked + self.hardlinked + self.copied
+
+    def summary(self):
+        """출력용 요약"""
+        moved = f"이동 {self.moved}개, " if self.moved else ""
+        return (f"{moved}reflink {self.reflinked}개, 하드링크 {self.hardlinked}개, 복사 {self.copied}개 "
+                f"(복사 생략 {self.bytes_avoided:,} bytes, 복사 {self.bytes_copied:,} bytes)")
+
+def _reflink(source, dest):
+    """reflink 복제 (지원하지 않으면 OSError)"""
+    if sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(dest), 0) != 0:
+            raise OSError(ctypes.get_errno(), "clonefile 실패")
+        return
+
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError("reflink 미지원 플랫폼")
+
+    try:
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        Path(dest).unlink(missing_ok=True)
+        raise
+    shutil.copystat(source, dest)
+
+def place_file(source, dest, stats=None, hardlink=True, link_shared=True):
+    """source 를 dest 에 배치 (reflink → 하드링크 → 복사, dest 는 없어야 함) - 사용한 방법 반환
+
+    hardlink=False 이면 하드링크를 건너뜁니다 (배치된 파일을 제자리에서 다시 쓰는 경우).
+    link_shared=False 이면 이미 다른 곳과 하드링크된 원본은 하드링크하지 않습니다 (캐시 / 보관소).
+    """
+    source = Path(source)
+    dest = Path(dest)
+    source_stat = source.stat()
+    size = source_stat.st_size
+    hardlink = hardlink and (link_shared or source_stat.st_nlink == 1)
+    device = dest.parent.stat().st_dev
+
+    method = None
+    if device not in _no_reflink_devices:
+        try:
+            _reflink(source, dest)
+            method = "reflink"
+        except OSError as e:
+            # 다른 볼륨 간 복제 실패는 볼륨 자체의 지원 여부와 무관
+            if e.errno != errno.EXDEV:
+                _no_reflink_devices.add(device)
+
+    if method is None and hardlink:
+        try:
+            os.link(source, dest)
+            method = "hardlink"
+        except OSError:
+            pass
+
+    if method is None:
+        shutil.copy2(source, dest)
+        method = "copy"
+
+    if stats is not None:
+        stats.add(method, size)
+    return method
+
+def replace_file(source, dest, stats=None, move=False):
+    """dest 를 source 내용으로 교체 (제자리에서 덮어쓰지 않고 임시 파일 배치 후 교체)
+
+    move=True 이면 source 를 옮깁니다 (다시 쓰지 않는 준비 폴더 등, 다른 볼륨이면 배치 후 교체).
+    """
+    source = Path(source)
+    dest = Path(dest)
+    if move:
+        size = source.stat().st_size
+        try:
+            os.replace(source, dest)
+            if stats is not None:
+                stats.add("move", size)
+            return "move"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    temp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}")
+    try:
+        method = place_file(source, temp_path, stats)
+        os.replace(temp_path, dest)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    return method
+
+def place_tree(source_dir, dest_dir, stats=None, hardlink=True, link_shared=True):
+    """폴더 전체 배치 (shutil.copytree 와 같으나 파일마다 place_file 사용, dest_dir 는 없어야 함)"""
+    shutil.copytree(source_dir, dest_dir,
+                    copy_function=lambda source, dest: place_file(source, dest, stats, hardlink, link_shared))
+    return dest_dir
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 산출물 보관소 (콘텐츠 주소 기반)
+빌드가 끝나면 설치파일, 정보 파일, 게시 폴더를 SHA-256 객체로 보관합니다.
+같은 내용은 한 번만 저장하고 가능하면 reflink / 하드링크로 연결하므로 빌드마다 복사 비용이 들지 않습니다.
+보관 정책 (최근 N개 빌드, 최대 용량, 오래 사용하지 않은 빌드부터 삭제) 에 따라 정리하며,
+보관된 빌드는 복원하거나 서로 비교할 수 있습니다.
+
+구조: <root>/objects/<해시 앞 2자리>/<해시>, <root>/builds/<빌드 ID>.json
+하드링크로 보관한 파일 (설치파일, 게시 폴더) 과 복원한 파일은 보관된 객체와 같은 파일이므로
+제자리에서 덮어쓰지 않고 삭제 후 새로 만들어야 합니다 (게시 폴더 정리, 설치파일 생성 전 삭제).
+여러 빌드가 함께 쓰므로 보관 / 복원 / 정리는 보관소 잠금 안에서 수행합니다.
+"""
+
+import os
+import json
+import time
+import uuid
+from pathlib import Path
+from datetime import datetime
+
+from .cache import CACHE_ROOT, hash_file
+from .locks import file_lock
+from .staging import place_file
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+STORE_ROOT = CACHE_ROOT / "store"
+KEEP_BUILDS = 10                          # 보관할 최대 빌드 수
+MAX_STORE_BYTES = 2 * 1024 * 1024 * 1024  # 보관소 최대 용량 (객체 기준, 2GB)
+
+OBJECTS_DIR = "objects"
+BUILDS_DIR = "builds"
+LOCK_FILE = ".lock"
+
+class ArtifactStore:
+    """콘텐츠 주소 기반 산출물 보관소"""
+
+    def __init__(self, root=STORE_ROOT, keep_builds=KEEP_BUILDS, max_bytes=MAX_STORE_BYTES):
+        self.root = Path(root)
+        self.keep_builds = keep_builds
+        self.max_bytes = max_bytes
+
+    def lock(self):
+        """보관소 잠금 (여러 빌드가 동시에 보관 / 정리하지 않도록)"""
+        return file_lock(self.root / LOCK_FILE)
+
+    def object_path(self, sha256):
+        """객체 경로"""
+        return self.root / OBJECTS_DIR / sha256[:2] / sha256
+
+    def build_path(self, build_id):
+        """빌드 기록 경로"""
+        return self.root / BUILDS_DIR / f"{build_id}.json"
+
+    def has_object(self, sha256):
+        """같은 내용의 객체가 이미 보관되어 있는지 확인"""
+        return self.object_path(sha256).exists()
+
+    def _ingest(self, source, sha256, link=True):
+        """파일을 객체로 저장 - (새로 저장한 bytes, 배치 방법), 이미 있으면 (0, None)
+
+        다른 곳과 이미 하드링크된 원본 (프로젝트 Resources 등) 은 하드링크하지 않습니다.
+        """
+        obj = self.object_path(sha256)
+        if obj.exists():
+            return 0, None
+
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = obj.with_name(f".{sha256}.{uuid.uuid4().hex}")
+        try:
+            method = place_file(source, temp_path, hardlink=link, link_shared=False)
+            os.replace(temp_path, obj)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return obj.stat().st_size, method
+
+    def _write_record(self, record):
+        path = self.build_path(record["id"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    def save_build(self, build_id, files, meta=None):
+        """빌드 보관 (files: 보관 경로 → (원본 경로, SHA-256 또는 None, 하드링크 허용 여부))
+
+        제자리에서 다시 쓰는 파일 (VERSION.txt 등 텍스트 파일) 은 하드링크를 허용하지 않아야 보관된 내용이 바뀌지 않습니다.
+
+        반환값: 통계 (파일 수, 새 객체 수 / bytes, 재사용 객체 수, reflink / 하드링크 수, 정리된 빌드 ID 목록)
+        """
+        with self.lock():
+            stats = {"files": 0, "new_objects": 0, "new_bytes": 0, "reused": 0, "linked": 0}
+            record_files = {}
+
+            for rel_path, (source, sha256, link) in sorted(files.items()):
+                source = Path(source)
+                sha256 = sha256 or hash_file(source)
+                added, method = self._ingest(source, sha256, link)
+                record_files[rel_path] = {"size": source.stat().st_size, "sha256": sha256}
+
+                stats["files"] += 1
+                if method is None:
+                    stats["reused"] += 1
+                else:
+                    stats["new_objects"] += 1
+                    stats["new_bytes"] += added
+                    stats["linked"] += int(method != "copy")
+
+            now = time.time()
+            record = dict(meta or {}, id=build_id, created=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                          last_used=now, total_size=sum(info["size"] for info in record_files.values()),
+                          files=record_files)
+            self._write_record(record)
+
+            stats["evicted"] = self.prune(protect=build_id)
+            return stats
+
+    def list_builds(self):
+        """보관된 빌드 목록 (최신순)"""
+        builds_dir = self.root / BUILDS_DIR
+        if not builds_dir.exists():
+            return []
+
+        records = []
+        for path in builds_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        records.sort(key=lambda record: record.get("created", ""), reverse=True)
+        return records
+
+    def load_build(self, build_id):
+        """빌드 기록 (ID 또는 latest, 없으면 None) - 사용 시각 갱신"""
+        with self.lock():
+            if build_id == "latest":
+                records = self.list_builds()
+                record = records[0] if records else None
+            else:
+                try:
+                    with open(self.build_path(build_id), "r", encoding="utf-8") as f:
+                        record = json.load(f)
+                except (OSError, ValueError):
+                    record = None
+
+            if record is not None:
+                record["last_used"] = time.time()
+                self._write_record(record)
+            return record
+
+    def restore_build(self, record, dest_dir):
+        """보관된 빌드를 dest_dir 아래로 복원 (reflink / 하드링크 우선) - (복원 파일 수, 누락 파일 목록)"""
+        with self.lock():
+            dest_dir = Path(dest_dir)
+            restored = 0
+            missing = []
+
+            for rel_path, info in record["files"].items():
+                obj = self.object_path(info["sha256"])
+                if not obj.exists():
+                    missing.append(rel_path)
+                    continue
+
+                dest_path = dest_dir / rel_path
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                if dest_path.exists():
+                    dest_path.unlink()
+                place_file(obj, dest_path)
+                restored += 1
+
+            return restored, missing
+
+    def prune(self, protect=None):
+        """보관 정책에 따라 정리 (최근 사용 순으로 keep_builds 개, max_bytes 이내) - 정리된 빌드 ID 목록
+
+        가장 최근에 사용한 빌드 (및 protect) 는 용량을 넘어도 남기고,
+        어느 빌드에서도 참조하지 않는 객체는 삭제합니다.
+        """
+        with self.lock():
+            records = sorted(self.list_builds(), key=lambda record: record.get("last_used", 0), reverse=True)
+            records.sort(key=lambda record: record["id"] != protect)
+
+            referenced = set()
+            total_bytes = 0
+            evicted = []
+            for index, record in enumerate(records):
+                new_objects = {info["sha256"]: info["size"] for info in record["files"].values()
+                               if info["sha256"] not in referenced}
+                new_bytes = sum(new_objects.values())
+
+                if index > 0 and (index >= self.keep_builds or total_bytes + new_bytes > self.max_bytes):
+                    self.build_path(record["id"]).unlink(missing_ok=True)
+                    evicted.append(record["id"])
+                    continue
+
+                referenced.update(new_objects)
+                total_bytes += new_bytes
+
+            self._collect_garbage(referenced)
+            return evicted
+
+    def _collect_garbage(self, referenced):
+        """참조되지 않는 객체 삭제"""
+        objects_dir = self.root / OBJECTS_DIR
+        if not objects_dir.exists():
+            return
+
+        for prefix_dir in objects_dir.iterdir():
+            if not prefix_dir.is_dir():
+                continue
+            for obj in prefix_dir.iterdir():
+                if not obj.name.startswith(".") and obj.name not in referenced:
+                    obj.unlink(missing_ok=True)
+
+    def usage(self):
+        """보관소 객체 수와 전체 크기 (bytes)"""
+        objects_dir = self.root / OBJECTS_DIR
+        if not objects_dir.exists():
+            return 0, 0
+
+        sizes = [obj.stat().st_size for obj in objects_dir.glob("*/*") if obj.is_file()]
+        return len(sizes), sum(sizes)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 게시 폴더 동기화 (rsync 방식)
+준비 폴더 (staging) 에 게시한 결과를 publish 폴더에 맞춥니다.
+크기나 내용이 다른 파일만 가져오고 없어진 파일은 삭제하므로, 바뀌지 않은 파일은 수정 시각이 그대로 유지되고
+복사 비용은 변경된 양에 비례합니다.
+
+바뀐 파일은 staging.replace_file 로 교체합니다 (준비 폴더에서는 이동, 캐시에서는 reflink / 하드링크 / 복사,
+보관소에 하드링크된 파일을 제자리에서 덮어쓰지 않음).
+"""
+
+import os
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import hash_file
+from .manifest import HASH_WORKERS, scan_tree
+from .staging import PlacementStats, replace_file
+
+def sync_tree(source_dir, dest_dir, dest_manifest=None, move=False, workers=HASH_WORKERS):
+    """source_dir 내용을 dest_dir 에 동기화 (move=True 이면 바뀐 파일을 source_dir 에서 옮김)
+
+    크기가 같고 수정 시각도 같으면 같은 파일로 보고, 수정 시각만 다르면 내용 해시를 비교합니다.
+    대상 해시는 dest_manifest (이전 빌드 매니페스트) 에서 크기 / 수정 시각이 같은 항목을 재사용합니다.
+    반환값: 통계 (갱신 / 유지 / 삭제 파일 수, 갱신 bytes, 해시 계산 수, 파일 배치 통계)
+    """
+    source_dir = Path(source_dir)
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    source_files = {rel: (size, mtime_ns) for rel, size, mtime_ns in scan_tree(source_dir)}
+    dest_files = {rel: (size, mtime_ns) for rel, size, mtime_ns in scan_tree(dest_dir)}
+    known = (dest_manifest or {}).get("files", {})
+
+    # 크기가 같고 수정 시각만 다른 파일은 내용을 비교
+    to_copy = [rel for rel, info in source_files.items()
+               if rel not in dest_files or dest_files[rel][0] != info[0]]
+    to_compare = [rel for rel, info in source_files.items()
+                  if rel in dest_files and dest_files[rel][0] == info[0] and dest_files[rel][1] != info[1]]
+
+    def dest_hash(rel):
+        old = known.get(rel)
+        size, mtime_ns = dest_files[rel]
+        if old and old.get("size") == size and old.get("mtime_ns") == mtime_ns and old.get("sha256"):
+            return old["sha256"], False
+        return hash_file(dest_dir / rel), True
+
+    hashed = 0
+    if to_compare:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            source_hashes = executor.map(lambda rel: hash_file(source_dir / rel), to_compare)
+            dest_hashes = executor.map(dest_hash, to_compare)
+            for rel, source_hash, (digest, computed) in zip(to_compare, source_hashes, dest_hashes):
+                hashed += 1 + int(computed)
+                if source_hash != digest:
+                    to_copy.append(rel)
+
+    stats = {"updated": 0, "updated_bytes": 0, "unchanged": len(source_files) - len(to_copy),
+             "deleted": 0, "hashed": hashed, "placement": PlacementStats()}
+
+    for rel in sorted(to_copy):
+        dest_path = dest_dir / rel
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        replace_file(source_dir / rel, dest_path, stats["placement"], move)
+        stats["updated"] += 1
+        stats["updated_bytes"] += source_files[rel][0]
+
+    for rel in sorted(dest_files.keys() - source_files.keys()):
+        (dest_dir / rel).unlink()
+        stats["deleted"] += 1
+
+    # 원본에 없고 비어 있게 된 하위 폴더 삭제 (깊은 폴더부터)
+    for dir_path, _, _ in sorted(os.walk(dest_dir), key=lambda item: len(item[0]), reverse=True):
+        rel_dir = Path(dir_path).relative_to(dest_dir)
+        if rel_dir.parts and not os.listdir(dir_path) and not (source_dir / rel_dir).is_dir():
+            os.rmdir(dir_path)
+
+    return stats
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 도구(.NET SDK, NSIS) 확인
+여러 확인 작업을 동시에 수행하고, 결과를 캐시 파일에 저장하여 다음 빌드에서 재사용합니다.
+도구 실행 파일(및 SDK 폴더)의 수정 시각이 바뀌거나 유효 시간이 지나면 다시 확인합니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import shutil
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import CACHE_ROOT
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+TOOLCHAIN_CACHE_FILE = CACHE_ROOT / "toolchain.json"
+TOOLCHAIN_CACHE_TTL = 24 * 60 * 60  # 초
+
+@dataclass
+class Toolchain:
+    """확인된 빌드 도구 정보"""
+    dotnet_path: str = None
+    dotnet_version: str = None
+    nsis_path: str = None
+    nsis_version: str = None
+    nsis_candidates: list = field(default_factory=list)
+    missing_files: list = field(default_factory=list)
+    cached_tools: list = field(default_factory=list)
+
+def _tool_fingerprint(tool_path):
+    """도구 변경 감지용 값 (실행 파일 및 같은 폴더의 sdk 폴더 수정 시각)"""
+    tool_path = Path(tool_path)
+    fingerprint = [tool_path.stat().st_mtime_ns]
+
+    # dotnet 은 실행 파일이 그대로여도 SDK 추가/삭제 시 버전이 달라질 수 있음
+    sdk_dir = tool_path.parent / "sdk"
+    if sdk_dir.is_dir():
+        fingerprint.append(sdk_dir.stat().st_mtime_ns)
+    return fingerprint
+
+def _run_version(cmd):
+    """버전 출력 명령 실행 (실패 시 None)"""
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+def _probe_tool(tool_path, version_args, cached_entry):
+    """도구 버전 확인 (캐시 항목이 유효하면 프로세스를 실행하지 않음)
+
+    반환값: (캐시 항목, 캐시 사용 여부)
+    """
+    if tool_path is None:
+        return None, False
+
+    try:
+        fingerprint = _tool_fingerprint(tool_path)
+    except OSError:
+        return None, False
+
+    if (cached_entry and cached_entry.get("path") == tool_path
+            and cached_entry.get("fingerprint") == fingerprint
+            and cached_entry.get("version")):
+        return cached_entry, True
+
+    version = _run_version([tool_path, *version_args])
+    if version is None:
+        return None, False
+    return {"path": tool_path, "fingerprint": fingerprint, "version": version}, False
+
+def _find_nsis(candidates):
+    """PATH 의 makensis 와 후보 경로 중 처음 발견된 경로"""
+    for candidate in candidates:
+        if candidate and Path(candidate).is_file():
+            return str(candidate)
+    return None
+
+def load_toolchain_cache(cache_file=TOOLCHAIN_CACHE_FILE, ttl=TOOLCHAIN_CACHE_TTL):
+    """도구 캐시 파일 로드 (유효 시간이 지난 항목은 제외)"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    now = time.time()
+    return {name: entry for name, entry in data.items()
+            if isinstance(entry, dict) and now - entry.get("checked", 0) < ttl}
+
+def save_toolchain_cache(entries, cache_file=TOOLCHAIN_CACHE_FILE):
+    """도구 캐시 파일 저장 (임시 파일 기록 후 교체)"""
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_name(f".{cache_file.name}.{uuid.uuid4().hex}")
+
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, cache_file)
+
+def resolve_toolchain(nsis_paths=(), required_files=(), need_dotnet=True, need_nsis=True,
+                      use_cache=True, cache_file=TOOLCHAIN_CACHE_FILE, ttl=TOOLCHAIN_CACHE_TTL):
+    """.NET SDK / NSIS / 필수 파일을 동시에 확인하여 Toolchain 반환"""
+    cached = load_toolchain_cache(cache_file, ttl) if use_cache else {}
+    toolchain = Toolchain()
+    toolchain.nsis_candidates = [p for p in [shutil.which("makensis"), *nsis_paths] if p]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dotnet_future = None
+        nsis_future = None
+        if need_dotnet:
+            dotnet_future = executor.submit(
+                lambda: _probe_tool(shutil.which("dotnet"), ["--version"], cached.get("dotnet")))
+        if need_nsis:
+            nsis_future = executor.submit(
+                lambda: _probe_tool(_find_nsis(toolchain.nsis_candidates), ["/VERSION"], cached.get("nsis")))
+        files_future = executor.submit(
+            lambda: [str(p) for p in required_files if not Path(p).exists()])
+
+        entries = dict(cached)
+        for name, future in (("dotnet", dotnet_future), ("nsis", nsis_future)):
+            if future is None:
+                continue
+
+            entry, from_cache = future.result()
+            if entry is None:
+                entries.pop(name, None)
+                continue
+
+            if from_cache:
+                toolchain.cached_tools.append(name)
+            else:
+                entry["checked"] = time.time()
+            entries[name] = entry
+            setattr(toolchain, f"{name}_path", entry["path"])
+            setattr(toolchain, f"{name}_version", entry["version"])
+
+        toolchain.missing_files = files_future.result()
+
+    try:
+        save_toolchain_cache(entries, cache_file)
+    except OSError:
+        pass
+
+    return toolchain
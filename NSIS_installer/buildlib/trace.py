@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 추적 (Chrome trace-event 형식)
+빌드 단계별 시작/종료 이벤트에 경과 시간, CPU 시간, 자식 프로세스 최대 메모리를 기록하여
+build_trace.json 으로 저장합니다. chrome://tracing 또는 Perfetto (ui.perfetto.dev) 에서 열 수 있습니다.
+
+자식 프로세스 최대 메모리는 Windows 에서는 도구 실행별로 기록하고, Unix 에서는 프로세스별 값을 알 수 없으므로
+(RUSAGE_CHILDREN 의 ru_maxrss 는 지금까지 종료된 모든 자식 프로세스 중 최대값) 빌드 전체 누적 최대값을 한 번만 기록합니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+from pathlib import Path, PurePosixPath
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource  # Unix 전용 (Windows 에서는 자식 프로세스 핸들로 직접 측정)
+except ImportError:
+    resource = None
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+TRACE_FILE_NAME = "build_trace.json"
+
+def _now_us():
+    """추적 시각 (epoch 기준 마이크로초 - 작업 프로세스 간 시각을 맞추기 위함)"""
+    return time.time_ns() // 1000
+
+def child_usage_snapshot():
+    """종료된 자식 프로세스 누적 사용량 (CPU 초, 지금까지 종료된 자식 중 최대 RSS bytes) - Unix 전용, Windows 는 None"""
+    if resource is None:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss 단위: Linux 는 KB, macOS 는 bytes
+    peak_rss = usage.ru_maxrss if os.uname().sysname == "Darwin" else usage.ru_maxrss * 1024
+    return usage.ru_utime + usage.ru_stime, peak_rss
+
+def _windows_process_usage(process):
+    """종료된 자식 프로세스의 CPU 시간 / 최대 작업 집합 (Windows, 프로세스 핸들 사용)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    handle = wintypes.HANDLE(int(process._handle))
+
+    creation, exit_time, kernel, user = (ctypes.c_ulonglong() for _ in range(4))
+    if not kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(exit_time),
+                                    ctypes.byref(kernel), ctypes.byref(user)):
+        return None, None
+    cpu_time = (kernel.value + user.value) / 10_000_000  # FILETIME 단위: 100ns
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    if not kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return cpu_time, None
+    return cpu_time, counters.PeakWorkingSetSize
+
+def process_usage(process, before):
+    """종료된 자식 프로세스의 (CPU 초, 최대 RSS bytes)
+
+    Windows 는 해당 프로세스 값입니다. Unix 는 실행 전 스냅샷 대비 자식 프로세스 누적 CPU 이고,
+    최대 RSS 는 이 프로세스의 값이 아니므로 None 입니다 (빌드 전체 값은 BuildTracer.write 에서 기록).
+    확인할 수 없으면 None.
+    """
+    try:
+        if os.name == "nt":
+            return _windows_process_usage(process)
+        after = child_usage_snapshot()
+    except (OSError, AttributeError, ValueError):
+        return None, None
+
+    if before is None or after is None:
+        return None, None
+    return after[0] - before[0], None
+
+def _usage_args(cpu_time=None, peak_rss=None, own_cpu=None):
+    """이벤트 args (밀리초 / MB 단위, 확인할 수 없는 값은 제외)"""
+    args = {}
+    if own_cpu is not None:
+        args["cpu_ms"] = round(own_cpu * 1000, 1)
+    if cpu_time is not None:
+        args["child_cpu_ms"] = round(cpu_time * 1000, 1)
+    if peak_rss is not None:
+        args["child_peak_rss_mb"] = round(peak_rss / 1024 / 1024, 1)
+    return args
+
+class BuildTracer:
+    """빌드 추적 이벤트 수집기 (컨텍스트와 함께 작업 프로세스로 전달된 뒤 merge 로 합쳐짐)"""
+
+    def __init__(self, process_name="build"):
+        self.pid = os.getpid()
+        self.process_name = process_name
+        self.events = []
+        self._tracks = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _add(self, event):
+        event.setdefault("pid", os.getpid())
+        event.setdefault("tid", threading.get_ident() % 100000)
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name, category="step", **args):
+        """단계 구간 (시작/종료 이벤트, 종료 시 CPU 시간 및 자식 프로세스 CPU 시간 기록)"""
+        own_cpu = time.process_time()
+        children = child_usage_snapshot()
+        self._add({"name": name, "cat": category, "ph": "B", "ts": _now_us(), "args": args})
+        try:
+            yield
+        finally:
+            after = child_usage_snapshot()
+            end_args = _usage_args(own_cpu=time.process_time() - own_cpu)
+            if children is not None and after is not None:
+                end_args.update(_usage_args(after[0] - children[0]))
+            self._add({"name": name, "cat": category, "ph": "E", "ts": _now_us(), "args": end_args})
+
+    def process(self, name, start_us, duration_us, cpu_time=None, peak_rss=None, **args):
+        """외부 도구 실행 구간 (완료 이벤트 하나로 기록)"""
+        args.update(_usage_args(cpu_time, peak_rss))
+        self._add({"name": name, "cat": "process", "ph": "X", "ts": start_us, "dur": duration_us, "args": args})
+
+    def fork(self):
+        """작업 프로세스용 빈 추적기 (작업이 끝나면 merge 로 합침)"""
+        return BuildTracer(self.process_name)
+
+    def merge(self, other, process_name=None):
+        """작업 프로세스에서 기록된 이벤트 합치기
+
+        작업 프로세스는 재사용될 수 있으므로 합칠 때마다 별도 트랙(pid)으로 표시합니다.
+        """
+        if other is None or other is self:
+            return
+
+        with self._lock:
+            self._tracks += 1
+            track = self.pid * 100 + self._tracks
+            self.events.extend(dict(event, pid=track) for event in other.events)
+            if process_name:
+                self.events.append({"name": "process_name", "ph": "M", "pid": track,
+                                    "args": {"name": process_name}})
+
+    def durations(self):
+        """구간별 경과 시간 (초) - 빌드 기록용
+
+        변형별 구간은 "이름 [변형]", 도구 실행은 로그 이름 (예: framework-dependent/dotnet_build) 으로 구분하며
+        같은 이름이 여러 번 나오면 합산합니다.
+        """
+        durations = {}
+        open_spans = {}
+        with self._lock:
+            events = list(self.events)
+
+        for event in events:
+            args = event.get("args", {})
+            if event["ph"] == "X":
+                name = str(PurePosixPath(args["log"]).with_suffix("")) if "log" in args else event["name"]
+                durations[name] = durations.get(name, 0.0) + event["dur"] / 1_000_000
+            elif event["ph"] == "B":
+                open_spans.setdefault((event["pid"], event["tid"], event["name"]), []).append(event)
+            elif event["ph"] == "E":
+                stack = open_spans.get((event["pid"], event["tid"], event["name"]))
+                if not stack:
+                    continue
+                begin = stack.pop()
+                variant = begin.get("args", {}).get("variant")
+                name = f"{event['name']} [{variant}]" if variant else event["name"]
+                durations[name] = durations.get(name, 0.0) + (event["ts"] - begin["ts"]) / 1_000_000
+
+        return durations
+
+    def write(self, trace_path):
+        """build_trace.json 저장 (임시 파일 기록 후 교체)
+
+        Unix 는 저장 시점까지 종료된 자식 프로세스 (작업 프로세스의 자식 포함) 의 누적 최대 RSS 를 전역 이벤트로 한 번 기록합니다.
+        """
+        trace_path = Path(trace_path)
+        temp_path = trace_path.with_name(f".{trace_path.name}.{uuid.uuid4().hex}")
+        metadata = {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": self.process_name}}
+
+        children = child_usage_snapshot()
+        with self._lock:
+            events = [metadata, *sorted(self.events, key=lambda event: event.get("ts", 0))]
+        if children is not None:
+            events.append({"name": "자식 프로세스 최대 RSS (빌드 전체 누적)", "cat": "process", "ph": "i", "s": "g",
+                           "pid": self.pid, "tid": 0, "ts": _now_us(),
+                           "args": {"children_max_rss_mb": round(children[1] / 1024 / 1024, 1)}})
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        os.replace(temp_path, trace_path)
+        return trace_path
+
+def trace_span(ctx, name, category="step", **args):
+    """컨텍스트에 추적기가 있으면 구간 기록, 없으면 아무것도 하지 않음"""
+    if ctx.tracer is None:
+        return nullcontext()
+    return ctx.tracer.span(name, category, **args)
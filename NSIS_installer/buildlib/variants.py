@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 게시 변형(variant) 매트릭스
+런타임 / self-contained 조합별로 게시 폴더와 설치파일을 따로 만들고,
+변형별 작업을 프로세스 풀에서 동시에 실행합니다.
+"""
+
+import io
+import os
+import importlib
+import traceback
+from dataclasses import replace
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+PUBLISH_VARIANTS = {
+    "framework-dependent": {"runtime": "win-x64", "self_contained": False},
+    "self-contained": {"runtime": "win-x64", "self_contained": True},
+    "win-arm64": {"runtime": "win-arm64", "self_contained": False}
+}
+DEFAULT_VARIANT = "framework-dependent"
+
+def get_publish_args(variant):
+    """변형별 dotnet publish 인자 (빌드 캐시 키에도 포함됨)"""
+    spec = PUBLISH_VARIANTS[variant]
+    return [
+        "--configuration", "Release",
+        "--runtime", spec["runtime"],
+        "--self-contained", "true" if spec["self_contained"] else "false"
+    ]
+
+def get_restore_args(variant):
+    """변형별 dotnet restore 인자 (게시와 같은 런타임 / 배포 방식으로 패키지 복원)"""
+    spec = PUBLISH_VARIANTS[variant]
+    return [
+        "--runtime", spec["runtime"],
+        f"-p:SelfContained={'true' if spec['self_contained'] else 'false'}"
+    ]
+
+def describe_variant(variant):
+    """변형 설명 (아키텍처, 배포 형식) - 정보 파일 출력용"""
+    spec = PUBLISH_VARIANTS[variant]
+    architecture = spec["runtime"].split("-", 1)[-1]
+    deployment = "Self-contained" if spec["self_contained"] else "Framework-dependent"
+    return architecture, deployment
+
+def describe_variants(variants):
+    """변형 목록 설명 (아키텍처, 배포 형식 - 여러 값은 쉼표로 연결) - 변형이 공유하는 정보 파일 / 보고서 출력용"""
+    described = [describe_variant(variant) for variant in variants]
+    architectures = ", ".join(dict.fromkeys(architecture for architecture, _ in described))
+    deployments = ", ".join(dict.fromkeys(deployment for _, deployment in described))
+    return architectures, deployments
+
+def get_system_requirements(variants):
+    """변형 목록의 시스템 요구사항 (x64 변형은 Windows 10 이상 (x64), framework-dependent 변형은 .NET 런타임)"""
+    requirements = []
+    if any(PUBLISH_VARIANTS[variant]["runtime"] == "win-x64" for variant in variants):
+        requirements.append("Windows 10 이상 (x64)")
+    if any(not PUBLISH_VARIANTS[variant]["self_contained"] for variant in variants):
+        requirements.append(".NET 8.0 Desktop Runtime")
+    return requirements
+
+def get_isolated_build_args(work_dir):
+    """변형별 중간/출력 폴더 지정 인자 (동시 게시용, work_dir 는 BuildContext.work_dir)
+
+    obj/bin 충돌을 피하기 위해 프로젝트 폴더 밖 (작업 공간 상태 폴더) 에 두어 소스 검색에도 포함되지 않게 합니다.
+    """
+    return [
+        f"-p:BaseIntermediateOutputPath={work_dir / 'obj'}{os.sep}",
+        f"-p:BaseOutputPath={work_dir / 'bin'}{os.sep}"
+    ]
+
+def parse_variants(value):
+    """명령행 --variants 값 해석 ("all" 또는 쉼표 구분 목록)"""
+    if not value:
+        return [DEFAULT_VARIANT]
+    if value.strip().lower() == "all":
+        return list(PUBLISH_VARIANTS)
+
+    variants = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [v for v in variants if v not in PUBLISH_VARIANTS]
+    if unknown:
+        raise ValueError(f"알 수 없는 변형: {', '.join(unknown)} (사용 가능: {', '.join(PUBLISH_VARIANTS)})")
+    return list(dict.fromkeys(variants))
+
+def variant_context(ctx, variant, isolated_build):
+    """변형별 빌드 컨텍스트 (단계 결과는 변형마다 따로 보관)"""
+    return replace(ctx, variant=variant, isolated_build=isolated_build,
+                   publish_manifest=None, publish_diff=None, installer_path=None,
+                   publish_cache_key=None, installer_cache_key=None, results={}, variants={})
+
+def _run_captured(module_name, func_name, ctx):
+    """작업 프로세스: 단계 함수를 실행하고 출력을 모아서 반환"""
+    buffer = io.StringIO()
+    if ctx.tracer is not None:
+        ctx.tracer = ctx.tracer.fork()
+    if ctx.artifacts is not None:
+        ctx.artifacts = ctx.artifacts.fork()
+    with redirect_stdout(buffer):
+        try:
+            result = getattr(importlib.import_module(module_name), func_name)(ctx)
+        except Exception:
+            traceback.print_exc(file=buffer)
+            result = None
+    return ctx, result, buffer.getvalue()
+
+def run_matrix(module_name, func_name, contexts, jobs=None):
+    """변형별 컨텍스트에 대해 단계 함수를 프로세스 풀에서 동시에 실행
+
+    출력은 변형 순서대로 모아서 출력하며 (ctx, StepResult 또는 None) 목록을 반환합니다.
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(contexts)))
+    outcomes = []
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_run_captured, module_name, func_name, ctx) for ctx in contexts]
+        for ctx, future in zip(contexts, futures):
+            try:
+                done_ctx, result, output = future.result()
+            except Exception as e:
+                done_ctx, result, output = ctx, None, f"   ❌ 작업 프로세스 오류: {str(e)}\n"
+
+            # 작업 프로세스에서 기록된 추적 이벤트는 부모 추적기로 합침
+            if ctx.tracer is not None:
+                ctx.tracer.merge(done_ctx.tracer, process_name=f"{module_name} [{ctx.variant}]")
+                done_ctx.tracer = ctx.tracer
+
+            # 작업 프로세스에서 등록된 산출물은 부모 레지스트리로 합침
+            if ctx.artifacts is not None:
+                ctx.artifacts.merge(done_ctx.artifacts)
+                done_ctx.artifacts = ctx.artifacts
+
+            print(f"── [{ctx.variant}] " + "─" * 40)
+            print(output, end="")
+            outcomes.append((done_ctx, result))
+
+    return outcomes
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 버전 정보 (version.json)
+제품 버전과 빌드 일시를 한 곳에서 관리합니다. 10/11/12 스크립트가 실행 시 읽어
+dotnet 에는 -p: 속성으로, makensis 에는 /D 정의로 전달하므로 버전을 올릴 때
+NationalClock.csproj 나 스크립트 파일을 고치지 않습니다 (MSBuild 증분 빌드 상태가 유지됨).
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass
+
+# ==========================================
+# 설정 (필요시 수정)
+# ==========================================
+VERSION_FILE = Path(__file__).resolve().parent.parent / "version.json"
+BUILD_DATE_FORMAT = "%Y%m%d_%H%M"           # 설치파일 이름 / makensis BUILD_DATE
+BUILD_DATE_TIME_FORMAT = "%Y-%m-%d %H:%M"   # csproj BuildDateTime (프로그램 정보 창 표시)
+
+@dataclass(frozen=True)
+class VersionInfo:
+    """version.json 내용"""
+    product_version: str     # 표시 버전 (예: 1.0.001)
+    assembly_version: str    # 어셈블리/파일 버전 (예: 1.0.0.1)
+    build_date: str          # 빌드 일시 (예: 20250912_1702)
+
+def format_build_date_time(build_date):
+    """빌드 일시를 csproj BuildDateTime 형식으로 변환 (20250912_1702 → 2025-09-12 17:02)"""
+    return datetime.strptime(build_date, BUILD_DATE_FORMAT).strftime(BUILD_DATE_TIME_FORMAT)
+
+def load_version(version_file=VERSION_FILE):
+    """version.json 읽기 (파일이 없거나 형식이 잘못되면 ValueError)"""
+    try:
+        with open(version_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        info = VersionInfo(str(data["product_version"]), str(data["assembly_version"]), str(data["build_date"]))
+        format_build_date_time(info.build_date)
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"버전 파일을 읽을 수 없습니다: {version_file} - {e}") from e
+    return info
+
+def get_version_properties(ctx):
+    """dotnet build/publish 에 전달할 버전 속성 (-p:, 게시 캐시 키에도 포함됨)"""
+    properties = {
+        "InformationalVersion": ctx.product_version,
+        "DisplayVersion": ctx.product_version,
+        "BuildDateTime": format_build_date_time(ctx.build_date)
+    }
+    if ctx.assembly_version:
+        properties.update(Version=ctx.assembly_version, AssemblyVersion=ctx.assembly_version,
+                          FileVersion=ctx.assembly_version)
+    return [f"-p:{name}={value}" for name, value in properties.items()]
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+NationalClock 빌드 스크립트 테스트 공용 설정
+스크립트 폴더를 import 경로에 추가하고, 숫자로 시작하는 스크립트 모듈을 불러오는 fixture 를 제공합니다.
+"""
+
+import os
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+def load_script(module_name, work_dir):
+    """스크립트 파일을 모듈로 불러오기 (import 시 만드는 출력 폴더는 work_dir 아래에 생성)"""
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_DIR / f"{module_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+@pytest.fixture(scope="session")
+def cvn2(tmp_path_factory):
+    """A25050831_Change_Version_Name2_07 모듈 (CVN2 문자열 치환 스크립트)"""
+    return load_script("A25050831_Change_Version_Name2_07", tmp_path_factory.mktemp("cvn2"))
+
+@pytest.fixture(scope="session")
+def update_stage(tmp_path_factory):
+    """11_UpdateFromProject 모듈 (프로젝트 빌드 / 게시 단계)"""
+    return load_script("11_UpdateFromProject", tmp_path_factory.mktemp("update"))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""빌드 캐시 (소스 해시, 게시 결과 저장 / 복원, 최근 사용 기준 정리) 테스트"""
+
+import os
+import time
+
+from buildlib.cache import BuildCache, hash_sources, make_cache_key
+
+def write_files(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+def read_tree(root):
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+def test_hash_sources_tracks_only_source_files(tmp_path):
+    project = tmp_path / "NationalClock"
+    write_files(project, {"App.xaml": b"<App/>", "MainWindow.cs": b"class A {}", "Resources/icon.ico": b"icon",
+                          "bin/Release/app.dll": b"dll", "notes.md": b"notes"})
+    key = hash_sources(project)
+
+    # 빌드 출력과 소스가 아닌 파일은 캐시 키에 영향 없음
+    write_files(project, {"bin/Release/app.dll": b"rebuilt", "obj/project.assets.json": b"{}", "notes.md": b"edit"})
+    assert hash_sources(project) == key
+
+    write_files(project, {"Resources/icon.ico": b"new icon"})
+    assert hash_sources(project) != key
+
+def test_make_cache_key_is_order_independent_for_mappings():
+    assert make_cache_key("publish", {"a": 1, "b": 2}) == make_cache_key("publish", {"b": 2, "a": 1})
+    assert make_cache_key("publish", ["--runtime", "win-x64"]) != make_cache_key("publish", ["--runtime", "win-arm64"])
+
+def test_store_and_restore_tree(tmp_path):
+    cache = BuildCache("publish", root=tmp_path / "cache")
+    publish = tmp_path / "publish"
+    write_files(publish, {"NationalClock.exe": b"exe", "Resources/icon.ico": b"icon"})
+
+    assert cache.lookup("key") is None
+    cache.store_tree("key", publish, meta={"version": "1.0.001"})
+    meta = cache.lookup("key")
+    assert meta["key"] == "key" and meta["version"] == "1.0.001"
+
+    # 복원하면 대상 폴더의 이전 내용은 지워지고 캐시된 내용만 남음
+    restored = tmp_path / "restored"
+    write_files(restored, {"stale.dll": b"old"})
+    cache.restore_tree("key", restored)
+    assert read_tree(restored) == read_tree(publish)
+
+def test_store_and_restore_file(tmp_path):
+    cache = BuildCache("installer", root=tmp_path / "cache")
+    installer = tmp_path / "NationalClock_Setup.exe"
+    installer.write_bytes(b"installer")
+    cache.store_file("key", installer)
+
+    dest = tmp_path / "workspace"
+    dest.mkdir()
+    (dest / installer.name).write_bytes(b"previous build")
+    restored = cache.restore_file("key", dest)
+    assert restored == dest / installer.name
+    assert restored.read_bytes() == b"installer"
+
+def test_prune_keeps_most_recently_used_entries(tmp_path):
+    cache = BuildCache("publish", root=tmp_path / "cache", max_entries=2)
+    source = tmp_path / "publish"
+    write_files(source, {"app.dll": b"dll"})
+
+    past = time.time() - 3600
+    for offset, key in enumerate(("first", "second")):
+        cache.store_tree(key, source)
+        os.utime(cache.entry_path(key) / "meta.json", (past + offset, past + offset))
+
+    # 조회한 항목은 최근 사용으로 갱신되어 남고, 가장 오래 사용하지 않은 항목이 삭제됨
+    assert cache.lookup("first") is not None
+    cache.store_tree("third", source)
+    assert cache.lookup("second") is None
+    assert cache.lookup("first") is not None and cache.lookup("third") is not None
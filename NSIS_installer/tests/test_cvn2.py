@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""CVN2 문자열 치환 스크립트 테스트 (glob 패턴 변환, 교체 규칙 매처, 조각 단위 교체, 건너뛰기 인덱스)"""
+
+import os
+import hashlib
+
+import pytest
+
+# ==========================================
+# glob 패턴 변환
+# ==========================================
+@pytest.mark.parametrize("pattern, name, expected", [
+    ("file[0-9].txt", "file5.txt", True),
+    ("file[0-9].txt", "file-.txt", False),
+    ("file[!a-z].txt", "file5.txt", True),
+    ("file[!a-z].txt", "fileq.txt", False),
+    ("file[ab-].txt", "file-.txt", True),
+    ("a[]]b", "a]b", True),
+    ("a[!]]b", "a]b", False),
+    ("x[^y]", "x^", True),
+    ("a[b", "a[b", True),
+])
+def test_glob_character_class(cvn2, pattern, name, expected):
+    assert bool(cvn2.glob_to_regex(pattern).match(name)) is expected
+
+@pytest.mark.parametrize("pattern, name, expected", [
+    ("*.cs", "App.xaml.cs", True),
+    ("*.cs", "Models/Clock.cs", False),
+    ("**/*.cs", "Models/Clock.cs", True),
+    ("**/*.cs", "App.cs", True),
+    ("Models/?lock.cs", "Models/Clock.cs", True),
+    ("Models/?lock.cs", "Models//lock.cs", False),
+])
+def test_glob_wildcards(cvn2, pattern, name, expected):
+    assert bool(cvn2.glob_to_regex(pattern).match(name)) is expected
+
+# ==========================================
+# 교체 규칙 매처
+# ==========================================
+def test_matcher_prefers_longest_match(cvn2):
+    matcher = cvn2.ReplaceMatcher([{"from": "1.0", "to": "2.0"}, {"from": "1.0.001", "to": "1.0.002"}])
+    content, counts = matcher.replace("v1.0.001 / v1.0")
+    assert content == "v1.0.002 / v2.0"
+    assert counts == [1, 1]
+
+def test_matcher_does_not_rescan_replacements(cvn2):
+    matcher = cvn2.ReplaceMatcher([{"from": "a", "to": "b"}, {"from": "b", "to": "c"}])
+    assert matcher.replace("ab") == ("bc", [1, 1])
+
+def test_matcher_ignores_empty_and_duplicate_rules(cvn2):
+    rules = [{"from": "x", "to": "1"}, {"from": "", "to": "2"}, {"from": "x", "to": "3"}]
+    matcher = cvn2.ReplaceMatcher(rules)
+    assert matcher.rules == [rules[0]]
+    assert matcher.ignored == [rules[1], rules[2]]
+    assert matcher.replace("xx") == ("11", [2])
+
+def test_matcher_without_rules(cvn2):
+    assert cvn2.ReplaceMatcher([]).replace("text") == ("text", [])
+
+# ==========================================
+# 조각 단위 교체 (전체 파일 교체와 같은 결과)
+# ==========================================
+STREAM_RULES = [
+    {"from": "NationalClock", "to": "WorldClock"},
+    {"from": "National", "to": "Local"},
+    {"from": "버전 1.0.001", "to": "버전 1.0.002"},
+    {"from": "unchanged", "to": "unchanged"}
+]
+STREAM_TEXT = "NationalClock National 버전 1.0.001 unchanged Nation\r\n" * 200 + "끝 NationalClo"
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+def test_replace_stream_matches_replace(cvn2, chunk_size):
+    matcher = cvn2.ReplaceMatcher(STREAM_RULES)
+    chunks = [STREAM_TEXT[i:i + chunk_size] for i in range(0, len(STREAM_TEXT), chunk_size)]
+    counts = [0] * len(matcher.rules)
+    streamed = "".join(matcher.replace_stream(chunks, counts))
+    assert (streamed, counts) == matcher.replace(STREAM_TEXT)
+
+@pytest.mark.parametrize("encoding, bom", [("utf-8", b""), ("utf-8", b"\xef\xbb\xbf"), ("cp949", b""),
+                                           ("utf-16-le", b"\xff\xfe")])
+@pytest.mark.parametrize("chunk_size", [5, 1000])
+def test_large_file_replace_matches_whole_file(cvn2, tmp_path, encoding, bom, chunk_size):
+    data = bom + STREAM_TEXT.encode(encoding)
+    whole_path = tmp_path / "whole.txt"
+    stream_path = tmp_path / "stream.txt"
+    whole_path.write_bytes(data)
+    stream_path.write_bytes(data)
+    matcher = cvn2.ReplaceMatcher(STREAM_RULES)
+
+    whole = cvn2.replace_strings_in_file(str(whole_path), matcher)
+    streamed = cvn2.replace_strings_in_large_file(str(stream_path), matcher, chunk_size=chunk_size)
+
+    assert stream_path.read_bytes() == whole_path.read_bytes()
+    assert streamed == whole
+    assert whole[0] is True
+    assert whole[3] == hashlib.sha256(data).hexdigest()
+
+def test_unchanged_file_is_not_rewritten(cvn2, tmp_path):
+    path = tmp_path / "same.txt"
+    path.write_bytes("no match here\n".encode("utf-8"))
+    mtime_ns = path.stat().st_mtime_ns
+    matcher = cvn2.ReplaceMatcher([{"from": "absent", "to": "x"}])
+
+    for replace in (cvn2.replace_strings_in_file, cvn2.replace_strings_in_large_file):
+        changed, replaced_items, error, sha256 = replace(str(path), matcher)
+        assert (changed, replaced_items, error) == (False, [], None)
+        assert sha256 == cvn2.hash_file(path)
+    assert path.stat().st_mtime_ns == mtime_ns
+
+# ==========================================
+# 건너뛰기 인덱스
+# ==========================================
+def test_skip_index_skips_unchanged_files(cvn2, tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("nothing to replace\n", encoding="utf-8")
+    index_file = tmp_path / "index.json"
+    matcher = cvn2.ReplaceMatcher([{"from": "absent", "to": "x"}])
+
+    index = cvn2.SkipIndex(str(index_file), matcher.rules_hash)
+    assert cvn2.process_file(path, matcher, index) == (False, [], None)
+    index.save()
+
+    index = cvn2.SkipIndex(str(index_file), matcher.rules_hash)
+    assert cvn2.process_file(path, matcher, index) is cvn2.SKIPPED
+
+    # 수정 시각만 바뀌면 내용 해시로 확인하여 계속 건너뜀
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cvn2.process_file(path, matcher, index) is cvn2.SKIPPED
+
+    # 규칙이 바뀌면 다시 처리
+    other = cvn2.ReplaceMatcher([{"from": "nothing", "to": "something"}])
+    index = cvn2.SkipIndex(str(index_file), other.rules_hash)
+    changed, _, _ = cvn2.process_file(path, other, index)
+    assert changed is True
+    assert path.read_text(encoding="utf-8") == "something to replace\n"
+
+def test_skip_index_rechecks_file_changed_while_processing(cvn2, tmp_path, monkeypatch):
+    path = tmp_path / "file.txt"
+    path.write_text("nothing to replace\n", encoding="utf-8")
+    index_file = tmp_path / "index.json"
+    matcher = cvn2.ReplaceMatcher([{"from": "old", "to": "new"}])
+    replace_strings_in_file = cvn2.replace_strings_in_file
+
+    def edit_after_read(file_path, matcher):
+        # 내용을 읽어 해시한 뒤, 인덱스에 기록되기 전에 파일이 바뀐 경우
+        result = replace_strings_in_file(file_path, matcher)
+        stat = path.stat()
+        path.write_text("the old text\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return result
+
+    index = cvn2.SkipIndex(str(index_file), matcher.rules_hash)
+    monkeypatch.setattr(cvn2, "replace_strings_in_file", edit_after_read)
+    assert cvn2.process_file(path, matcher, index) == (False, [], None)
+    monkeypatch.undo()
+
+    changed, _, _ = cvn2.process_file(path, matcher, index)
+    assert changed is True
+    assert path.read_text(encoding="utf-8") == "the new text\n"
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""게시 폴더 매니페스트 / 이전 빌드 비교 / publish 폴더 동기화 테스트"""
+
+import os
+
+from buildlib.context import BuildContext
+from buildlib.manifest import build_manifest, diff_manifests, format_manifest_diff, load_manifest, write_manifest
+from buildlib.sync import sync_tree
+
+def write_files(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+def test_manifest_lists_files_and_reuses_hashes(tmp_path):
+    publish = tmp_path / "publish"
+    write_files(publish, {"NationalClock.exe": b"exe", "Resources/icon.ico": b"icon!"})
+
+    manifest = build_manifest(publish)
+    assert sorted(manifest["files"]) == ["NationalClock.exe", "Resources/icon.ico"]
+    assert manifest["file_count"] == 2
+    assert manifest["total_size"] == 8
+    assert manifest["hashed_count"] == 2
+
+    # 크기와 수정 시각이 같은 파일은 이전 매니페스트 해시를 재사용
+    again = build_manifest(publish, previous=manifest)
+    assert again["hashed_count"] == 0
+    assert again["tree_hash"] == manifest["tree_hash"]
+
+    manifest_path = tmp_path / "publish.manifest.json"
+    write_manifest(manifest, manifest_path)
+    assert load_manifest(manifest_path)["tree_hash"] == manifest["tree_hash"]
+    assert load_manifest(tmp_path / "missing.json") is None
+
+def test_diff_manifests(tmp_path):
+    publish = tmp_path / "publish"
+    write_files(publish, {"keep.dll": b"same", "change.dll": b"old", "remove.dll": b"gone!"})
+    old = build_manifest(publish)
+
+    (publish / "remove.dll").unlink()
+    write_files(publish, {"change.dll": b"newer", "add.dll": b"added"})
+    new = build_manifest(publish, previous=old)
+
+    diff = diff_manifests(old, new)
+    assert diff["added"] == [("add.dll", 5)]
+    assert diff["removed"] == [("remove.dll", 5)]
+    assert diff["changed"] == [("change.dll", 3, 5)]
+    assert diff["size_delta"] == 5 - 5 + 2
+    assert diff["has_previous"] and not diff["is_empty"]
+    assert format_manifest_diff(diff)[0] == "추가 1개, 삭제 1개, 변경 1개, 크기 변화 +2 bytes"
+
+def test_diff_manifests_without_changes_or_previous(tmp_path):
+    publish = tmp_path / "publish"
+    write_files(publish, {"a.dll": b"a"})
+    manifest = build_manifest(publish)
+
+    assert diff_manifests(manifest, manifest)["is_empty"]
+    first = diff_manifests(None, manifest)
+    assert not first["has_previous"] and not first["is_empty"]
+    assert first["added"] == [("a.dll", 1)]
+
+def test_sync_tree_copies_only_changed_files(tmp_path):
+    source = tmp_path / "staging"
+    dest = tmp_path / "publish"
+    write_files(source, {"same.dll": b"same", "changed.dll": b"new", "sub/new.dll": b"n"})
+    write_files(dest, {"same.dll": b"same", "changed.dll": b"old", "stale/old.dll": b"x"})
+    same_mtime = (dest / "same.dll").stat().st_mtime_ns
+
+    stats = sync_tree(source, dest)
+
+    assert (stats["updated"], stats["unchanged"], stats["deleted"]) == (2, 1, 1)
+    assert (dest / "changed.dll").read_bytes() == b"new"
+    assert (dest / "sub/new.dll").read_bytes() == b"n"
+    assert not (dest / "stale").exists()
+    assert (dest / "same.dll").stat().st_mtime_ns == same_mtime
+    assert sorted(build_manifest(dest)["files"]) == sorted(build_manifest(source)["files"])
+    assert os.listdir(source)  # 복사 모드에서는 원본 유지
+
+def test_skipped_manifest_step_restores_manifest_and_diff(update_stage, tmp_path):
+    def make_ctx():
+        return BuildContext(product_name="NationalClock", product_version="1.0.0", build_date="20250101_0000",
+                            script_dir=tmp_path, workspace_dir=tmp_path / "workspace")
+
+    ctx = make_ctx()
+    write_files(ctx.publish_dir, {"NationalClock.exe": b"v1", "NationalClock.dll": b"dll"})
+    assert update_stage.record_publish_manifest(ctx)
+    write_files(ctx.publish_dir, {"NationalClock.exe": b"v2!"})
+    assert update_stage.record_publish_manifest(ctx)
+    assert ctx.publish_diff["changed"]
+
+    # 매니페스트 단계를 건너뛴 빌드 (--resume) 도 같은 매니페스트와 비교 정보를 사용
+    resumed = make_ctx()
+    assert update_stage.load_publish_manifest(resumed)
+    assert resumed.publish_manifest["tree_hash"] == ctx.publish_manifest["tree_hash"]
+    assert resumed.publish_diff == ctx.publish_diff
+
+    assert not update_stage.load_publish_manifest(BuildContext(product_name="NationalClock", product_version="1.0.0",
+                                                               build_date="20250101_0000", script_dir=tmp_path,
+                                                               workspace_dir=tmp_path / "empty"))
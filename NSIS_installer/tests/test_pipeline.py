@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""빌드 파이프라인 (의존성 순서, 실패 처리, 단계 선택) 및 체크포인트 / --resume 테스트"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from buildlib.checkpoint import CheckpointStore
+from buildlib.pipeline import (PipelineRun, PipelineStep, StopPipeline, check_graph, critical_path, run_pipeline,
+                               select_steps)
+
+def make_ctx():
+    return SimpleNamespace(tracer=None)
+
+class Recorder:
+    """단계 실행 순서 기록 (단계 함수 생성)"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def step(self, name, outcome=True):
+        def func(ctx):
+            with self._lock:
+                self.calls.append(name)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return func
+
+def diamond(recorder, **outcomes):
+    """a → (b, c) → d"""
+    return [
+        PipelineStep("a", "A", recorder.step("a", outcomes.get("a", True))),
+        PipelineStep("b", "B", recorder.step("b", outcomes.get("b", True)), ("a",)),
+        PipelineStep("c", "C", recorder.step("c", outcomes.get("c", True)), ("a",)),
+        PipelineStep("d", "D", recorder.step("d", outcomes.get("d", True)), ("b", "c"))
+    ]
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_steps_run_after_their_dependencies(workers):
+    recorder = Recorder()
+    run = run_pipeline(diamond(recorder), make_ctx(), workers=workers)
+
+    assert run.success
+    assert recorder.calls[0] == "a" and recorder.calls[-1] == "d"
+    assert sorted(recorder.calls) == ["a", "b", "c", "d"]
+    for name in "bcd":
+        assert run.timings[name][0] >= run.timings["a"][1]
+    assert run.timings["d"][0] >= max(run.timings["b"][1], run.timings["c"][1])
+    path, _ = critical_path(diamond(recorder), run)
+    assert path[0] == "a" and path[-1] == "d"
+
+def test_failure_stops_dependent_steps():
+    recorder = Recorder()
+    run = run_pipeline(diamond(recorder, b=False), make_ctx(), workers=1)
+
+    assert not run.success
+    assert run.failed == ["b"]
+    assert "d" in run.not_run and "d" not in recorder.calls
+
+def test_exception_counts_as_failure():
+    recorder = Recorder()
+    run = run_pipeline(diamond(recorder, a=RuntimeError("boom")), make_ctx())
+    assert run.failed == ["a"]
+    assert run.not_run == ["b", "c", "d"]
+
+def test_stop_pipeline_ends_without_failure():
+    recorder = Recorder()
+    run = run_pipeline(diamond(recorder, a=StopPipeline()), make_ctx())
+    assert run.stopped and not run.failed
+    assert recorder.calls == ["a"]
+
+def test_select_steps():
+    steps = diamond(Recorder())
+    assert select_steps(steps) == {"a", "b", "c", "d"}
+    assert select_steps(steps, until="b") == {"a", "b"}
+    assert select_steps(steps, only="c,d") == {"c", "d"}
+    with pytest.raises(ValueError):
+        select_steps(steps, until="missing")
+
+def test_only_treats_unselected_dependencies_as_done():
+    recorder = Recorder()
+    run = run_pipeline(diamond(recorder), make_ctx(), selected={"d"})
+    assert run.success and recorder.calls == ["d"]
+
+def test_check_graph_rejects_cycles_and_unknown_dependencies():
+    noop = lambda ctx: True
+    with pytest.raises(ValueError):
+        check_graph([PipelineStep("a", "A", noop, ("b",)), PipelineStep("b", "B", noop, ("a",))])
+    with pytest.raises(ValueError):
+        check_graph([PipelineStep("a", "A", noop, ("missing",))])
+    with pytest.raises(ValueError):
+        check_graph([PipelineStep("a", "A", noop), PipelineStep("a", "A", noop)])
+
+# ==========================================
+# 체크포인트 / --resume
+# ==========================================
+class FileBuild:
+    """입력 파일 → 게시 → 컴파일 → 검증 순서의 작은 빌드 (단계별 출력 파일 기록)"""
+
+    def __init__(self, root, compile_ok=True):
+        self.root = root
+        self.source = root / "source.txt"
+        self.script = root / "installer.nsi"
+        self.published = root / "published.txt"
+        self.installer = root / "setup.exe"
+        self.compile_ok = compile_ok
+        self.recorder = Recorder()
+
+    def publish(self, ctx):
+        self.published.write_text(self.source.read_text())
+        return True
+
+    def compile(self, ctx):
+        if not self.compile_ok:
+            return False
+        self.installer.write_text(self.published.read_text() + self.script.read_text())
+        return True
+
+    def steps(self):
+        record = self.recorder.step
+        return [
+            PipelineStep("prerequisites", "도구 확인", record("prerequisites"), outputs=lambda c: ["v1"]),
+            PipelineStep("publish", "게시", lambda c: record("publish")(c) and self.publish(c), ("prerequisites",),
+                         inputs=lambda c: [self.source], outputs=lambda c: [self.published]),
+            PipelineStep("installer", "컴파일", lambda c: record("installer")(c) and self.compile(c), ("publish",),
+                         inputs=lambda c: [self.script], outputs=lambda c: [self.installer]),
+            PipelineStep("checksum", "검증", record("checksum"), ("installer",), inputs=lambda c: []),
+            PipelineStep("report", "보고서", record("report"), ("checksum",))
+        ]
+
+    def run(self, resume=True):
+        self.recorder.calls.clear()
+        checkpoints = CheckpointStore(self.root / "checkpoints.json")
+        return run_pipeline(self.steps(), make_ctx(), checkpoints=checkpoints, resume=resume)
+
+@pytest.fixture
+def build(tmp_path):
+    build = FileBuild(tmp_path)
+    build.source.write_text("app v1\n")
+    build.script.write_text("script v1\n")
+    return build
+
+def test_resume_restarts_from_failed_step(build):
+    build.compile_ok = False
+    run = build.run(resume=False)
+    assert run.failed == ["installer"]
+    assert CheckpointStore(build.root / "checkpoints.json").get("installer") is None
+
+    build.compile_ok = True
+    run = build.run()
+    assert run.success
+    assert run.skipped == ["publish"]
+    assert build.recorder.calls == ["prerequisites", "installer", "checksum", "report"]
+
+def test_resume_skips_completed_steps(build):
+    build.run(resume=False)
+    run = build.run()
+    assert sorted(run.skipped) == ["checksum", "installer", "publish"]
+    assert build.recorder.calls == ["prerequisites", "report"]
+    assert "publish" not in critical_path(build.steps(), run)[0]
+
+def test_resume_reruns_steps_after_changed_input(build):
+    build.run(resume=False)
+
+    build.script.write_text("script v2\n")
+    run = build.run()
+    assert run.skipped == ["publish"]
+    assert "installer" in build.recorder.calls
+
+    build.source.write_text("app v2\n")
+    run = build.run()
+    assert run.skipped == []
+    assert build.installer.read_text() == "app v2\nscript v2\n"
+
+def test_resume_reruns_step_with_missing_output(build):
+    build.run(resume=False)
+    build.installer.unlink()
+
+    run = build.run()
+    assert "installer" in build.recorder.calls and build.installer.exists()
+    # 다시 만든 설치 파일 내용이 같으므로 뒤 단계는 계속 건너뜀
+    assert run.skipped == ["publish", "checksum"]
+
+def test_without_resume_every_step_runs(build):
+    build.run(resume=False)
+    run = build.run(resume=False)
+    assert run.skipped == []
+    assert sorted(build.recorder.calls) == ["checksum", "installer", "prerequisites", "publish", "report"]
+
+def restoring_steps(calls):
+    """매니페스트처럼 ctx 값을 채우는 단계와 그 값을 읽는 단계"""
+    def produce(ctx):
+        calls.append("produce")
+        ctx.manifest = "built"
+        return True
+
+    def restore(ctx):
+        calls.append("restore")
+        ctx.manifest = getattr(ctx, "saved", None)
+        return ctx.manifest is not None
+
+    return [
+        PipelineStep("manifest", "매니페스트", produce, inputs=lambda c: [], restore=restore),
+        PipelineStep("report", "보고서", lambda c: c.manifest is not None, ("manifest",))
+    ]
+
+def test_skipped_and_unselected_steps_restore_context(tmp_path):
+    calls = []
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.json")
+    assert run_pipeline(restoring_steps(calls), make_ctx(), checkpoints=checkpoints).success
+    assert calls == ["produce"]
+
+    for selected, resume in ((None, True), ({"report"}, False)):
+        calls.clear()
+        ctx = SimpleNamespace(tracer=None, manifest=None, saved="saved")
+        run = run_pipeline(restoring_steps(calls), ctx, selected, checkpoints=checkpoints, resume=resume)
+        assert run.success
+        assert calls == ["restore"] and ctx.manifest == "saved"
+
+def test_step_reruns_when_restore_fails(tmp_path):
+    calls = []
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.json")
+    run_pipeline(restoring_steps(calls), make_ctx(), checkpoints=checkpoints)
+
+    calls.clear()
+    ctx = SimpleNamespace(tracer=None, manifest=None)
+    run = run_pipeline(restoring_steps(calls), ctx, checkpoints=checkpoints, resume=True)
+    assert run.success and run.skipped == []
+    assert calls == ["restore", "produce"] and ctx.manifest == "built"
+
+def test_steps_can_read_the_run_in_progress():
+    recorder = Recorder()
+    run = PipelineRun()
+    seen = {}
+
+    def report(ctx):
+        seen.update(done=sorted(run.results), selected=list(run.selected))
+        return True
+
+    steps = diamond(recorder) + [PipelineStep("report", "보고서", report, ("d",))]
+    assert run_pipeline(steps, make_ctx(), selected={"b", "c", "d", "report"}, run=run) is run
+    assert seen == {"done": ["b", "c", "d"], "selected": ["b", "c", "d", "report"]}
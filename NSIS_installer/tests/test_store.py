@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""산출물 보관소 (중복 제거, 복원, 보관 정책 / 객체 정리) 테스트"""
+
+import itertools
+
+import pytest
+
+from buildlib import store as store_module
+from buildlib.cache import hash_file
+from buildlib.store import ArtifactStore
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """빌드 사용 시각이 호출 순서대로 증가하도록 고정 (같은 초에 보관해도 정리 순서가 정해지도록)"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(store_module.time, "time", lambda: next(ticks))
+
+def make_files(tmp_path, name, contents):
+    """보관할 파일 생성 - save_build 인자 (보관 경로 → (원본, 해시, 하드링크 허용))"""
+    files = {}
+    for rel_path, text in contents.items():
+        source = tmp_path / "src" / name / rel_path
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text(text, encoding="utf-8")
+        files[rel_path] = (source, None, False)
+    return files
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    first = store.save_build("b1", make_files(tmp_path, "b1", {"setup.exe": "installer", "VERSION.txt": "1.0"}))
+    second = store.save_build("b2", make_files(tmp_path, "b2", {"setup.exe": "installer", "VERSION.txt": "1.1"}))
+
+    assert first["new_objects"] == 2 and first["reused"] == 0
+    assert second["new_objects"] == 1 and second["reused"] == 1
+    assert store.usage()[0] == 3
+
+def test_restore_build(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    files = make_files(tmp_path, "b1", {"setup.exe": "installer", "publish/app.dll": "dll"})
+    store.save_build("b1", files, meta={"version": "1.0"})
+
+    record = store.load_build("latest")
+    assert record["id"] == "b1" and record["version"] == "1.0"
+    restored, missing = store.restore_build(record, tmp_path / "restored")
+    assert (restored, missing) == (2, [])
+    assert (tmp_path / "restored" / "publish" / "app.dll").read_text(encoding="utf-8") == "dll"
+    assert hash_file(tmp_path / "restored" / "setup.exe") == hash_file(files["setup.exe"][0])
+
+def test_keep_builds_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(tmp_path / "store", keep_builds=2)
+    store.save_build("b1", make_files(tmp_path, "b1", {"setup.exe": "v1"}))
+    store.save_build("b2", make_files(tmp_path, "b2", {"setup.exe": "v2"}))
+    store.load_build("b1")
+
+    stats = store.save_build("b3", make_files(tmp_path, "b3", {"setup.exe": "v3"}))
+    assert stats["evicted"] == ["b2"]
+    assert sorted(record["id"] for record in store.list_builds()) == ["b1", "b3"]
+    # b2 만 참조하던 객체도 삭제
+    assert store.usage()[0] == 2
+    assert store.load_build("b2") is None
+
+def test_max_bytes_keeps_shared_objects(tmp_path):
+    store = ArtifactStore(tmp_path / "store", max_bytes=20)
+    store.save_build("b1", make_files(tmp_path, "b1", {"setup.exe": "x" * 10, "old.dll": "o" * 8}))
+    stats = store.save_build("b2", make_files(tmp_path, "b2", {"setup.exe": "x" * 10, "new.dll": "n" * 8}))
+
+    assert stats["evicted"] == ["b1"]
+    assert store.usage() == (2, 18)
+    restored, missing = store.restore_build(store.load_build("b2"), tmp_path / "restored")
+    assert (restored, missing) == (2, [])
+
+def test_newest_build_is_kept_over_capacity(tmp_path):
+    store = ArtifactStore(tmp_path / "store", max_bytes=4)
+    stats = store.save_build("b1", make_files(tmp_path, "b1", {"setup.exe": "too large"}))
+    assert stats["evicted"] == []
+    assert [record["id"] for record in store.list_builds()] == ["b1"]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""빌드 추적 (Chrome trace-event) 테스트"""
+
+import os
+import sys
+import json
+
+import pytest
+
+from buildlib.process import run_streaming
+from buildlib.trace import BuildTracer
+
+@pytest.mark.skipif(os.name == "nt", reason="Unix 자식 프로세스 사용량 (RUSAGE_CHILDREN)")
+def test_unix_child_peak_rss_is_recorded_once_per_build(tmp_path):
+    tracer = BuildTracer("test")
+    with tracer.span("단계", variant="framework-dependent"):
+        for name in ("first", "second"):
+            result = run_streaming([sys.executable, "-c", "pass"], tmp_path, f"{name}.log", log_dir=tmp_path,
+                                   tracer=tracer)
+            assert result.returncode == 0 and result.peak_rss is None
+
+    events = json.loads(tracer.write(tmp_path / "build_trace.json").read_text(encoding="utf-8"))["traceEvents"]
+    # 단계 / 도구 실행 이벤트에는 다른 프로세스의 최대값이 섞이지 않도록 자식 최대 RSS 를 기록하지 않음
+    assert not [event for event in events if "child_peak_rss_mb" in event.get("args", {})]
+    assert [event["args"]["child_cpu_ms"] >= 0 for event in events if event["ph"] == "X"] == [True, True]
+
+    totals = [event for event in events if "children_max_rss_mb" in event.get("args", {})]
+    assert len(totals) == 1 and totals[0]["args"]["children_max_rss_mb"] > 0